@@ -1,16 +1,21 @@
 import os
 import sys
+from pathlib import Path
 
 import streamlit as st
 from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 from db import init_db
 from db.cv_versions import fetch_default_version
+from templates.static_site import export_static_site
 from templates.themes import DISPLAY_TEMPLATE_OPTIONS, validate_template_mappings
-from views.public_view import render_portfolio_landing, render_cv_streamlit, download_section
+from views.public_view import render_portfolio_landing, render_cv_streamlit, render_template_gallery, download_section
 from views.editor import render_editor_login, render_editor_page
 from views.cover_letter_page import render_cover_letter_formatter
 
+# Fixed, so the web UI never writes to a visitor-chosen path; export_site.py takes --out.
+STATIC_EXPORT_DIR = Path(__file__).resolve().parent / "dist"
+
 
 def _run_with_streamlit_if_needed() -> None:
     if get_script_run_ctx(suppress_warning=True) is not None:
@@ -128,14 +133,32 @@ downloads_tab, cover_letter_tab, editor_tab = st.tabs(["CV Downloads", "Cover Le
 with downloads_tab:
     st.subheader("Download Default CV")
     template_choice_label = st.selectbox(
-        "Template for CV Download", list(DISPLAY_TEMPLATE_OPTIONS.keys()), index=0
+        "Template for CV Download", list(DISPLAY_TEMPLATE_OPTIONS.keys()), key="download_template"
     )
     template_choice = DISPLAY_TEMPLATE_OPTIONS[template_choice_label]
+    if st.checkbox("Template gallery", key="download_template_gallery"):
+        render_template_gallery(default_version["cv"], "download_template")
     download_section(default_version["cv"], "default_cv", template_choice)
 
     with st.expander("Preview selected template"):
         render_cv_streamlit(default_version["cv"], template_choice)
 
+    with st.expander("Export static site"):
+        st.caption(
+            "Writes the public landing page and every template's HTML, PDF, and Word files "
+            f"as plain files to `{STATIC_EXPORT_DIR.name}/` in the project folder."
+        )
+        if not st.session_state.get("editor_authenticated", False):
+            st.info("Log in on the Editor tab to export the static site.")
+        elif st.button("Export Static Site", use_container_width=True):
+            try:
+                manifest = export_static_site(default_version["cv"], str(STATIC_EXPORT_DIR))
+            except OSError as exc:
+                st.error(f"Could not write the static site: {exc}")
+            else:
+                file_count = sum(len(entry["files"]) for entry in manifest["templates"])
+                st.success(f"Exported index.html and {file_count} CV files to {STATIC_EXPORT_DIR.name}/.")
+
 with cover_letter_tab:
     render_cover_letter_formatter()
 
@@ -0,0 +1,149 @@
+"""Serve rendered CV artifacts over plain HTTP, without a Streamlit session.
+
+Run alongside the Streamlit app::
+
+    python -m artifact_server --port 8502
+
+Routes:
+
+    /cv/<profile>.<ext>               first template, e.g. /cv/default.pdf
+    /cv/<profile>/<template>.<ext>    e.g. /cv/default/two_column__emerald.docx
+
+``<profile>`` is ``default`` or a profile id; ``?version=<id>`` pins a CV
+version of that profile. Only the default profile and profiles published
+with ``--publish`` (or ``CV_ARTIFACT_PROFILES``) are served. Responses carry
+a strong ETag (the artifact's SHA-256), honour ``If-None-Match`` and are
+streamed from the on-disk artifact store.
+"""
+import argparse
+import os
+import re
+import shutil
+import sys
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from db import init_db
+from db.cv_versions import fetch_latest_version, fetch_version
+from db.profiles import fetch_profiles
+from templates.artifacts import CV_FORMATS, available_formats, get_cv_artifact
+from templates.themes import AVAILABLE_TEMPLATES, template_slug
+
+CACHE_CONTROL = "public, max-age=60, must-revalidate"
+CHUNK_SIZE = 64 * 1024
+TEMPLATES_BY_SLUG = {template_slug(template): template for template in AVAILABLE_TEMPLATES}
+ROUTE_PATTERN = re.compile(r"^/cv/(?P<profile>[A-Za-z0-9_-]+)(?:/(?P<template>[a-z0-9_]+))?\.(?P<ext>[a-z]+)$")
+
+
+def _resolve_profile_id(profile: str, published: frozenset[int]) -> int | None:
+    default_id = next((item["id"] for item in fetch_profiles() if item["is_default"]), None)
+    if profile == "default":
+        return default_id
+    if profile.isdigit() and (int(profile) == default_id or int(profile) in published):
+        return int(profile)
+    return None
+
+
+def _resolve_version(profile: str, version_id: str | None, published: frozenset[int] = frozenset()) -> dict | None:
+    profile_id = _resolve_profile_id(profile, published)
+    if profile_id is None:
+        return None
+    if version_id:
+        if not version_id.isdigit():
+            return None
+        version = fetch_version(int(version_id))
+        return version if version["profile_id"] == profile_id else None
+    return fetch_latest_version(profile_id)
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = [item.strip() for item in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+class ArtifactRequestHandler(BaseHTTPRequestHandler):
+    server_version = "CVArtifactServer/1.0"
+
+    def do_GET(self) -> None:
+        self._serve(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._serve(send_body=False)
+
+    def _serve(self, send_body: bool) -> None:
+        url = urlsplit(self.path)
+        match = ROUTE_PATTERN.match(url.path)
+        if not match:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        fmt = match.group("ext")
+        template = TEMPLATES_BY_SLUG.get(match.group("template") or template_slug(AVAILABLE_TEMPLATES[0]))
+        if template is None or fmt not in CV_FORMATS:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        if fmt not in available_formats():
+            self.send_error(HTTPStatus.SERVICE_UNAVAILABLE, f"{fmt.upper()} renderer is not installed")
+            return
+
+        version_id = parse_qs(url.query).get("version", [None])[0]
+        version = _resolve_version(match.group("profile"), version_id, self.server.published_profiles)
+        if not version:
+            self.send_error(HTTPStatus.NOT_FOUND, "CV version not found")
+            return
+
+        artifact = get_cv_artifact(version["cv"], template, fmt)
+        etag = f'"{artifact["digest"]}"'
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", CACHE_CONTROL)
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", artifact["mime"])
+        self.send_header("Content-Length", str(artifact["size"]))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", CACHE_CONTROL)
+        if fmt != "html":
+            filename = f"{match.group('profile')}_{template_slug(template)}.{artifact['extension']}"
+            self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+        self.end_headers()
+        if send_body:
+            with open(artifact["path"], "rb") as handle:
+                shutil.copyfileobj(handle, self.wfile, CHUNK_SIZE)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m artifact_server", description="Serve rendered CV artifacts over HTTP.")
+    parser.add_argument("--host", default=os.getenv("CV_ARTIFACT_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("CV_ARTIFACT_PORT", "8502")))
+    parser.add_argument(
+        "--publish",
+        action="append",
+        type=int,
+        default=[int(item) for item in os.getenv("CV_ARTIFACT_PROFILES", "").split(",") if item.strip()],
+        metavar="PROFILE_ID",
+        help="Also serve this profile besides the default one (repeatable).",
+    )
+    args = parser.parse_args(argv)
+
+    init_db()
+    server = ThreadingHTTPServer((args.host, args.port), ArtifactRequestHandler)
+    server.published_profiles = frozenset(args.publish)
+    print(f"Serving CV artifacts on http://{args.host}:{args.port}/cv/default.pdf")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""HTML payload size per template, default versus compact (minified) output.
+
+Covers every CV template, the portfolio landing page and the cover letter,
+and checks that minifying keeps the visible text unchanged. Also compares
+peak memory of building a very long CV as one string against streaming it
+with ``write_html``.
+
+    python -m benchmarks.bench_html_size
+"""
+import os
+import re
+import time
+import tracemalloc
+
+from templates.cover_letter_builder import build_cover_letter_html, default_cover_letter_data
+from templates.html_builder import build_html, write_html
+from templates.landing_builder import build_portfolio_landing_html
+from templates.themes import AVAILABLE_TEMPLATES
+from utils.defaults import default_cv_data
+from utils.html_helpers import clear_fragment_cache
+
+
+def _visible_text(markup: str) -> str:
+    markup = re.sub(r"<style\b.*?</style>", "", markup, flags=re.S)
+    return " ".join(re.sub(r"<[^>]+>", " ", markup).split())
+
+
+def _best_ms(build, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def _peak_kib(run) -> float:
+    clear_fragment_cache()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    cv = default_cv_data()
+    letter = default_cover_letter_data(cv)
+    letter["body"] = "First paragraph of the letter.\n\nSecond paragraph of the letter."
+    pages = [(template, lambda compact, template=template: build_html(cv, template, compact=compact)) for template in AVAILABLE_TEMPLATES]
+    # The hero image is left out so the page's own markup is measured.
+    pages.append(("Portfolio landing", lambda compact: build_portfolio_landing_html(cv, hero_src="", compact=compact)))
+    pages.append(("Cover letter", lambda compact: build_cover_letter_html(letter, compact=compact)))
+
+    print(f"{'page':<30} {'bytes':>8} {'compact':>8} {'saved':>6} {'ms':>6} {'compact ms':>11}")
+    total = total_compact = 0
+    for label, build in pages:
+        standard = build(False).encode("utf-8")
+        compact = build(True).encode("utf-8")
+        if _visible_text(standard.decode()) != _visible_text(compact.decode()):
+            raise SystemExit(f"Compact output changed the visible text of {label}")
+        total += len(standard)
+        total_compact += len(compact)
+        print(
+            f"{label:<30} {len(standard):>8} {len(compact):>8} {1 - len(compact) / len(standard):>6.0%} "
+            f"{_best_ms(lambda: build(False)):>6.2f} {_best_ms(lambda: build(True)):>11.2f}"
+        )
+    print(f"{'total':<30} {total:>8} {total_compact:>8} {1 - total_compact / total:>6.0%}")
+
+    lite = build_portfolio_landing_html(cv, hero_src="", compact=True, lite=True)
+    # Everything before the deferred section stylesheet is needed for the first paint.
+    print(f"\nlite landing: hero renders after {lite.index('<style>', 1)} of {len(lite)} bytes")
+
+    long_cv = default_cv_data()
+    long_cv["experience"] = long_cv["experience"] * 200
+    long_cv["projects"] = long_cv["projects"] * 200
+    template = AVAILABLE_TEMPLATES[0]
+    with open(os.devnull, "wb") as sink:
+        built = _peak_kib(lambda: sink.write(build_html(long_cv, template).encode("utf-8")))
+        streamed = _peak_kib(lambda: write_html(long_cv, template, sink))
+    print(f"\npeak memory, 200x CV: build_html {built:.0f} KiB, write_html {streamed:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""End-to-end PDF render benchmark across every template.
+
+Renders the default CV and a long CV (experience and projects repeated) with
+each template and reports the best render time and page count, next to the
+cost of the layout-only measure pass and of fitting the long CV onto one
+page fewer.
+
+    python -m benchmarks.bench_pdf
+"""
+import re
+import time
+import tracemalloc
+
+from templates.pdf_builder import (
+    OP_LINE, PdfOp, build_pdf, clear_display_list_cache, display_list_cache_info, fit_text_scale,
+    measure_pdf_layout,
+)
+from templates.themes import AVAILABLE_TEMPLATES
+from utils.defaults import default_cv_data
+from utils.pdf_helpers import REPORTLAB_AVAILABLE, clear_wrap_cache
+
+
+def long_cv(repeat: int = 6) -> dict:
+    cv = default_cv_data()
+    cv["experience"] = cv["experience"] * repeat
+    cv["projects"] = cv["projects"] * repeat
+    return cv
+
+
+def page_count(pdf_bytes: bytes) -> int:
+    return len(re.findall(rb"/Type /Page(?![s\w])", pdf_bytes))
+
+
+def _time_render(cv: dict, template: str, repeat: int = 3, fit_pages: int | None = None) -> tuple[float, bytes]:
+    best = float("inf")
+    output = b""
+    for _ in range(repeat):
+        clear_wrap_cache()
+        clear_display_list_cache()
+        started = time.perf_counter()
+        output = build_pdf(cv, template, deterministic=True, fit_pages=fit_pages)
+        best = min(best, time.perf_counter() - started)
+    return best, output
+
+
+def _time_measure(cv: dict, template: str, repeat: int = 3) -> tuple[float, dict]:
+    best = float("inf")
+    layout = {}
+    for _ in range(repeat):
+        clear_wrap_cache()
+        started = time.perf_counter()
+        layout = measure_pdf_layout(cv, template)
+        best = min(best, time.perf_counter() - started)
+    return best, layout
+
+
+def _op_memory(count: int = 10000) -> tuple[int, int]:
+    """Bytes held by ``count`` line ops as legacy dicts versus PdfOp objects."""
+    def measure(factory) -> int:
+        tracemalloc.start()
+        ops = [factory(index) for index in range(count)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del ops
+        return size
+
+    legacy = measure(lambda index: {
+        "kind": "line", "text": "line", "font_name": "Helvetica",
+        "font_size": 9, "leading": 12, "height": 12,
+    })
+    slotted = measure(lambda index: PdfOp(OP_LINE, 12, "line", "Helvetica", 9))
+    return legacy, slotted
+
+
+def main() -> None:
+    if not REPORTLAB_AVAILABLE:
+        print("reportlab is not installed; nothing to benchmark.")
+        return
+    print(f"{'cv':<8} {'template':<30} {'pages':>5} {'render ms':>10} {'measure ms':>11}")
+    for label, cv in (("default", default_cv_data()), ("long", long_cv())):
+        for template in AVAILABLE_TEMPLATES:
+            seconds, output = _time_render(cv, template)
+            measure_seconds, layout = _time_measure(cv, template)
+            if layout["page_count"] != page_count(output):
+                raise SystemExit(f"Measured page count differs from the render for {template}")
+            print(
+                f"{label:<8} {template:<30} {page_count(output):>5} "
+                f"{seconds * 1000:>10.1f} {measure_seconds * 1000:>11.1f}"
+            )
+
+    clear_display_list_cache()
+    clear_wrap_cache()
+    print()
+    for label in ("cold", "repaint"):
+        started = time.perf_counter()
+        for template in AVAILABLE_TEMPLATES:
+            build_pdf(long_cv(), template, deterministic=True)
+        print(f"all templates, long cv, {label}: {(time.perf_counter() - started) * 1000:.1f} ms")
+    info = display_list_cache_info()
+    print(f"display lists: {info['size']} cached, hit rate {info['hit_rate']:.0%}")
+
+    print(f"\n{'fit long cv':<38} {'pages':>9} {'scale':>6} {'x render':>9}")
+    cv = long_cv()
+    for template in AVAILABLE_TEMPLATES:
+        seconds, output = _time_render(cv, template)
+        target = max(1, page_count(output) - 1)
+        fit_seconds, fitted = _time_render(cv, template, fit_pages=target)
+        print(
+            f"{template:<38} {page_count(output):>4} -> {page_count(fitted):<2} "
+            f"{fit_text_scale(cv, template, target):>6.2f} {fit_seconds / seconds:>9.1f}"
+        )
+
+    legacy, slotted = _op_memory()
+    print(f"\n10000 line ops: dict {legacy / 1024:.0f} KiB, PdfOp {slotted / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
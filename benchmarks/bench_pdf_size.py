@@ -0,0 +1,38 @@
+"""PDF output size per template, default versus compact profile.
+
+Reports total bytes and bytes per page for the default CV and a long CV
+with every template, so size regressions show up next to page count.
+
+    python -m benchmarks.bench_pdf_size
+"""
+from benchmarks.bench_pdf import long_cv, page_count
+from templates.pdf_builder import build_pdf
+from templates.themes import AVAILABLE_TEMPLATES
+from utils.defaults import default_cv_data
+from utils.pdf_helpers import REPORTLAB_AVAILABLE
+
+
+def main() -> None:
+    if not REPORTLAB_AVAILABLE:
+        print("reportlab is not installed; nothing to benchmark.")
+        return
+    print(
+        f"{'cv':<8} {'template':<30} {'pages':>5} {'bytes':>8} {'compact':>8} "
+        f"{'B/page':>7} {'compact B/page':>15} {'saved':>6}"
+    )
+    for label, cv in (("default", default_cv_data()), ("long", long_cv())):
+        for template in AVAILABLE_TEMPLATES:
+            standard = build_pdf(cv, template, deterministic=True)
+            compact = build_pdf(cv, template, deterministic=True, compact=True)
+            pages = page_count(standard)
+            if page_count(compact) != pages:
+                raise SystemExit(f"Compact output changed the page count for {template}")
+            print(
+                f"{label:<8} {template:<30} {pages:>5} {len(standard):>8} {len(compact):>8} "
+                f"{len(standard) // pages:>7} {len(compact) // pages:>15} "
+                f"{1 - len(compact) / len(standard):>6.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
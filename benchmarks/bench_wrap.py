@@ -0,0 +1,111 @@
+"""Long-paragraph benchmark for utils.pdf_helpers.wrap_pdf_text.
+
+Compares the incremental wrapper (with its memo cache cleared, so every call
+does the full wrap) against the original approach of measuring
+every candidate line from scratch, and checks both produce the same lines.
+Also times batched word measurement against per-word stringWidth calls.
+
+    python -m benchmarks.bench_wrap
+"""
+import time
+
+from utils.pdf_helpers import (
+    NUMPY_AVAILABLE, REPORTLAB_AVAILABLE,
+    clear_wrap_cache, measure_text_widths, pdf_safe_text, pdfmetrics, wrap_pdf_text,
+)
+
+FONTS = ["Helvetica", "Helvetica-Bold", "Helvetica-Oblique"]
+WIDTHS = [120.0, 335.9, 539.27]
+
+
+def reference_wrap(text: str, font_name: str, font_size: int, max_width: float) -> list[str]:
+    """The quadratic wrapper wrap_pdf_text replaced, kept as the baseline."""
+    words = pdf_safe_text(text).split()
+    if not words:
+        return []
+
+    def split_long_word(word: str) -> list[str]:
+        if pdfmetrics.stringWidth(word, font_name, font_size) <= max_width:
+            return [word]
+        chunks: list[str] = []
+        current = ""
+        for char in word:
+            candidate = f"{current}{char}"
+            if current and pdfmetrics.stringWidth(candidate, font_name, font_size) > max_width:
+                chunks.append(current)
+                current = char
+            else:
+                current = candidate
+        if current:
+            chunks.append(current)
+        return chunks or [word]
+
+    expanded: list[str] = []
+    for word in words:
+        expanded.extend(split_long_word(word))
+    lines: list[str] = []
+    current = expanded[0]
+    for word in expanded[1:]:
+        candidate = f"{current} {word}"
+        if pdfmetrics.stringWidth(candidate, font_name, font_size) <= max_width:
+            current = candidate
+        else:
+            lines.append(current)
+            current = word
+    lines.append(current)
+    return lines
+
+
+def sample_paragraph(words: int) -> str:
+    base = (
+        "Managed identity lifecycle, SSO and MFA rollouts across Entra ID and OKTA while documenting "
+        "runbooks at https://github.com/BonifaceNgila/Image-Caption-Generator-with-LLaVA-and-FastAPI-Streamlit "
+        "and supporting Kubernetes workloads with cert-manager, HPA, RBAC and multi-stage builds."
+    ).split()
+    return " ".join(base[index % len(base)] for index in range(words))
+
+
+def _time(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        clear_wrap_cache()
+        started = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    if not REPORTLAB_AVAILABLE:
+        print("reportlab is not installed; nothing to benchmark.")
+        return
+    print(f"{'words':>6} {'font':<18} {'width':>7} {'reference ms':>13} {'wrap ms':>9} {'speedup':>8}")
+    for words in (200, 1000, 4000):
+        text = sample_paragraph(words)
+        for font_name in FONTS:
+            for width in WIDTHS:
+                expected = reference_wrap(text, font_name, 9, width)
+                actual = wrap_pdf_text(text, font_name, 9, width)
+                if expected != actual:
+                    raise SystemExit(f"Line breaks differ for {words} words, {font_name}, width {width}")
+                reference_s = _time(reference_wrap, text, font_name, 9, width)
+                wrap_s = _time(wrap_pdf_text, text, font_name, 9, width)
+                print(
+                    f"{words:>6} {font_name:<18} {width:>7.1f} {reference_s * 1000:>13.2f} "
+                    f"{wrap_s * 1000:>9.2f} {reference_s / wrap_s:>7.1f}x"
+                )
+
+    print(f"\nBatched word measurement (NumPy {'on' if NUMPY_AVAILABLE else 'off'})")
+    print(f"{'words':>6} {'stringWidth ms':>15} {'batched ms':>11} {'speedup':>8}")
+    for words in (200, 1000, 4000):
+        word_list = pdf_safe_text(sample_paragraph(words)).split()
+        expected = [pdfmetrics.stringWidth(word, "Helvetica", 9) for word in word_list]
+        if measure_text_widths(word_list, "Helvetica", 9) != expected:
+            raise SystemExit(f"Batched widths differ for {words} words")
+        per_word_s = _time(lambda: [pdfmetrics.stringWidth(word, "Helvetica", 9) for word in word_list])
+        batched_s = _time(measure_text_widths, word_list, "Helvetica", 9)
+        print(f"{words:>6} {per_word_s * 1000:>15.2f} {batched_s * 1000:>11.2f} {per_word_s / batched_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from contextlib import contextmanager
 from datetime import datetime, timezone
 
 from utils.defaults import default_cv_data
+from utils.text_normalize import normalize_document
 
 
 def resolve_db_path() -> str:
@@ -27,6 +28,10 @@ def resolve_db_path() -> str:
 
 DB_PATH = resolve_db_path()
 
+# PRAGMA user_version once stored documents have been text-normalised; rows
+# written since are normalised on save (db.cv_versions, db.cover_letters).
+TEXT_NORMALIZED_USER_VERSION = 1
+
 
 def get_conn() -> sqlite3.Connection:
     parent_dir = os.path.dirname(DB_PATH)
@@ -136,6 +141,20 @@ def _sync_default_profile_from_local_seed(cur: sqlite3.Cursor, now: str) -> None
         )
 
 
+def _normalize_stored_documents(cur: sqlite3.Cursor) -> None:
+    for table, column in (("cv_versions", "cv_json"), ("cover_letter_versions", "letter_json")):
+        # table/column are hardcoded internal literals — not user input
+        cur.execute(f"SELECT id, {column} FROM {table}")
+        for row_id, raw in cur.fetchall():
+            try:
+                document = json.loads(raw)
+            except (TypeError, json.JSONDecodeError):
+                continue
+            normalized = normalize_document(document)
+            if normalized != document:
+                cur.execute(f"UPDATE {table} SET {column} = ? WHERE id = ?", (json.dumps(normalized), row_id))
+
+
 def init_db() -> None:
     with get_db() as conn:
         cur = conn.cursor()
@@ -210,5 +229,10 @@ def init_db() -> None:
                 (profile_id, "Default v1", json.dumps(default_cv_data()), now, now),
             )
 
+        cur.execute("PRAGMA user_version")
+        if cur.fetchone()[0] < TEXT_NORMALIZED_USER_VERSION:
+            _normalize_stored_documents(cur)
+            cur.execute(f"PRAGMA user_version = {TEXT_NORMALIZED_USER_VERSION}")
+
         _sync_default_profile_from_local_seed(cur, now)
         conn.commit()
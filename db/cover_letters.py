@@ -2,6 +2,7 @@ import json
 from datetime import datetime, timezone
 
 from db.connection import get_db
+from utils.text_normalize import normalize_document
 
 
 def fetch_cover_letter_versions(profile_id: int) -> list[dict]:
@@ -47,7 +48,7 @@ def save_cover_letter_version(version_id: int, version_name: str, letter_data: d
             SET version_name = ?, letter_json = ?, updated_at = ?
             WHERE id = ?
             """,
-            (version_name.strip(), json.dumps(letter_data), now, version_id),
+            (version_name.strip(), json.dumps(normalize_document(letter_data)), now, version_id),
         )
         conn.commit()
 
@@ -61,7 +62,7 @@ def create_cover_letter_version(profile_id: int, version_name: str, letter_data:
             INSERT INTO cover_letter_versions(profile_id, version_name, letter_json, created_at, updated_at)
             VALUES (?, ?, ?, ?, ?)
             """,
-            (profile_id, version_name.strip(), json.dumps(letter_data), now, now),
+            (profile_id, version_name.strip(), json.dumps(normalize_document(letter_data)), now, now),
         )
         conn.commit()
 
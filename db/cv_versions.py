@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 
 from db.connection import get_db
 from utils.defaults import default_cv_data
+from utils.text_normalize import normalize_document
 
 
 def fetch_versions(profile_id: int) -> list[dict]:
@@ -24,14 +25,15 @@ def fetch_versions(profile_id: int) -> list[dict]:
 def fetch_version(version_id: int) -> dict:
     with get_db() as conn:
         cur = conn.cursor()
-        cur.execute("SELECT id, version_name, cv_json FROM cv_versions WHERE id = ?", (version_id,))
+        cur.execute("SELECT id, version_name, cv_json, profile_id FROM cv_versions WHERE id = ?", (version_id,))
         row = cur.fetchone()
     if not row:
-        return {"id": None, "version_name": "", "cv": default_cv_data()}
+        return {"id": None, "version_name": "", "cv": default_cv_data(), "profile_id": None}
     return {
         "id": row[0],
         "version_name": row[1],
         "cv": json.loads(row[2]),
+        "profile_id": row[3],
     }
 
 
@@ -58,6 +60,29 @@ def fetch_default_version() -> dict | None:
     }
 
 
+def fetch_latest_version(profile_id: int) -> dict | None:
+    with get_db() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            """
+            SELECT id, version_name, cv_json
+            FROM cv_versions
+            WHERE profile_id = ?
+            ORDER BY datetime(updated_at) DESC, id DESC
+            LIMIT 1
+            """,
+            (profile_id,),
+        )
+        row = cur.fetchone()
+    if not row:
+        return None
+    return {
+        "id": row[0],
+        "version_name": row[1],
+        "cv": json.loads(row[2]),
+    }
+
+
 def save_version(version_id: int, version_name: str, cv_data: dict) -> None:
     now = datetime.now(timezone.utc).isoformat()
     with get_db() as conn:
@@ -68,7 +93,7 @@ def save_version(version_id: int, version_name: str, cv_data: dict) -> None:
             SET version_name = ?, cv_json = ?, updated_at = ?
             WHERE id = ?
             """,
-            (version_name.strip(), json.dumps(cv_data), now, version_id),
+            (version_name.strip(), json.dumps(normalize_document(cv_data)), now, version_id),
         )
         conn.commit()
 
@@ -82,7 +107,7 @@ def create_new_version(profile_id: int, version_name: str, cv_data: dict) -> Non
             INSERT INTO cv_versions(profile_id, version_name, cv_json, created_at, updated_at)
             VALUES (?, ?, ?, ?, ?)
             """,
-            (profile_id, version_name.strip(), json.dumps(cv_data), now, now),
+            (profile_id, version_name.strip(), json.dumps(normalize_document(cv_data)), now, now),
         )
         conn.commit()
 
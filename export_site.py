@@ -0,0 +1,50 @@
+import argparse
+import sys
+
+from db import init_db
+from db.cv_versions import fetch_default_version, fetch_version
+from templates.static_site import export_static_site
+from templates.themes import AVAILABLE_TEMPLATES, normalize_template_name
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Export the public portfolio and CV downloads as a static site.",
+    )
+    parser.add_argument("--out", default="dist", help="Output directory (default: dist)")
+    parser.add_argument("--version-id", type=int, help="CV version to export instead of the default profile")
+    parser.add_argument(
+        "--template",
+        action="append",
+        dest="templates",
+        help="Template to include; repeat for several (default: all templates)",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Minify the HTML pages and use the compact PDF profile",
+    )
+    args = parser.parse_args(argv)
+
+    init_db()
+    version = fetch_version(args.version_id) if args.version_id else fetch_default_version()
+    if not version or version.get("id") is None:
+        print("No CV version found to export.", file=sys.stderr)
+        return 1
+
+    templates = None
+    if args.templates:
+        templates = [normalize_template_name(item) for item in args.templates]
+        unknown = [item for item in templates if item not in AVAILABLE_TEMPLATES]
+        if unknown:
+            print(f"Unknown templates: {', '.join(unknown)}", file=sys.stderr)
+            return 2
+
+    manifest = export_static_site(version["cv"], args.out, templates, compact=args.compact)
+    file_count = sum(len(entry["files"]) for entry in manifest["templates"])
+    print(f"Exported {version['version_name']} to {args.out}: index.html and {file_count} CV files.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
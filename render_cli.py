@@ -0,0 +1,191 @@
+"""Render CVs and cover letters to files without starting Streamlit.
+
+Examples::
+
+    python -m render_cli --profile default --template all --format pdf --out build
+    python -m render_cli "exports/*.json" --format html --format pdf --jobs 4
+    python -m render_cli --kind cover-letter --cover-letter-version 3 --format docx
+"""
+import argparse
+import glob
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from db import init_db
+from db.cover_letters import fetch_cover_letter_version
+from db.cv_versions import fetch_latest_version, fetch_version
+from db.profiles import fetch_profiles
+from templates.artifacts import (
+    ARTIFACT_FORMATS, COVER_LETTER_FORMATS, CV_FORMATS,
+    available_formats, render_cover_letter_artifact, write_cv_artifact,
+)
+from templates.themes import AVAILABLE_TEMPLATES, normalize_template_name, template_slug
+from utils.text_normalize import normalize_document
+
+
+class RenderCliError(Exception):
+    pass
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", str(value).strip()).strip("_") or "document"
+
+
+def _resolve_profile(value: str) -> dict:
+    profiles = fetch_profiles()
+    for profile in profiles:
+        if value == "default" and profile["is_default"]:
+            return profile
+        if value == str(profile["id"]) or value == profile["name"]:
+            return profile
+    raise RenderCliError(f"Unknown profile: {value}")
+
+
+def _load_json_inputs(patterns: list[str]) -> list[tuple[str, dict]]:
+    sources = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or ([pattern] if Path(pattern).is_file() else [])
+        if not matches:
+            raise RenderCliError(f"No files match: {pattern}")
+        for match in matches:
+            try:
+                data = json.loads(Path(match).read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError, UnicodeDecodeError) as exc:
+                raise RenderCliError(f"Could not read {match}: {exc}") from exc
+            if not isinstance(data, dict):
+                raise RenderCliError(f"Invalid JSON in {match}: expected a JSON object.")
+            sources.append((Path(match).stem, normalize_document(data)))
+    return sources
+
+
+def _collect_sources(args) -> list[tuple[str, dict]]:
+    sources = _load_json_inputs(args.inputs)
+    profiles = args.profiles or []
+    if not (sources or profiles or args.versions or args.cover_letter_versions) and args.kind == "cv":
+        profiles = ["default"]
+
+    if profiles or args.versions or args.cover_letter_versions:
+        init_db()
+    for value in profiles:
+        profile = _resolve_profile(value)
+        version = fetch_latest_version(profile["id"])
+        if not version:
+            raise RenderCliError(f"Profile {profile['name']} has no CV versions.")
+        sources.append((profile["name"], version["cv"]))
+    for version_id in args.versions or []:
+        version = fetch_version(version_id)
+        if version["id"] is None:
+            raise RenderCliError(f"Unknown CV version: {version_id}")
+        sources.append((version["version_name"], version["cv"]))
+    for version_id in args.cover_letter_versions or []:
+        version = fetch_cover_letter_version(version_id)
+        if not version:
+            raise RenderCliError(f"Unknown cover letter version: {version_id}")
+        sources.append((version["version_name"], version["letter"]))
+    return sources
+
+
+def _render_job(job: tuple) -> tuple[str, int]:
+    kind, data, template, fmt, target = job
+    if kind == "cover-letter":
+        payload = render_cover_letter_artifact(data, fmt)
+        Path(target).write_bytes(payload)
+        return target, len(payload)
+    with open(target, "wb") as handle:
+        written = write_cv_artifact(data, template, fmt, handle)
+    return target, written["size"]
+
+
+def build_jobs(sources: list[tuple[str, dict]], kind: str, templates: list[str], formats: list[str], out_dir: Path) -> list[tuple]:
+    jobs = []
+    used_stems = set()
+    for name, data in sources:
+        # Inputs from different folders can share a name; number the repeats
+        # so no two jobs write (or race on) the same file.
+        base = stem = _safe_name(name)
+        suffix = 2
+        while stem in used_stems:
+            stem = f"{base}-{suffix}"
+            suffix += 1
+        used_stems.add(stem)
+        for fmt in formats:
+            extension = ARTIFACT_FORMATS[fmt]["extension"]
+            if kind == "cover-letter":
+                jobs.append((kind, data, "", fmt, str(out_dir / f"{stem}.{extension}")))
+                continue
+            for template in templates:
+                filename = f"{stem}_{template_slug(template)}.{extension}"
+                jobs.append((kind, data, template, fmt, str(out_dir / filename)))
+    return jobs
+
+
+def run_jobs(jobs: list[tuple], max_workers: int) -> list[tuple[str, int]]:
+    if max_workers <= 1 or len(jobs) <= 1:
+        return [_render_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_render_job, jobs))
+
+
+def _resolve_templates(values: list[str] | None) -> list[str]:
+    if not values or "all" in values:
+        return list(AVAILABLE_TEMPLATES) if values else [AVAILABLE_TEMPLATES[0]]
+    templates = [normalize_template_name(value) for value in values]
+    unknown = [template for template in templates if template not in AVAILABLE_TEMPLATES]
+    if unknown:
+        raise RenderCliError(f"Unknown templates: {', '.join(unknown)}")
+    return templates
+
+
+def _resolve_formats(kind: str, values: list[str] | None) -> list[str]:
+    supported = COVER_LETTER_FORMATS if kind == "cover-letter" else CV_FORMATS
+    formats = values or supported
+    unsupported = [fmt for fmt in formats if fmt not in supported]
+    if unsupported:
+        raise RenderCliError(f"Unsupported {kind} formats: {', '.join(unsupported)}")
+    installed = set(available_formats()) | {"txt"}
+    missing = [fmt for fmt in formats if fmt not in installed]
+    if missing:
+        raise RenderCliError(f"Renderer not installed for: {', '.join(missing)} (see requirements.txt)")
+    return formats
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m render_cli", description="Render CVs and cover letters to files.")
+    parser.add_argument("inputs", nargs="*", help="JSON files or glob patterns to render")
+    parser.add_argument("--kind", choices=["cv", "cover-letter"], default="cv")
+    parser.add_argument("--profile", action="append", dest="profiles", help="Profile id, name, or 'default' (latest version)")
+    parser.add_argument("--version", action="append", dest="versions", type=int, help="CV version id")
+    parser.add_argument("--cover-letter-version", action="append", dest="cover_letter_versions", type=int, help="Cover letter version id")
+    parser.add_argument("--template", action="append", dest="templates", help="Template name, or 'all' (default: first template)")
+    parser.add_argument("--format", action="append", dest="formats", choices=sorted(ARTIFACT_FORMATS), help="Output format; repeatable")
+    parser.add_argument("--out", default="build", help="Output directory (default: build)")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of parallel render processes")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.kind == "cover-letter" and (args.profiles or args.versions):
+            raise RenderCliError("Cover letters are rendered from JSON files or --cover-letter-version.")
+        if args.kind == "cv" and args.cover_letter_versions:
+            raise RenderCliError("--cover-letter-version requires --kind cover-letter.")
+        templates = _resolve_templates(args.templates)
+        formats = _resolve_formats(args.kind, args.formats)
+        sources = _collect_sources(args)
+        if not sources:
+            raise RenderCliError("Nothing to render.")
+        out_dir = Path(args.out)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        results = run_jobs(build_jobs(sources, args.kind, templates, formats, out_dir), max(1, args.jobs))
+    except RenderCliError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    for path, size in results:
+        print(f"{path} ({size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+from io import BytesIO
+
+from templates.cover_letter_builder import (
+    build_cover_letter_docx, build_cover_letter_html, build_cover_letter_text,
+)
+from templates.docx_builder import DOCX_AVAILABLE, write_docx
+from templates.html_builder import write_html
+from templates.pdf_builder import write_pdf
+from utils.artifact_store import content_hash, get_or_render, render_key
+from utils.pdf_helpers import REPORTLAB_AVAILABLE
+
+
+ARTIFACT_FORMATS = {
+    "html": {"extension": "html", "mime": "text/html; charset=utf-8"},
+    "pdf": {"extension": "pdf", "mime": "application/pdf"},
+    "docx": {
+        "extension": "docx",
+        "mime": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    },
+    "txt": {"extension": "txt", "mime": "text/plain; charset=utf-8"},
+}
+
+CV_FORMATS = ["html", "pdf", "docx"]
+COVER_LETTER_FORMATS = ["html", "txt", "docx"]
+
+
+def available_formats() -> list[str]:
+    formats = ["html"]
+    if REPORTLAB_AVAILABLE:
+        formats.append("pdf")
+    if DOCX_AVAILABLE:
+        formats.append("docx")
+    return formats
+
+
+def write_cv_artifact(
+    cv: dict,
+    template: str,
+    fmt: str,
+    sink,
+    deterministic: bool = True,
+    compact: bool = False,
+    fit_pages: int | None = None,
+) -> dict:
+    """Render one CV artifact into the binary ``sink``; ``fmt`` is a key of ``ARTIFACT_FORMATS``.
+
+    Returns the ``size`` and SHA-256 ``digest`` of what was written. Output
+    is deterministic by default so artifacts can be addressed by content
+    hash. ``compact`` selects the smaller PDF profile or minified HTML;
+    ``fit_pages`` is the ``build_pdf`` option.
+    """
+    if fmt == "html":
+        return write_html(cv, template, sink, compact=compact)
+    if fmt == "pdf":
+        return write_pdf(cv, template, sink, deterministic=deterministic, compact=compact, fit_pages=fit_pages)
+    if fmt == "docx":
+        return write_docx(cv, template, sink, deterministic=deterministic)
+    raise ValueError(f"Unsupported CV format: {fmt}")
+
+
+def render_cv_artifact(
+    cv: dict,
+    template: str,
+    fmt: str,
+    deterministic: bool = True,
+    compact: bool = False,
+    fit_pages: int | None = None,
+) -> bytes:
+    """Render one CV artifact to bytes; see ``write_cv_artifact``."""
+    buffer = BytesIO()
+    write_cv_artifact(cv, template, fmt, buffer, deterministic=deterministic, compact=compact, fit_pages=fit_pages)
+    return buffer.getvalue()
+
+
+def render_cover_letter_artifact(letter_data: dict, fmt: str, deterministic: bool = True, compact: bool = False) -> bytes:
+    if fmt == "html":
+        return build_cover_letter_html(letter_data, compact=compact).encode("utf-8")
+    if fmt == "txt":
+        return build_cover_letter_text(letter_data).encode("utf-8")
+    if fmt == "docx":
+        return build_cover_letter_docx(letter_data, deterministic=deterministic)
+    raise ValueError(f"Unsupported cover letter format: {fmt}")
+
+
+def get_cv_artifact(
+    cv: dict,
+    template: str,
+    fmt: str,
+    root: str | None = None,
+    compact: bool = False,
+    fit_pages: int | None = None,
+) -> dict:
+    """Fetch a rendered CV artifact from the on-disk store, rendering it on first use.
+
+    Misses are rendered straight into the store's file, never into memory.
+    """
+    variant = fmt
+    if fmt in ("html", "pdf"):
+        variant += "-compact" if compact else ""
+    if fmt == "pdf":
+        variant += f"-fit{fit_pages}" if fit_pages else ""
+    key = render_key("cv", content_hash(cv), template, variant)
+    entry = get_or_render(
+        key,
+        ARTIFACT_FORMATS[fmt]["extension"],
+        lambda sink: write_cv_artifact(cv, template, fmt, sink, compact=compact, fit_pages=fit_pages),
+        root,
+    )
+    entry["mime"] = ARTIFACT_FORMATS[fmt]["mime"]
+    return entry
@@ -1,6 +1,8 @@
 import html
 import re
-from io import BytesIO
+
+from utils.docx_helpers import save_docx
+from utils.html_minify import minify_html
 
 try:
     import docx
@@ -39,7 +41,7 @@ def default_cover_letter_data(cv: dict | None = None) -> dict:
     }
 
 
-def build_cover_letter_html(letter_data: dict) -> str:
+def build_cover_letter_html(letter_data: dict, compact: bool = False) -> str:
     sender_address = str(letter_data.get("sender_address", ""))
     recipient_address = str(letter_data.get("recipient_address", ""))
     subject = html.escape(str(letter_data.get("subject", "")).strip())
@@ -55,7 +57,7 @@ def build_cover_letter_html(letter_data: dict) -> str:
         f"<p class='cover-letter-body'>{html.escape(paragraph).replace(chr(10), '<br>')}</p>" for paragraph in paragraphs
     )
 
-    return f"""
+    letter_html = f"""
     <div style="max-width: 860px; margin: 0 auto; background: #fff; border: 1px solid #d1d5db; padding: 28px; border-radius: 10px; font-family: Arial, sans-serif; color: #111827; line-height: 1.55;">
         <div style="margin-bottom: 20px;">{sender_address_html}</div>
         <div style="margin-bottom: 20px;">{recipient_address_html}</div>
@@ -73,6 +75,7 @@ def build_cover_letter_html(letter_data: dict) -> str:
       }}
     </style>
     """
+    return minify_html(letter_html) if compact else letter_html
 
 
 def build_cover_letter_text(letter_data: dict) -> str:
@@ -89,7 +92,7 @@ def build_cover_letter_text(letter_data: dict) -> str:
     return "\n".join(lines)
 
 
-def build_cover_letter_docx(letter_data: dict) -> bytes:
+def build_cover_letter_docx(letter_data: dict, deterministic: bool = False) -> bytes:
     if not _DOCX_AVAILABLE:
         return b""
 
@@ -135,6 +138,4 @@ def build_cover_letter_docx(letter_data: dict) -> bytes:
     if title:
         doc.add_paragraph(title)
 
-    buffer = BytesIO()
-    doc.save(buffer)
-    return buffer.getvalue()
+    return save_docx(doc, deterministic=deterministic, title=subject, author=signatory)
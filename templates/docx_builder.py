@@ -1,6 +1,6 @@
-from io import BytesIO
-
+from utils.artifact_store import HashingWriter
 from utils.converters import normalize_education_record, normalize_project_record
+from utils.docx_helpers import save_docx, write_docx_package
 
 try:
     import docx
@@ -31,7 +31,8 @@ else:
 
 
 def _clean_docx_text(value: object) -> str:
-    return str(value or "").replace("\r\n", "\n").replace("\r", "\n").strip()
+    # Line endings are already unified when the CV is saved (utils.text_normalize).
+    return str(value or "").strip()
 
 
 def _set_paragraph_spacing(paragraph, before: int = 0, after: int = 4, line_spacing: float = 1.05) -> None:
@@ -59,10 +60,23 @@ def _add_bullet(doc, text: object, *, size: int = 10, indent: float = 0.2):
     return paragraph
 
 
-def build_docx(cv: dict, template: str) -> bytes:
+def build_docx(cv: dict, template: str, deterministic: bool = False) -> bytes:
     if not DOCX_AVAILABLE:
         return b""
+    name = _clean_docx_text(cv.get("full_name", ""))
+    return save_docx(_compose_docx(cv, template), deterministic=deterministic, title=name, author=name)
+
+
+def write_docx(cv: dict, template: str, sink, deterministic: bool = False) -> dict:
+    """Write the Word CV into the binary ``sink``; returns its ``size`` and ``digest``."""
+    writer = HashingWriter(sink)
+    if DOCX_AVAILABLE:
+        name = _clean_docx_text(cv.get("full_name", ""))
+        write_docx_package(_compose_docx(cv, template), writer, deterministic=deterministic, title=name, author=name)
+    return writer.metadata()
+
 
+def _compose_docx(cv: dict, template: str):
     doc = docx.Document()
 
     sections = doc.sections
@@ -249,7 +263,4 @@ def build_docx(cv: dict, template: str) -> bytes:
             if text:
                 _add_bullet(doc, text, size=9)
 
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer.getvalue()
+    return doc
@@ -1,17 +1,53 @@
 import html
+from collections.abc import Iterator
 
+from utils.artifact_store import HashingWriter
 from utils.html_helpers import html_list, html_experience, html_education, html_projects, html_referees, section_header
+from utils.html_minify import minify_css, minify_html
 
 
-def build_html(cv: dict, template: str) -> str:
-    name = html.escape(cv.get("full_name", ""))
-    headline = html.escape(cv.get("headline", ""))
-    profile = html.escape(cv.get("profile_summary", ""))
-    contact = (
-        f"<p><strong>Location:</strong> {html.escape(cv.get('location', ''))}<br>"
-        f"<strong>Phone:</strong> {html.escape(cv.get('phone', ''))}<br>"
-        f"<strong>Email:</strong> {html.escape(cv.get('email', ''))}</p>"
-    )
+_DEFAULT_HTML_TEMPLATE = "One Column - Classic"
+
+
+def build_html(cv: dict, template: str, compact: bool = False) -> str:
+    """Render ``cv`` with ``template``; unknown names fall back to the classic layout.
+
+    ``compact`` output has its whitespace and CSS minified and renders the same.
+    """
+    if compact:
+        render, _, compact_stylesheet = _template_entry_for(template)
+        return minify_html("".join(render(cv, compact_stylesheet)))
+    return "".join(iter_html(cv, template))
+
+
+def iter_html(cv: dict, template: str) -> Iterator[str]:
+    """Yield the document ``build_html`` returns in chunks, without assembling it."""
+    render, stylesheet, _ = _template_entry_for(template)
+    return render(cv, stylesheet)
+
+
+def write_html(cv: dict, template: str, sink, compact: bool = False) -> dict:
+    """Write the UTF-8 document into the binary ``sink`` chunk by chunk.
+
+    Compact output is minified as a whole and written in one piece. Returns
+    the ``size`` and SHA-256 ``digest`` of what was written.
+    """
+    writer = HashingWriter(sink)
+    chunks = [build_html(cv, template, compact=True)] if compact else iter_html(cv, template)
+    for chunk in chunks:
+        writer.write(chunk.encode("utf-8"))
+    return writer.metadata()
+
+
+def _template_entry_for(template: str) -> tuple:
+    return _HTML_TEMPLATES.get(template) or _HTML_TEMPLATES[_DEFAULT_HTML_TEMPLATE]
+
+
+# ---------------------------------------------------------------------------
+# Shared fragments
+# ---------------------------------------------------------------------------
+
+def _link_items(cv: dict) -> list[str]:
     linkedin_url = cv.get('linkedin', '').strip()
     github_url = cv.get('github', '').strip()
     link_items = []
@@ -19,93 +55,88 @@ def build_html(cv: dict, template: str) -> str:
         link_items.append(f"<a href='{html.escape(linkedin_url)}'>LinkedIn</a>")
     if github_url:
         link_items.append(f"<a href='{html.escape(github_url)}'>GitHub</a>")
+    return link_items
+
+
+def _header_fragments(cv: dict) -> tuple[str, str, str, str]:
+    """Escaped name and headline plus the contact and links blocks."""
+    name = html.escape(cv.get("full_name", ""))
+    headline = html.escape(cv.get("headline", ""))
+    contact = (
+        f"<p><strong>Location:</strong> {html.escape(cv.get('location', ''))}<br>"
+        f"<strong>Phone:</strong> {html.escape(cv.get('phone', ''))}<br>"
+        f"<strong>Email:</strong> {html.escape(cv.get('email', ''))}</p>"
+    )
+    link_items = _link_items(cv)
     links = f"<p>{' | '.join(link_items)}</p>" if link_items else ""
+    return name, headline, contact, links
 
-    profile_section = section_header("Profile") + f"<p>{profile}</p>"
-    experience_section = section_header("Professional Experience") + html_experience(cv.get("experience", []))
-    education_section = section_header("Education") + html_education(cv.get("education", []))
-    competencies_section = section_header("Core Competencies") + html_list(cv.get("core_competencies", []))
-    certifications_section = section_header("Certifications") + html_list(cv.get("certifications", []))
-    projects_section = section_header("Projects") + html_projects(cv.get("projects", []))
-    languages_section = section_header("Languages") + html_list(cv.get("languages", []))
-    referees_section = section_header("Referees") + html_referees(cv.get("referees", []))
-
-    section_main = f"""
-    {profile_section}
-    {experience_section}
-    {projects_section}
-    {education_section}
-    """
 
-    section_side = f"""
-    {competencies_section}
-    {certifications_section}
-    {languages_section}
-    {referees_section}
-    """
+def _iter_section_main(cv: dict) -> Iterator[str]:
+    profile = html.escape(cv.get("profile_summary", ""))
+    yield "\n    "
+    yield section_header("Profile") + f"<p>{profile}</p>"
+    yield "\n    "
+    yield section_header("Professional Experience")
+    yield html_experience(cv.get("experience", []))
+    yield "\n    "
+    yield section_header("Projects")
+    yield html_projects(cv.get("projects", []))
+    yield "\n    "
+    yield section_header("Education")
+    yield html_education(cv.get("education", []))
+    yield "\n    "
+
+
+def _iter_section_side(cv: dict) -> Iterator[str]:
+    yield "\n    "
+    yield section_header("Core Competencies")
+    yield html_list(cv.get("core_competencies", []))
+    yield "\n    "
+    yield section_header("Certifications")
+    yield html_list(cv.get("certifications", []))
+    yield "\n    "
+    yield section_header("Languages")
+    yield html_list(cv.get("languages", []))
+    yield "\n    "
+    yield section_header("Referees")
+    yield html_referees(cv.get("referees", []))
+    yield "\n    "
 
-    sidebar_skills = html_list(cv.get('core_competencies', []))
-    sidebar_languages = html_list(cv.get('languages', []))
-    certifications_html = html_list(cv.get('certifications', []))
-    referees_html = html_referees(cv.get('referees', []))
 
-    shared_section_styles = """
-    .section-heading { display: flex; align-items: center; gap: 10px; margin-bottom: 10px; }
-    .section-heading h2 { margin: 0; font-size: 20px; letter-spacing: 0.1em; text-transform: uppercase; font-weight: 600; }
-    .section-icon { font-size: 20px; }
-    .experience-header { display: flex; justify-content: space-between; align-items: baseline; gap: 12px; }
-    .experience-period { font-size: 13px; color: #475569; }
-    .experience-org { font-size: 14px; color: #1f2937; margin-bottom: 6px; }
-    .education-entry { padding: 10px 12px; border-left: 3px solid #1d4ed8; margin-bottom: 10px; background: rgba(29,78,216,0.06); border-radius: 4px; }
-    .education-top { display: flex; justify-content: space-between; font-size: 14px; font-weight: 600; }
-    .education-course { display: inline-flex; gap: 6px; }
-    .education-timeline { font-size: 12px; color: #475569; }
-    .education-institution { font-size: 13px; color: #0f172a; margin-top: 4px; }
-    .referee { margin-bottom: 10px; padding-bottom: 10px; border-bottom: 1px dashed rgba(15,23,42,0.1); }
-    .referee-head { display: flex; flex-direction: column; gap: 2px; }
-    .referee-name { font-weight: 600; }
-    .referee-org { font-size: 13px; color: #475569; }
-    .referee-meta { margin-top: 4px; display: flex; flex-wrap: wrap; gap: 12px; font-size: 12px; color: #1f2937; }
-    .referee-field { display: inline-flex; align-items: center; gap: 4px; padding-right: 8px; }
-    .project-entry { margin-bottom: 10px; padding: 8px 12px; border-left: 3px solid #2563eb; background: rgba(37,99,235,0.04); border-radius: 4px; }
-    .project-entry h4 { margin: 0 0 4px 0; font-size: 14px; }
-    .project-entry p { margin: 2px 0; font-size: 13px; color: #334155; }
-    .project-tech { font-size: 12px; color: #64748b; font-style: italic; margin-top: 4px; }
-    .project-entry a { font-size: 12px; color: #2563eb; }
-    .job p, .job li, .section-block p, .section-block li, .main-panel p, .main-panel li,
-    .side-panel p, .side-panel li, .content p, .content li, .main-area p, .main-area li,
-    .summary { text-align: justify; text-justify: inter-word; }
-    """
+# ---------------------------------------------------------------------------
+# Per-template renderers
+# ---------------------------------------------------------------------------
 
-    one_column_css = _one_column_classic_css() + shared_section_styles + _export_safety_css()
-    one_column_minimal_css = _one_column_minimal_css() + shared_section_styles + _export_safety_css()
-    one_column_executive_css = _one_column_executive_css() + shared_section_styles + _export_safety_css()
-    two_column_css = _two_column_professional_css() + shared_section_styles + _export_safety_css()
-    two_column_sidebar_css = _two_column_sidebar_css() + shared_section_styles + _export_safety_css()
-    two_column_sidebar_skillset_css = _two_column_sidebar_skillset_css() + shared_section_styles + _export_safety_css()
-    two_column_accent_css = _two_column_accent_css() + shared_section_styles + _export_safety_css()
-    two_column_slate_css = _two_column_slate_css() + shared_section_styles + _export_safety_css()
-    two_column_emerald_css = _two_column_emerald_css() + shared_section_styles + _export_safety_css()
-    two_column_burgundy_css = _two_column_burgundy_css() + shared_section_styles + _export_safety_css()
-
-    if template == "One Column - Minimal":
-        return f"""
-        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{one_column_minimal_css}</style></head>
+def _render_one_column_minimal(cv: dict, stylesheet: str) -> Iterator[str]:
+    name, headline, contact, links = _header_fragments(cv)
+    yield """
+        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>"""
+    yield stylesheet
+    yield f"""</style></head>
         <body data-template='one-column'>
             <div class='cv'>
                 <h1>{name}</h1>
                 <p>{headline}</p>
                 {contact}
                 {links}
-                {section_main}
-                {section_side}
+                """
+    yield from _iter_section_main(cv)
+    yield """
+                """
+    yield from _iter_section_side(cv)
+    yield """
             </div>
         </body></html>
         """
 
-    if template == "Two Column - Professional":
-        return f"""
-        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{two_column_css}</style></head>
+
+def _render_header_grid(cv: dict, stylesheet: str) -> Iterator[str]:
+    name, headline, contact, links = _header_fragments(cv)
+    yield """
+        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>"""
+    yield stylesheet
+    yield f"""</style></head>
         <body data-template='two-column'>
             <div class='cv'>
                 <div class='header'>
@@ -121,16 +152,24 @@ def build_html(cv: dict, template: str) -> str:
                     </div>
                 </div>
                 <div class='grid'>
-                    <div class='main-panel'>{section_main}</div>
-                    <div class='side-panel'>{section_side}</div>
+                    <div class='main-panel'>"""
+    yield from _iter_section_main(cv)
+    yield """</div>
+                    <div class='side-panel'>"""
+    yield from _iter_section_side(cv)
+    yield """</div>
                 </div>
             </div>
         </body></html>
         """
 
-    if template == "Two Column - Sidebar":
-        return f"""
-        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{two_column_sidebar_css}</style></head>
+
+def _render_sidebar(cv: dict, stylesheet: str) -> Iterator[str]:
+    name, headline, contact, links = _header_fragments(cv)
+    yield """
+        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>"""
+    yield stylesheet
+    yield f"""</style></head>
         <body data-template='two-column'>
             <div class='cv'>
                 <aside class='sidebar'>
@@ -138,25 +177,131 @@ def build_html(cv: dict, template: str) -> str:
                     <p>{headline}</p>
                     {contact}
                     {links}
-                    {section_side}
+                    """
+    yield from _iter_section_side(cv)
+    yield """
                 </aside>
                 <main class='content'>
-                    {section_main}
+                    """
+    yield from _iter_section_main(cv)
+    yield """
                 </main>
             </div>
         </body></html>
         """
 
-    if template == "Two Column - Sidebar Skillset":
-        sidebar_contact = f"""
+
+def _render_accent_panel(cv: dict, stylesheet: str) -> Iterator[str]:
+    name, headline, contact, links = _header_fragments(cv)
+    yield """
+        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>"""
+    yield stylesheet
+    yield f"""</style></head>
+        <body data-template='two-column'>
+            <div class='cv'>
+                <div class='hero'>
+                    <div>
+                        <h1>{name}</h1>
+                        <p class='headline'>{headline}</p>
+                    </div>
+                    <div class='hero-meta'>
+                        {contact}
+                        <div class='hero-links'>
+                            {links}
+                        </div>
+                    </div>
+                </div>
+                <div class='main'>
+                    <div class='main-panel'>
+                        """
+    yield from _iter_section_main(cv)
+    yield """
+                    </div>
+                    <aside class='aside-panel'>
+                        """
+    yield from _iter_section_side(cv)
+    yield """
+                    </aside>
+                </div>
+            </div>
+        </body></html>
+        """
+
+
+def _render_one_column_executive(cv: dict, stylesheet: str) -> Iterator[str]:
+    name, headline, contact, links = _header_fragments(cv)
+    yield """
+        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>"""
+    yield stylesheet
+    yield f"""</style></head>
+        <body data-template='one-column'>
+            <div class='cv'>
+                <div class='hero'>
+                    <h1>{name}</h1>
+                    <p class='headline'>{headline}</p>
+                    <div class='hero-meta'>
+                        {contact}
+                        {links}
+                    </div>
+                </div>
+                <div class='content'>
+                    <div class='section-block'>"""
+    yield from _iter_section_main(cv)
+    yield """</div>
+                    <div class='section-block'>"""
+    yield from _iter_section_side(cv)
+    yield """</div>
+                </div>
+            </div>
+        </body></html>
+        """
+
+
+def _render_one_column_classic(cv: dict, stylesheet: str) -> Iterator[str]:
+    name, headline, contact, links = _header_fragments(cv)
+    yield """
+    <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>"""
+    yield stylesheet
+    yield f"""</style></head>
+    <body data-template='one-column'>
+        <div class='cv'>
+            <div class='hero'>
+                <h1>{name}</h1>
+                <p class='headline'>{headline}</p>
+                <div class='hero-meta'>
+                    {contact}
+                    {links}
+                </div>
+            </div>
+            <div class='content'>
+                <div class='section-block'>"""
+    yield from _iter_section_main(cv)
+    yield """</div>
+                <div class='section-block'>"""
+    yield from _iter_section_side(cv)
+    yield """</div>
+            </div>
+        </div>
+    </body></html>
+    """
+
+def _render_sidebar_skillset(cv: dict, stylesheet: str) -> Iterator[str]:
+    name, headline, _, links = _header_fragments(cv)
+    sidebar_skills = html_list(cv.get('core_competencies', []))
+    sidebar_languages = html_list(cv.get('languages', []))
+    certifications_html = html_list(cv.get('certifications', []))
+    referees_html = html_referees(cv.get('referees', []))
+    sidebar_contact = f"""
         <div class='contact-block'>
             <strong>Location</strong><span>{html.escape(cv.get('location', ''))}</span>
             <strong>Phone</strong><span>{html.escape(cv.get('phone', ''))}</span>
             <strong>Email</strong><span>{html.escape(cv.get('email', ''))}</span>
         </div>
         """
-        return f"""
-        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{two_column_sidebar_skillset_css}</style></head>
+    yield """
+        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>"""
+    yield stylesheet
+    yield f"""</style></head>
         <body data-template='two-column'>
             <div class='cv'>
                 <aside class='sidebar'>
@@ -177,7 +322,9 @@ def build_html(cv: dict, template: str) -> str:
                 </aside>
                 <main class='content'>
                     <div class='section-block'>
-                        {section_main}
+                        """
+    yield from _iter_section_main(cv)
+    yield f"""
                     </div>
                     <div class='section-block'>
                         <h2>Certifications</h2>
@@ -192,95 +339,72 @@ def build_html(cv: dict, template: str) -> str:
         </body></html>
         """
 
-    if template == "Two Column - Accent Panel":
-        return f"""
-        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{two_column_accent_css}</style></head>
-        <body data-template='two-column'>
-            <div class='cv'>
-                <div class='hero'>
-                    <div>
-                        <h1>{name}</h1>
-                        <p class='headline'>{headline}</p>
-                    </div>
-                    <div class='hero-meta'>
-                        {contact}
-                        <div class='hero-links'>
-                            {links}
-                        </div>
-                    </div>
-                </div>
-                <div class='main'>
-                    <div class='main-panel'>
-                        {section_main}
-                    </div>
-                    <aside class='aside-panel'>
-                        {section_side}
-                    </aside>
-                </div>
-            </div>
-        </body></html>
-        """
 
-    if template == "Two Column - Slate Profile":
-        contact_fields = [
-            ("Name", cv.get("full_name", "")),
-            ("Address", cv.get("location", "")),
-            ("Phone", cv.get("phone", "")),
-            ("Email", cv.get("email", "")),
-        ]
-        contact_rows = []
-        for label, raw_value in contact_fields:
-            if str(raw_value).strip():
-                contact_rows.append(
-                    """
+def _render_slate_profile(cv: dict, stylesheet: str) -> Iterator[str]:
+    name = html.escape(cv.get("full_name", ""))
+    profile = html.escape(cv.get("profile_summary", ""))
+    link_items = _link_items(cv)
+    contact_fields = [
+        ("Name", cv.get("full_name", "")),
+        ("Address", cv.get("location", "")),
+        ("Phone", cv.get("phone", "")),
+        ("Email", cv.get("email", "")),
+    ]
+    contact_rows = []
+    for label, raw_value in contact_fields:
+        if str(raw_value).strip():
+            contact_rows.append(
+                """
                     <div class='detail-row'>
                         <span class='detail-label'>{label}</span>
                         <span class='detail-value'>{value}</span>
                     </div>
                     """.format(label=label, value=html.escape(str(raw_value)))
-                )
-        personal_details_html = "".join(contact_rows)
-
-        competencies = cv.get("core_competencies", [])
-        skills_entries = competencies[:6] if competencies else []
-        if not skills_entries:
-            skills_entries = cv.get("languages", [])
-        skills_html = html_list(skills_entries)
-        technical_entries = competencies[6:]
-        tech_html = html_list(technical_entries)
-        education_html_content = html_education(cv.get("education", []))
-        languages_html = html_list(cv.get("languages", []))
-        referees_html_content = html_referees(cv.get("referees", []))
-        projects_html = html_projects(cv.get("projects", []))
-        links_row = f"<div class='links-row'>{' | '.join(link_items)}</div>" if link_items else ""
-
-        education_sec = (
-            f"<div class='sidebar-section'><h3>Education</h3>{education_html_content}</div>"
-            if education_html_content else ""
-        )
-        skills_sec = (
-            f"<div class='sidebar-section'><h3>Skills</h3>{skills_html}</div>"
-            if skills_html else ""
-        )
-        tech_sec = (
-            f"<div class='sidebar-section'><h3>Technical Proficiencies</h3>{tech_html}</div>"
-            if tech_html else ""
-        )
-        languages_sec = (
-            f"<div class='sidebar-section'><h3>Languages</h3>{languages_html}</div>"
-            if languages_html else ""
-        )
-        referees_sec = (
-            f"<div class='section-body'><h2>Referees</h2>{referees_html_content}</div>"
-            if referees_html_content else ""
-        )
-        projects_sec = (
-            f"<div class='section-body'><h2>Projects</h2>{projects_html}</div>"
-            if projects_html else ""
-        )
-
-        return f"""
-        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{two_column_slate_css}</style></head>
+            )
+    personal_details_html = "".join(contact_rows)
+
+    competencies = cv.get("core_competencies", [])
+    skills_entries = competencies[:6] if competencies else []
+    if not skills_entries:
+        skills_entries = cv.get("languages", [])
+    skills_html = html_list(skills_entries)
+    technical_entries = competencies[6:]
+    tech_html = html_list(technical_entries)
+    education_html_content = html_education(cv.get("education", []))
+    languages_html = html_list(cv.get("languages", []))
+    referees_html_content = html_referees(cv.get("referees", []))
+    projects_html = html_projects(cv.get("projects", []))
+    links_row = f"<div class='links-row'>{' | '.join(link_items)}</div>" if link_items else ""
+
+    education_sec = (
+        f"<div class='sidebar-section'><h3>Education</h3>{education_html_content}</div>"
+        if education_html_content else ""
+    )
+    skills_sec = (
+        f"<div class='sidebar-section'><h3>Skills</h3>{skills_html}</div>"
+        if skills_html else ""
+    )
+    tech_sec = (
+        f"<div class='sidebar-section'><h3>Technical Proficiencies</h3>{tech_html}</div>"
+        if tech_html else ""
+    )
+    languages_sec = (
+        f"<div class='sidebar-section'><h3>Languages</h3>{languages_html}</div>"
+        if languages_html else ""
+    )
+    referees_sec = (
+        f"<div class='section-body'><h2>Referees</h2>{referees_html_content}</div>"
+        if referees_html_content else ""
+    )
+    projects_sec = (
+        f"<div class='section-body'><h2>Projects</h2>{projects_html}</div>"
+        if projects_html else ""
+    )
+
+    yield """
+        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>"""
+    yield stylesheet
+    yield f"""</style></head>
         <body data-template='two-column'>
             <div class='cv'>
                 <div class='name-banner'>
@@ -304,13 +428,17 @@ def build_html(cv: dict, template: str) -> str:
                         </div>
                         <div class='section-body'>
                             <h2>Work Experience</h2>
-                            {html_experience(cv.get('experience', []))}
+                            """
+    yield html_experience(cv.get('experience', []))
+    yield f"""
                         </div>
                         {projects_sec}
                         <div class='divider'></div>
                         <div class='section-body'>
                             <h2>Courses and Certificates</h2>
-                            {html_list(cv.get('certifications', []))}
+                            """
+    yield html_list(cv.get('certifications', []))
+    yield f"""
                         </div>
                         {referees_sec}
                     </div>
@@ -319,107 +447,40 @@ def build_html(cv: dict, template: str) -> str:
         </body></html>
         """
 
-    if template == "One Column - Executive":
-        return f"""
-        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{one_column_executive_css}</style></head>
-        <body data-template='one-column'>
-            <div class='cv'>
-                <div class='hero'>
-                    <h1>{name}</h1>
-                    <p class='headline'>{headline}</p>
-                    <div class='hero-meta'>
-                        {contact}
-                        {links}
-                    </div>
-                </div>
-                <div class='content'>
-                    <div class='section-block'>{section_main}</div>
-                    <div class='section-block'>{section_side}</div>
-                </div>
-            </div>
-        </body></html>
-        """
-
-    if template == "Two Column - Emerald":
-        return f"""
-        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{two_column_emerald_css}</style></head>
-        <body data-template='two-column'>
-            <div class='cv'>
-                <div class='header'>
-                    <div class='header-grid'>
-                        <div class='header-main'>
-                            <h1>{name}</h1>
-                            <p class='headline'>{headline}</p>
-                        </div>
-                        <div class='header-contact'>
-                            {contact}
-                            {links}
-                        </div>
-                    </div>
-                </div>
-                <div class='grid'>
-                    <div class='main-panel'>{section_main}</div>
-                    <div class='side-panel'>{section_side}</div>
-                </div>
-            </div>
-        </body></html>
-        """
-
-    if template == "Two Column - Burgundy":
-        return f"""
-        <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{two_column_burgundy_css}</style></head>
-        <body data-template='two-column'>
-            <div class='cv'>
-                <div class='hero'>
-                    <div>
-                        <h1>{name}</h1>
-                        <p class='headline'>{headline}</p>
-                    </div>
-                    <div class='hero-meta'>
-                        {contact}
-                        <div class='hero-links'>
-                            {links}
-                        </div>
-                    </div>
-                </div>
-                <div class='main'>
-                    <div class='main-panel'>
-                        {section_main}
-                    </div>
-                    <aside class='aside-panel'>
-                        {section_side}
-                    </aside>
-                </div>
-            </div>
-        </body></html>
-        """
-
-    # Default: One Column - Classic
-    return f"""
-    <!doctype html><html><head><meta charset='UTF-8'><meta name='viewport' content='width=device-width, initial-scale=1'><style>{one_column_css}</style></head>
-    <body data-template='one-column'>
-        <div class='cv'>
-            <div class='hero'>
-                <h1>{name}</h1>
-                <p class='headline'>{headline}</p>
-                <div class='hero-meta'>
-                    {contact}
-                    {links}
-                </div>
-            </div>
-            <div class='content'>
-                <div class='section-block'>{section_main}</div>
-                <div class='section-block'>{section_side}</div>
-            </div>
-        </div>
-    </body></html>
-    """
-
 
 # ---------------------------------------------------------------------------
 # CSS template functions
 # ---------------------------------------------------------------------------
 
+_SHARED_SECTION_STYLES = """
+    .section-heading { display: flex; align-items: center; gap: 10px; margin-bottom: 10px; }
+    .section-heading h2 { margin: 0; font-size: 20px; letter-spacing: 0.1em; text-transform: uppercase; font-weight: 600; }
+    .section-icon { font-size: 20px; }
+    .experience-header { display: flex; justify-content: space-between; align-items: baseline; gap: 12px; }
+    .experience-period { font-size: 13px; color: #475569; }
+    .experience-org { font-size: 14px; color: #1f2937; margin-bottom: 6px; }
+    .education-entry { padding: 10px 12px; border-left: 3px solid #1d4ed8; margin-bottom: 10px; background: rgba(29,78,216,0.06); border-radius: 4px; }
+    .education-top { display: flex; justify-content: space-between; font-size: 14px; font-weight: 600; }
+    .education-course { display: inline-flex; gap: 6px; }
+    .education-timeline { font-size: 12px; color: #475569; }
+    .education-institution { font-size: 13px; color: #0f172a; margin-top: 4px; }
+    .referee { margin-bottom: 10px; padding-bottom: 10px; border-bottom: 1px dashed rgba(15,23,42,0.1); }
+    .referee-head { display: flex; flex-direction: column; gap: 2px; }
+    .referee-name { font-weight: 600; }
+    .referee-org { font-size: 13px; color: #475569; }
+    .referee-meta { margin-top: 4px; display: flex; flex-wrap: wrap; gap: 12px; font-size: 12px; color: #1f2937; }
+    .referee-field { display: inline-flex; align-items: center; gap: 4px; padding-right: 8px; }
+    .project-entry { margin-bottom: 10px; padding: 8px 12px; border-left: 3px solid #2563eb; background: rgba(37,99,235,0.04); border-radius: 4px; }
+    .project-entry h4 { margin: 0 0 4px 0; font-size: 14px; }
+    .project-entry p { margin: 2px 0; font-size: 13px; color: #334155; }
+    .project-tech { font-size: 12px; color: #64748b; font-style: italic; margin-top: 4px; }
+    .project-entry a { font-size: 12px; color: #2563eb; }
+    .job p, .job li, .section-block p, .section-block li, .main-panel p, .main-panel li,
+    .side-panel p, .side-panel li, .content p, .content li, .main-area p, .main-area li,
+    .summary { text-align: justify; text-justify: inter-word; }
+    """
+
+
 def _export_safety_css() -> str:
     return """
     *, *::before, *::after { box-sizing: border-box; }
@@ -917,3 +978,31 @@ def _two_column_burgundy_css() -> str:
     .referees-list { margin-top: 8px; padding-left: 0; }
     .referees-list li { margin-bottom: 6px; list-style: none; }
     """
+
+
+# ---------------------------------------------------------------------------
+# Template registry
+# ---------------------------------------------------------------------------
+
+def _template_entry(render, css_fn) -> tuple:
+    stylesheet = css_fn() + _SHARED_SECTION_STYLES + _export_safety_css()
+    return render, stylesheet, minify_css(stylesheet)
+
+
+# Each template's renderer and its complete stylesheet, full and minified,
+# assembled once at import.
+_HTML_TEMPLATES: dict[str, tuple] = {
+    template: _template_entry(render, css_fn)
+    for template, render, css_fn in (
+        ("One Column - Classic", _render_one_column_classic, _one_column_classic_css),
+        ("One Column - Minimal", _render_one_column_minimal, _one_column_minimal_css),
+        ("One Column - Executive", _render_one_column_executive, _one_column_executive_css),
+        ("Two Column - Professional", _render_header_grid, _two_column_professional_css),
+        ("Two Column - Sidebar", _render_sidebar, _two_column_sidebar_css),
+        ("Two Column - Sidebar Skillset", _render_sidebar_skillset, _two_column_sidebar_skillset_css),
+        ("Two Column - Accent Panel", _render_accent_panel, _two_column_accent_css),
+        ("Two Column - Slate Profile", _render_slate_profile, _two_column_slate_css),
+        ("Two Column - Emerald", _render_header_grid, _two_column_emerald_css),
+        ("Two Column - Burgundy", _render_accent_panel, _two_column_burgundy_css),
+    )
+}
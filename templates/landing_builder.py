@@ -0,0 +1,812 @@
+import base64
+import html
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from threading import Lock
+
+from utils.artifact_store import content_hash
+from utils.html_minify import minify_html
+from utils.image_assets import STATIC_DIR, STATIC_URL, hashed_name, publish_image_variants, publish_static_file
+
+
+ASSETS_DIR = Path(__file__).resolve().parents[1] / "assets"
+HERO_IMAGE = "portfolio-hero.png"
+_HERO_GRADIENT = (
+    "linear-gradient(90deg, rgba(9, 16, 25, 0.96) 0%, rgba(9, 16, 25, 0.82) 48%, rgba(9, 16, 25, 0.36) 100%)"
+)
+
+
+def _clean_text(value: object) -> str:
+    # Stored CVs are normalised on save (utils.text_normalize).
+    return str(value or "")
+
+
+def _e(value: object) -> str:
+    return html.escape(_clean_text(value))
+
+
+def _asset_data_uri(filename: str) -> str:
+    path = ASSETS_DIR / filename
+    if not path.exists():
+        return ""
+    encoded = base64.b64encode(path.read_bytes()).decode("ascii")
+    return f"data:image/png;base64,{encoded}"
+
+
+def publish_hero_image(target_dir: Path = STATIC_DIR, url_prefix: str = STATIC_URL) -> tuple[str | None, list[dict]]:
+    """Publish the hero variants and return ``(hero_src, hero_variants)`` for the landing builders.
+
+    Falls back to ``(None, [])``, i.e. the inline data URI, when Pillow is
+    missing or ``target_dir`` cannot be written.
+    """
+    try:
+        variants = publish_image_variants(ASSETS_DIR / HERO_IMAGE, target_dir, url_prefix)
+    except OSError:
+        return None, []
+    if not variants:
+        return None, []
+    return variants[-1]["url"], [variant for variant in variants if variant["mime"] != "image/png"]
+
+
+def _hero_variant_css(variants: list[dict]) -> str:
+    """``image-set`` backgrounds for browsers that support it, smallest width per breakpoint."""
+    if not variants:
+        return ""
+    widths = sorted({variant["width"] for variant in variants})
+
+    def rule(width: int) -> str:
+        candidates = ", ".join(
+            f"url('{variant['url']}') type('{variant['mime']}')"
+            for variant in variants if variant["width"] == width
+        )
+        return f".pf-hero {{ background-image: {_HERO_GRADIENT}, image-set({candidates}); }}"
+
+    rules = [rule(widths[-1])]
+    rules.extend(f"@media (max-width: {width}px) {{ {rule(width)} }}" for width in reversed(widths[:-1]))
+    body = "".join(f"            {item}\n" for item in rules)
+    return f"        @supports (background-image: image-set(url('x') type('image/webp'))) {{\n{body}        }}\n"
+
+
+# Landing pages are shared by every visitor session and rebuilt only when the
+# published CV or the hero image changes. The hero's mtime stands in for its
+# hash so a lookup costs a stat rather than reading the image.
+LANDING_CACHE_SIZE = 8
+_LANDING_PAGES: OrderedDict = OrderedDict()
+_LANDING_LOCK = Lock()
+
+
+def cached_portfolio_landing_html(
+    cv: dict, compact: bool = True, hero_dir: Path = STATIC_DIR, hero_url_prefix: str = STATIC_URL
+) -> str:
+    """Lite landing page for ``cv`` with the published hero image, built once per CV and hero."""
+    hero_path = ASSETS_DIR / HERO_IMAGE
+    asset_key = hero_path.stat().st_mtime_ns if hero_path.exists() else None
+    key = (content_hash(cv), asset_key, compact, hero_dir, hero_url_prefix)
+    with _LANDING_LOCK:
+        page = _LANDING_PAGES.get(key)
+        if page is not None:
+            _LANDING_PAGES.move_to_end(key)
+            return page
+
+    hero_src, hero_variants = publish_hero_image(hero_dir, hero_url_prefix)
+    page = build_portfolio_landing_html(
+        cv, hero_src=hero_src, compact=compact, hero_variants=hero_variants, lite=True
+    )
+    with _LANDING_LOCK:
+        _LANDING_PAGES[key] = page
+        while len(_LANDING_PAGES) > LANDING_CACHE_SIZE:
+            _LANDING_PAGES.popitem(last=False)
+    return page
+
+
+def _landing_document(cv: dict, body: str) -> str:
+    # A standalone file needs its own doctype and charset; inline embeds do not.
+    title = " | ".join(part for part in [_clean_text(cv.get("full_name")), _clean_text(cv.get("headline"))] if part)
+    return (
+        "<!doctype html><html lang='en'><head><meta charset='UTF-8'>"
+        "<meta name='viewport' content='width=device-width, initial-scale=1'>"
+        f"<title>{html.escape(title or 'Portfolio')}</title><style>body{{margin:0}}</style></head>"
+        f"<body>{body}</body></html>"
+    )
+
+
+def publish_landing_page(cv: dict, target_dir: Path = STATIC_DIR, url_prefix: str = STATIC_URL) -> str:
+    """Write the landing page for ``cv`` into ``target_dir`` and return its URL.
+
+    The file is a complete HTML document (doctype, UTF-8 charset) under a
+    content-hashed name. It sits next to the hero variants and refers to them
+    relatively. Only the newest ``LANDING_CACHE_SIZE`` pages are kept. Raises
+    ``OSError`` when ``target_dir`` cannot be written.
+    """
+    body = cached_portfolio_landing_html(cv, hero_dir=target_dir, hero_url_prefix=".")
+    data = _landing_document(cv, body).encode("utf-8")
+    name = hashed_name("portfolio-landing", data, "html")
+    try:
+        os.utime(target_dir / name)  # pruning goes by mtime; keep pages in use
+    except FileNotFoundError:
+        publish_static_file(target_dir, name, data, keep=LANDING_CACHE_SIZE)
+    return f"{url_prefix}/{name}"
+
+
+def clear_landing_cache() -> None:
+    """Drop cached landing pages, e.g. after the default CV version or profile changes."""
+    with _LANDING_LOCK:
+        _LANDING_PAGES.clear()
+
+
+def _experience_items(experience: list[dict]) -> Iterator[str]:
+    for item in experience:
+        bullets = "".join(f"<li>{_e(bullet)}</li>" for bullet in item.get("bullets", [])[:4])
+        yield f"""
+        <article class='timeline-item'>
+            <div>
+                <span>{_e(item.get("period", ""))}</span>
+                <h3>{_e(item.get("role", ""))}</h3>
+                <p>{_e(item.get("organization", ""))}</p>
+            </div>
+            <ul>{bullets}</ul>
+        </article>
+        """
+
+
+def _project_items(projects: list[dict]) -> Iterator[str]:
+    for item in projects:
+        tech = _e(item.get("technologies", ""))
+        link = _e(item.get("link", ""))
+        link_html = (
+            f"<a class='project-link' href='{link}' target='_blank' rel='noreferrer'>View Repository</a>"
+            if link else ""
+        )
+        yield f"""
+        <article class='project-card'>
+            <h3>{_e(item.get("name", ""))}</h3>
+            <p>{_e(item.get("description", ""))}</p>
+            <span>{tech}</span>
+            {link_html}
+        </article>
+        """
+
+
+def _education_items(education: list[dict]) -> Iterator[str]:
+    for item in education:
+        yield f"""
+        <article class='proof-item'>
+            <h3>{_e(item.get("course", ""))}</h3>
+            <p>{_e(item.get("institution", ""))}</p>
+            <span>{_e(item.get("timeline", ""))}</span>
+        </article>
+        """
+
+
+def _iter_critical_css(hero_uri: str, hero_variants: list[dict]) -> Iterator[str]:
+    # Rules for the navigation, hero and stats band: everything above the fold.
+    yield f"""
+        :root {{
+            color-scheme: light;
+        }}
+        .pf-wrap, .pf-wrap * {{
+            box-sizing: border-box;
+        }}
+        .pf-wrap {{
+            font-family: Inter, 'Segoe UI', Arial, sans-serif;
+            background:
+                linear-gradient(180deg, #081116 0%, #0d1b22 34%, #f5f8fb 34%, #f5f8fb 100%);
+            color: #17202a;
+            line-height: 1.55;
+        }}
+        .pf-wrap a {{
+            color: inherit;
+            text-decoration: none;
+        }}
+        .site-nav {{
+            min-height: 70px;
+            padding: 0 34px;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+            gap: 18px;
+            background: rgba(8, 17, 22, 0.94);
+            color: #e9fbf8;
+            border-bottom: 1px solid rgba(85, 230, 208, 0.22);
+        }}
+        .brand {{
+            display: flex;
+            align-items: center;
+            gap: 12px;
+            font-weight: 900;
+        }}
+        .brand-mark {{
+            width: 38px;
+            height: 38px;
+            display: grid;
+            place-items: center;
+            border: 1px solid rgba(85, 230, 208, 0.6);
+            border-radius: 8px;
+            color: #55e6d0;
+            background: rgba(85, 230, 208, 0.08);
+            box-shadow: 0 0 26px rgba(85, 230, 208, 0.18);
+        }}
+        .nav-links {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 18px;
+            color: #aac2ca;
+            font-size: 14px;
+            font-weight: 750;
+        }}
+        .nav-links a:hover {{
+            color: #55e6d0;
+        }}
+        .pf-hero {{
+            min-height: 660px;
+            padding: 44px;
+            display: grid;
+            grid-template-columns: minmax(0, 1fr) minmax(340px, 0.85fr);
+            gap: 36px;
+            align-items: end;
+            color: #ffffff;
+            background:
+                {_HERO_GRADIENT},
+                url('"""
+    yield hero_uri
+    yield f"""');
+            background-size: cover;
+            background-position: center;
+            border-radius: 8px;
+            overflow: hidden;
+            border-bottom: 1px solid rgba(85, 230, 208, 0.18);
+        }}
+        .eyebrow {{
+            margin: 0 0 14px;
+            color: #f4b35d;
+            font-size: 13px;
+            font-weight: 800;
+            letter-spacing: 0;
+            text-transform: uppercase;
+        }}
+        .pf-name {{
+            margin: 0;
+            max-width: 780px;
+            font-size: 58px;
+            line-height: 1.02;
+            letter-spacing: 0;
+        }}
+        .pf-headline {{
+            margin: 18px 0 0;
+            max-width: 740px;
+            font-size: 22px;
+            color: #d7f6f1;
+            font-weight: 650;
+        }}
+        .pf-summary {{
+            margin: 20px 0 0;
+            max-width: 760px;
+            color: #e8eef4;
+            font-size: 16px;
+        }}
+        .pf-actions {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 12px;
+            margin-top: 28px;
+        }}
+        .pf-button {{
+            display: inline-flex;
+            align-items: center;
+            justify-content: center;
+            min-height: 44px;
+            padding: 0 16px;
+            border-radius: 6px;
+            border: 1px solid rgba(255,255,255,0.34);
+            background: rgba(255,255,255,0.1);
+            color: #ffffff;
+            font-weight: 800;
+        }}
+        .pf-button.primary {{
+            background: #55e6d0;
+            border-color: #55e6d0;
+            color: #07141a;
+        }}
+        .contact-panel {{
+            align-self: stretch;
+            display: flex;
+            flex-direction: column;
+            justify-content: end;
+            gap: 16px;
+        }}
+        .contact-box {{
+            padding: 18px;
+            border: 1px solid rgba(255,255,255,0.22);
+            border-radius: 8px;
+            background: rgba(7, 20, 26, 0.74);
+            backdrop-filter: blur(14px);
+        }}
+        .contact-box span {{
+            display: block;
+            color: #9fb3c8;
+            font-size: 12px;
+            font-weight: 800;
+            text-transform: uppercase;
+            margin-bottom: 4px;
+        }}
+        .contact-box p {{
+            margin: 0 0 12px;
+            overflow-wrap: anywhere;
+        }}
+        .contact-links {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 10px;
+            color: #bff4ea;
+            font-weight: 800;
+        }}
+        .stats-band {{
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 1px;
+            background: #18313b;
+            border-radius: 8px;
+            overflow: hidden;
+            margin: 18px 28px 0;
+            border: 1px solid rgba(85, 230, 208, 0.18);
+        }}
+        .stat {{
+            min-height: 112px;
+            padding: 20px;
+            background: #0d1b22;
+        }}
+        .stat strong {{
+            display: block;
+            color: #55e6d0;
+            font-size: 30px;
+            line-height: 1;
+            margin-bottom: 8px;
+        }}
+        .stat span {{
+            color: #c1d1d7;
+            font-size: 14px;
+        }}
+        @media (max-width: 900px) {{
+            .pf-hero {{
+                grid-template-columns: 1fr;
+            }}
+            .stats-band {{
+                grid-template-columns: repeat(2, 1fr);
+            }}
+            .pf-name {{
+                font-size: 42px;
+            }}
+        }}
+        @media (max-width: 560px) {{
+            .pf-hero {{
+                padding: 24px;
+            }}
+            .pf-name {{
+                font-size: 34px;
+            }}
+            .stats-band {{
+                grid-template-columns: 1fr;
+            }}
+        }}
+{_hero_variant_css(hero_variants)}"""
+
+
+# Rules for the sections below the stats band.
+_SECTION_CSS = """\
+        .section {
+            padding: 44px 36px;
+        }
+        .section.alt {
+            background: #ffffff;
+        }
+        .section.tech-band {
+            background: #0d1b22;
+        }
+        .section.tech-band .section-head h2,
+        .section.tech-band .role-card h3 {
+            color: #ffffff;
+        }
+        .section.tech-band .section-head p,
+        .section.tech-band .role-card p {
+            color: #bfd0d6;
+        }
+        .section-head {
+            display: flex;
+            justify-content: space-between;
+            gap: 20px;
+            align-items: end;
+            margin-bottom: 22px;
+        }
+        .section-head h2 {
+            margin: 0;
+            font-size: 30px;
+            color: #111827;
+            letter-spacing: 0;
+        }
+        .section-head p {
+            margin: 0;
+            max-width: 540px;
+            color: #5d6a78;
+        }
+        .roles-grid {
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 14px;
+        }
+        .role-card, .project-card, .proof-item {
+            border: 1px solid #dce4eb;
+            border-radius: 8px;
+            background: #ffffff;
+            padding: 18px;
+        }
+        .role-card {
+            border-color: rgba(85, 230, 208, 0.22);
+            background: linear-gradient(180deg, rgba(85, 230, 208, 0.09), rgba(255, 255, 255, 0.04));
+        }
+        .role-card h3, .project-card h3, .proof-item h3 {
+            margin: 0 0 10px;
+            font-size: 18px;
+            color: #101820;
+        }
+        .role-card p, .project-card p, .proof-item p {
+            margin: 0;
+            color: #536271;
+        }
+        .evidence-grid {
+            display: grid;
+            grid-template-columns: minmax(0, 1.25fr) minmax(300px, 0.75fr);
+            gap: 18px;
+            align-items: start;
+        }
+        .timeline {
+            display: grid;
+            gap: 14px;
+        }
+        .timeline-item {
+            display: grid;
+            grid-template-columns: 0.42fr 1fr;
+            gap: 18px;
+            padding: 20px;
+            background: #ffffff;
+            border: 1px solid #dce4eb;
+            border-left: 5px solid #55e6d0;
+            border-radius: 8px;
+        }
+        .timeline-item span, .project-card span, .proof-item span {
+            color: #b36b18;
+            font-size: 13px;
+            font-weight: 800;
+        }
+        .timeline-item h3 {
+            margin: 6px 0 4px;
+            color: #111827;
+        }
+        .timeline-item p {
+            margin: 0;
+            color: #536271;
+        }
+        .timeline-item ul, .skills-panel ul, .cert-list {
+            margin: 0;
+            padding-left: 20px;
+        }
+        .timeline-item li, .skills-panel li, .cert-list li {
+            margin-bottom: 8px;
+            color: #374151;
+        }
+        .skills-panel {
+            padding: 22px;
+            border-radius: 8px;
+            background:
+                linear-gradient(180deg, rgba(85, 230, 208, 0.1), rgba(85, 230, 208, 0)),
+                #101820;
+            color: #ffffff;
+            border: 1px solid rgba(85, 230, 208, 0.24);
+        }
+        .skills-panel h3 {
+            margin: 0 0 14px;
+            color: #f4b35d;
+            font-size: 18px;
+        }
+        .skills-panel li {
+            color: #e5edf4;
+        }
+        .projects-grid, .proof-grid {
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            gap: 14px;
+        }
+        .project-card {
+            background: #f7f8fb;
+            display: flex;
+            flex-direction: column;
+            gap: 10px;
+        }
+        .project-link {
+            align-self: flex-start;
+            margin-top: auto;
+            color: #0b5964;
+            font-size: 13px;
+            font-weight: 850;
+            border-bottom: 2px solid #55e6d0;
+        }
+        .proof-wrap {
+            display: grid;
+            grid-template-columns: minmax(0, 1fr) minmax(280px, 0.72fr);
+            gap: 18px;
+        }
+        .proof-grid {
+            grid-template-columns: 1fr;
+        }
+        .cert-panel {
+            padding: 22px;
+            border-radius: 8px;
+            background: #fff7ed;
+            border: 1px solid #fed7aa;
+        }
+        .cert-panel h3 {
+            margin: 0 0 14px;
+            color: #7c3f10;
+        }
+        .closing-band {
+            padding: 32px 36px;
+            display: grid;
+            grid-template-columns: 1fr auto;
+            gap: 18px;
+            align-items: center;
+            color: #ffffff;
+            background:
+                linear-gradient(120deg, rgba(85, 230, 208, 0.12), rgba(244, 179, 93, 0.08)),
+                #0f2f35;
+            border-radius: 8px;
+            border: 1px solid rgba(85, 230, 208, 0.2);
+        }
+        .closing-band h2 {
+            margin: 0 0 6px;
+            font-size: 26px;
+        }
+        .closing-band p {
+            margin: 0;
+            color: #d6ebe7;
+        }
+        .language-line {
+            margin-top: 16px;
+            color: #42505f;
+            font-weight: 700;
+        }
+        @media (max-width: 900px) {
+            .evidence-grid,
+            .proof-wrap,
+            .closing-band {
+                grid-template-columns: 1fr;
+            }
+            .roles-grid,
+            .projects-grid {
+                grid-template-columns: repeat(2, 1fr);
+            }
+            .section-head {
+                display: block;
+            }
+            .timeline-item {
+                grid-template-columns: 1fr;
+            }
+        }
+        @media (max-width: 560px) {
+            .section,
+            .closing-band {
+                padding: 24px;
+            }
+            .roles-grid,
+            .projects-grid {
+                grid-template-columns: 1fr;
+            }
+        }
+"""
+# Lite pages skip layout and paint of sections until they near the viewport.
+_LAZY_SECTION_CSS = """\
+        .section, .closing-band {
+            content-visibility: auto;
+            contain-intrinsic-size: auto 900px;
+        }
+"""
+
+
+def build_portfolio_landing_html(
+    cv: dict,
+    hero_src: str | None = None,
+    compact: bool = False,
+    hero_variants: list[dict] | None = None,
+    lite: bool = False,
+) -> str:
+    landing_html = "".join(iter_portfolio_landing_html(cv, hero_src, hero_variants, lite))
+    return minify_html(landing_html) if compact else landing_html
+
+
+def iter_portfolio_landing_html(
+    cv: dict, hero_src: str | None = None, hero_variants: list[dict] | None = None, lite: bool = False
+) -> Iterator[str]:
+    """Yield the landing page in chunks; the hero data URI and each card are separate chunks.
+
+    ``hero_src`` is the hero URL (default: the image inlined as a data URI)
+    and ``hero_variants``, as from ``publish_hero_image``, are offered to
+    browsers that understand ``image-set``. ``lite`` pages inline only the
+    above-the-fold CSS up front and defer rendering of the sections below.
+    """
+    full_name = _e(cv.get("full_name", ""))
+    headline = _e(cv.get("headline", ""))
+    summary = _e(cv.get("profile_summary", ""))
+    location = _e(cv.get("location", ""))
+    email_val = _e(cv.get("email", ""))
+    phone = _e(cv.get("phone", ""))
+    linkedin = _e(cv.get("linkedin", ""))
+    github = _e(cv.get("github", ""))
+    hero_uri = hero_src if hero_src is not None else _asset_data_uri(HERO_IMAGE)
+
+    competencies = [_clean_text(item) for item in cv.get("core_competencies", [])]
+    experience = cv.get("experience", [])
+    education = cv.get("education", [])
+    certifications = cv.get("certifications", [])
+    projects = cv.get("projects", [])
+    languages = cv.get("languages", [])
+
+    role_cards = [
+        (
+            "IAM & Access Governance",
+            "Identity lifecycle, SSO, MFA, Active Directory, Entra ID concepts, OKTA, OCI IAM, access troubleshooting.",
+        ),
+        (
+            "Full-Stack Web Development",
+            "PHP/MySQL systems, Python and JavaScript tooling, dashboards, role-based workflows, and practical data management platforms.",
+        ),
+        (
+            "Cloud Architecture & DevOps",
+            "Oracle Cloud, AWS exposure, Kubernetes foundations, CI/CD awareness, infrastructure optimization, and automation.",
+        ),
+        (
+            "AI-Enabled Engineering",
+            "Local LLM integrations, FastAPI and Streamlit tools, AI-assisted code review, image captioning, and sentiment analysis.",
+        ),
+    ]
+    role_cards_html = "".join(
+        f"""
+        <article class='role-card'>
+            <h3>{_e(title)}</h3>
+            <p>{_e(body)}</p>
+        </article>
+        """
+        for title, body in role_cards
+    )
+
+    stats = [
+        ("4+ years", "IT service delivery across NGO operations"),
+        ("3 roles", "progressive growth at Plan International Kenya"),
+        (str(len(certifications)), "professional certifications and courses"),
+        (str(len(projects)), "portfolio projects and operational tools"),
+    ]
+    stats_html = "".join(
+        f"<div class='stat'><strong>{_e(value)}</strong><span>{_e(label)}</span></div>"
+        for value, label in stats
+    )
+
+    skills_html = "".join(f"<li>{_e(item)}</li>" for item in competencies[:8])
+
+    language_html = " | ".join(_e(item) for item in languages)
+    link_html = ""
+    if linkedin:
+        link_html += f"<a href='{linkedin}' target='_blank' rel='noreferrer'>LinkedIn</a>"
+    if github:
+        link_html += f"<a href='{github}' target='_blank' rel='noreferrer'>GitHub</a>"
+
+    yield "\n    <style>"
+    yield from _iter_critical_css(hero_uri, hero_variants or [])
+    if not lite:
+        yield _SECTION_CSS
+    yield f"""    </style>
+    <div class='pf-wrap'>
+        <nav class='site-nav'>
+            <a class='brand' href='#top'>
+                <span class='brand-mark'>BN</span>
+                <span>Boniface Ngila</span>
+            </a>
+            <div class='nav-links'>
+                <a href='#roles'>Roles</a>
+                <a href='#experience'>Experience</a>
+                <a href='#projects'>Projects</a>
+                <a href='#proof'>Proof</a>
+                <a href='mailto:{email_val}'>Contact</a>
+            </div>
+        </nav>
+        <div class='pf-hero'>
+            <div>
+                <p class='eyebrow'>Portfolio for IT, IAM, Cloud, Security, and Service Delivery Roles</p>
+                <h1 class='pf-name'>{full_name}</h1>
+                <h2 class='pf-headline'>{headline}</h2>
+                <p class='pf-summary'>{summary}</p>
+                <div class='pf-actions'>
+                    <a class='pf-button primary' href='mailto:{email_val}'>Contact Me</a>
+                    <a class='pf-button' href='{linkedin}' target='_blank' rel='noreferrer'>View LinkedIn</a>
+                    <a class='pf-button' href='{github}' target='_blank' rel='noreferrer'>View GitHub</a>
+                </div>
+            </div>
+            <div class='contact-panel'>
+                <div class='contact-box'>
+                    <span>Location</span>
+                    <p>{location}</p>
+                    <span>Phone</span>
+                    <p>{phone}</p>
+                    <span>Email</span>
+                    <p>{email_val}</p>
+                    <div class='contact-links'>{link_html}</div>
+                </div>
+            </div>
+        </div>
+
+        <div class='stats-band'>{stats_html}</div>
+"""
+    if lite:
+        # Section rules follow the above-the-fold markup so they do not hold up its first paint.
+        yield f"        <style>\n{_SECTION_CSS}{_LAZY_SECTION_CSS}        </style>\n"
+    yield f"""
+        <section class='section tech-band' id='roles'>
+            <div class='section-head'>
+                <h2>Role Fit</h2>
+                <p>Targeted strengths mapped from your CV, certifications, project work, and progressive IT experience.</p>
+            </div>
+            <div class='roles-grid'>{role_cards_html}</div>
+        </section>
+
+        <section class='section alt' id='experience'>
+            <div class='section-head'>
+                <h2>Experience Evidence</h2>
+                <p>Recent roles show delivery across infrastructure operations, access management, user support, governance, and service improvement.</p>
+            </div>
+            <div class='evidence-grid'>
+                <div class='timeline'>"""
+    yield from _experience_items(experience[:3])
+    yield f"""</div>
+                <aside class='skills-panel'>
+                    <h3>Core Capability Stack</h3>
+                    <ul>{skills_html}</ul>
+                </aside>
+            </div>
+        </section>
+
+        <section class='section' id='projects'>
+            <div class='section-head'>
+                <h2>Projects</h2>
+                <p>Practical builds and operational tools that show capacity to automate, report, document, and deliver usable systems.</p>
+            </div>
+            <div class='projects-grid'>"""
+    yield from _project_items(projects)
+    yield """</div>
+        </section>
+
+        <section class='section alt' id='proof'>
+            <div class='section-head'>
+                <h2>Academic & Professional Proof</h2>
+                <p>Formal education and certifications supporting technical breadth, security awareness, cloud capability, and ongoing growth.</p>
+            </div>
+            <div class='proof-wrap'>
+                <div class='proof-grid'>"""
+    yield from _education_items(education)
+    yield """</div>
+                <aside class='cert-panel'>
+                    <h3>Certifications & Courses</h3>
+                    <ul class='cert-list'>"""
+    yield from (f"<li>{_e(item)}</li>" for item in certifications)
+    yield f"""</ul>
+                    <p class='language-line'>Languages: {language_html}</p>
+                </aside>
+            </div>
+        </section>
+
+        <section class='closing-band'>
+            <div>
+                <h2>Available for roles where secure, reliable IT delivery matters.</h2>
+                <p>Best matched to IAM, IT operations, cloud support, service desk coordination, systems administration, and security-focused technology roles.</p>
+            </div>
+            <a class='pf-button primary' href='mailto:{email_val}'>Start a Conversation</a>
+        </section>
+    </div>
+    """
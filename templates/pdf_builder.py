@@ -1,13 +1,17 @@
+from collections import OrderedDict
 from io import BytesIO
+from threading import Lock
 
 from utils.pdf_helpers import (
-    REPORTLAB_AVAILABLE, colors, A4, pdfmetrics, canvas,
-    pdf_safe_text, wrap_pdf_text, draw_pdf_wrapped_text,
-    draw_pdf_section_title, safe_round_rect, ensure_pdf_space,
+    REPORTLAB_AVAILABLE, colors, A4, pdfmetrics,
+    pdf_safe_text, wrap_pdf_text, new_pdf_canvas, measure_text_widths, NullCanvas,
+    ColorToken, DisplayListCanvas, paint_display_list, pdf_output_profile,
+    draw_pdf_section_title, safe_round_rect,
     SECTION_ICON_SHAPES,
 )
 from utils.converters import normalize_education_record, normalize_project_record
 from templates.themes import normalize_template_name, get_pdf_theme
+from utils.artifact_store import HashingWriter, content_hash
 
 
 def _measure_wrapped_text_height(
@@ -19,9 +23,19 @@ def _measure_wrapped_text_height(
 ) -> int:
     if not str(text).strip():
         return 0
+    if _single_line_flags([text], font_name, font_size, max_width)[0]:
+        return leading
     return len(wrap_pdf_text(text, font_name, font_size, max_width)) * leading
 
 
+def _single_line_flags(values: list[str], font_name: str, font_size: int, max_width: float) -> list[bool]:
+    """Which values fit on one line, measured in a single batched pass."""
+    if not REPORTLAB_AVAILABLE:
+        return [False] * len(values)
+    safe_values = [pdf_safe_text(value) for value in values]
+    return [width <= max_width for width in measure_text_widths(safe_values, font_name, font_size)]
+
+
 def _draw_wrapped_lines(
     pdf,
     text: str,
@@ -73,18 +87,23 @@ def _measure_contact_blocks_height(
     block_gap: int = 6,
 ) -> int:
     total_height = 0
-    for index, (_, value) in enumerate(contact_fields):
+    values = [value for _, value in contact_fields]
+    single_line = _single_line_flags(values, "Helvetica", value_font_size, max_width)
+    for index, value in enumerate(values):
         total_height += label_font_size + 4
-        total_height += max(
-            value_leading,
-            _measure_wrapped_text_height(
-                value,
-                "Helvetica",
-                value_font_size,
-                max_width,
+        if single_line[index]:
+            total_height += value_leading
+        else:
+            total_height += max(
                 value_leading,
-            ),
-        )
+                _measure_wrapped_text_height(
+                    value,
+                    "Helvetica",
+                    value_font_size,
+                    max_width,
+                    value_leading,
+                ),
+            )
         if index < len(contact_fields) - 1:
             total_height += block_gap
     return total_height
@@ -124,39 +143,506 @@ def _draw_contact_blocks(
     return y
 
 
-def build_pdf(cv: dict, template: str) -> bytes:
-    if not REPORTLAB_AVAILABLE:
-        return b""
+# ---------------------------------------------------------------------------
+# Layout ops and pagination (shared by both builders)
+# ---------------------------------------------------------------------------
+
+OP_TITLE = 0
+OP_LINE = 1
+OP_GAP = 2
+OP_KEEP = 3
+OP_FONT = 4
+
+# Section titles reserve room for their first line but only advance by this.
+SECTION_TITLE_ADVANCE = 16
+
+
+class PdfOp:
+    """One laid-out unit of a column: a section title, a wrapped line or a gap.
+
+    The one-column flow also uses keep ops (start a new page unless ``height``
+    points remain) and font ops (set the font for the following lines).
+
+    Long CVs produce thousands of these, so they use slots and integer kinds
+    rather than per-line dicts.
+    """
+
+    __slots__ = ("kind", "height", "text", "font_name", "font_size")
+
+    def __init__(self, kind: int, height: int, text: str = "", font_name: str = "", font_size: int = 0) -> None:
+        self.kind = kind
+        self.height = height
+        self.text = text
+        self.font_name = font_name
+        self.font_size = font_size
+
+
+def _add_title_op(ops: list[PdfOp], title: str) -> None:
+    ops.append(PdfOp(OP_TITLE, 32, title))
+
+
+def _add_gap_op(ops: list[PdfOp], gap_size: int) -> None:
+    if gap_size > 0:
+        ops.append(PdfOp(OP_GAP, gap_size))
+
+
+def _scaled(value: int, scale: float) -> float:
+    return value if scale == 1 else round(value * scale, 2)
+
+
+def _add_text_ops(
+    ops: list[PdfOp],
+    text: str,
+    max_width: float,
+    font_name: str = "Helvetica",
+    font_size: int = 10,
+    leading: int = 13,
+    scale: float = 1.0,
+) -> None:
+    font_size, leading = _scaled(font_size, scale), _scaled(leading, scale)
+    ops.extend(
+        PdfOp(OP_LINE, leading, line, font_name, font_size)
+        for line in wrap_pdf_text(text, font_name, font_size, max_width)
+    )
+
+
+def _op_advance(op: PdfOp) -> int:
+    if op.kind == OP_TITLE:
+        return SECTION_TITLE_ADVANCE
+    if op.kind in (OP_KEEP, OP_FONT):
+        return 0
+    return op.height
+
+
+def _add_paragraph_ops(
+    ops: list[PdfOp],
+    text: str,
+    max_width: float,
+    font_name: str = "Helvetica",
+    font_size: int = 10,
+    leading: int = 13,
+    scale: float = 1.0,
+) -> None:
+    ops.append(PdfOp(OP_FONT, 0, "", font_name, _scaled(font_size, scale)))
+    _add_text_ops(ops, text, max_width, font_name=font_name, font_size=font_size, leading=leading, scale=scale)
+
+
+def _add_section_ops(ops: list[PdfOp], title: str, keep: int = 40) -> None:
+    ops.append(PdfOp(OP_KEEP, keep))
+    ops.append(PdfOp(OP_TITLE, SECTION_TITLE_ADVANCE, title))
+
+
+def _one_column_body_ops(cv: dict, content_width: float, scale: float = 1.0) -> list[PdfOp]:
+    ops: list[PdfOp] = []
+    _add_section_ops(ops, "Profile")
+    _add_paragraph_ops(ops, cv.get("profile_summary", ""), content_width, scale=scale)
+    _add_gap_op(ops, 6)
+
+    _add_section_ops(ops, "Core Competencies")
+    for item in cv.get("core_competencies") or []:
+        _add_paragraph_ops(ops, f"- {item}", content_width, scale=scale)
+    _add_gap_op(ops, 6)
+
+    _add_section_ops(ops, "Professional Experience")
+    for exp in cv.get("experience") or []:
+        ops.append(PdfOp(OP_KEEP, 28))
+        _add_paragraph_ops(
+            ops,
+            f"{exp.get('role', '')} - {exp.get('organization', '')} | {exp.get('period', '')}",
+            content_width, font_name="Helvetica-Bold", font_size=10, leading=13,
+            scale=scale,
+        )
+        for bullet in exp.get("bullets") or []:
+            _add_paragraph_ops(ops, f"  - {bullet}", content_width, scale=scale)
+        _add_gap_op(ops, 3)
+
+    _add_section_ops(ops, "Projects", keep=36)
+    for item in cv.get("projects") or []:
+        record = normalize_project_record(item)
+        name = record.get("name", "")
+        description = record.get("description", "")
+        technologies = record.get("technologies", "")
+        link = record.get("link", "")
+        if name:
+            _add_paragraph_ops(ops, name, content_width, font_name="Helvetica-Bold", font_size=10, leading=13, scale=scale)
+        if description:
+            _add_paragraph_ops(ops, f"  {description}", content_width, scale=scale)
+        if technologies:
+            _add_paragraph_ops(ops, f"  Technologies: {technologies}", content_width, font_name="Helvetica-Oblique", font_size=9, leading=12, scale=scale)
+        if link:
+            _add_paragraph_ops(ops, f"  {link}", content_width, font_name="Helvetica-Oblique", font_size=9, leading=12, scale=scale)
+        _add_gap_op(ops, 3)
+
+    _add_section_ops(ops, "Education")
+    for idx, item in enumerate(cv.get("education") or [], start=1):
+        record = normalize_education_record(item)
+        course = record.get("course", "")
+        institution = record.get("institution", "")
+        timeline = record.get("timeline", "")
+        line_parts = [part for part in [course, institution] if part]
+        if timeline:
+            line_parts.append(f"({timeline})")
+        entry_line = " - ".join(line_parts) if line_parts else ""
+        if entry_line:
+            entry_line = f"{idx}. {entry_line}"
+        _add_paragraph_ops(ops, entry_line, content_width, scale=scale)
+
+    _add_section_ops(ops, "Certifications")
+    for item in cv.get("certifications") or []:
+        _add_paragraph_ops(ops, f"- {item}", content_width, scale=scale)
+
+    _add_section_ops(ops, "Languages")
+    for item in cv.get("languages") or []:
+        _add_paragraph_ops(ops, f"- {item}", content_width, scale=scale)
+
+    _add_section_ops(ops, "Referees", keep=42)
+    for idx, ref in enumerate(cv.get("referees") or [], start=1):
+        _add_paragraph_ops(ops, _format_referee_line(ref, idx), content_width, scale=scale)
+    return ops
+
+
+def _paginate_flow(
+    ops: list[PdfOp], first_y: float, next_y: float, bottom: float,
+) -> tuple[list[tuple[int, float]], list[list[tuple[float, float]]]]:
+    """Place one-column flow ops on pages without drawing.
+
+    Lines break to a new page once the pen is below ``bottom``; keep ops
+    break when fewer than ``height`` points remain. Returns the ``(page, y)``
+    of every op and each page's ``(start_y, end_y)``.
+    """
+    positions: list[tuple[int, float]] = []
+    pages = [[(first_y, first_y)]]
+    page_start = y = first_y
+    for op in ops:
+        kind = op.kind
+        if (kind == OP_LINE and y < bottom) or (kind == OP_KEEP and y - op.height < bottom):
+            pages[-1] = [(page_start, y)]
+            pages.append([(next_y, next_y)])
+            page_start = y = next_y
+        positions.append((len(pages) - 1, y))
+        y -= _op_advance(op)
+    pages[-1] = [(page_start, y)]
+    return positions, pages
+
+
+def _paginate_columns(
+    columns: tuple[list[PdfOp], list[PdfOp]],
+    first_starts: tuple[float, float],
+    next_starts: tuple[float, float],
+    bottom: float,
+) -> tuple[list[list[tuple[int, float]]], list[list[tuple[float, float]]]]:
+    """Place two-column ops on pages without drawing.
+
+    Each page takes ops from both columns while they fit above ``bottom``.
+    If a continuation page cannot take anything, one op per column is
+    forced onto it so an oversized op cannot stall pagination. Returns the
+    ``(page, y)`` of every op per column and each page's per-column
+    ``(start_y, end_y)``.
+    """
+    positions: list[list[tuple[int, float]]] = [[] for _ in columns]
+    pages: list[list[tuple[float, float]]] = []
+    indexes = [0] * len(columns)
+    ys = list(first_starts)
+
+    def fill(page_index: int) -> None:
+        for column, ops in enumerate(columns):
+            y, index = ys[column], indexes[column]
+            while index < len(ops) and y - ops[index].height >= bottom:
+                positions[column].append((page_index, y))
+                y -= _op_advance(ops[index])
+                index += 1
+            ys[column], indexes[column] = y, index
+
+    while True:
+        page_index = len(pages)
+        starts = list(ys)
+        page_start_indexes = list(indexes)
+        fill(page_index)
+        if page_index and indexes == page_start_indexes:
+            for column, ops in enumerate(columns):
+                if indexes[column] < len(ops):
+                    positions[column].append((page_index, ys[column]))
+                    ys[column] -= _op_advance(ops[indexes[column]])
+                    indexes[column] += 1
+            fill(page_index)
+        pages.append(list(zip(starts, ys)))
+        if all(index >= len(ops) for index, ops in zip(indexes, columns)):
+            return positions, pages
+        ys = list(next_starts)
+
+
+def _layout_metrics(
+    columns: list[list[PdfOp]],
+    positions: list[list[tuple[int, float]]],
+    pages: list[list[tuple[float, float]]],
+    bottom: float,
+) -> dict:
+    page_fill = []
+    for page in pages:
+        fill = 0.0
+        for start_y, end_y in page:
+            if start_y > bottom:
+                fill = max(fill, (start_y - end_y) / (start_y - bottom))
+        page_fill.append(round(min(fill, 1.0), 3))
+
+    overflow_sections: list[str] = []
+    for ops, column_positions in zip(columns, positions):
+        section, section_page = None, 0
+        for op, (page_index, _) in zip(ops, column_positions):
+            if op.kind == OP_TITLE:
+                section, section_page = op.text, page_index
+            elif section and page_index > section_page and section not in overflow_sections:
+                overflow_sections.append(section)
+    return {"page_count": len(pages), "page_fill": page_fill, "overflow_sections": overflow_sections}
+
+
+# ---------------------------------------------------------------------------
+# Palettes and display lists
+# ---------------------------------------------------------------------------
+
+def _one_column_palette(theme: dict) -> dict:
+    """Every colour the one-column layout paints with, theme defaults applied."""
+    layout_style = theme.get("layout", "classic_hero")
+    hero_strip = theme.get("hero_strip", colors.HexColor("#2563eb"))
+    border = theme.get("border", colors.HexColor("#1d4ed8"))
+    return {
+        "background": theme.get("background", colors.HexColor("#030712")),
+        "hero_background": theme.get("hero_background", colors.HexColor("#102a43")),
+        "hero_accent": theme.get("hero_accent", colors.HexColor("#1e3a8a")),
+        "hero_text": theme.get("hero_text", colors.white),
+        "text_color": theme.get("text_color", colors.HexColor("#e2e8f0")),
+        "link_color": theme.get("link_color", hero_strip),
+        "panel_primary": theme.get("panel_primary", colors.HexColor("#0f172a")),
+        "border": border,
+        "frame_strip": theme.get("hero_strip", colors.HexColor("#1e3a5f")),
+        "section_title_color": theme.get(
+            "section_title_color",
+            colors.HexColor("#1E3A5F") if layout_style == "minimal_clean" else hero_strip,
+        ),
+        "section_line_color": theme.get(
+            "section_line_color",
+            colors.HexColor("#BFD7ED") if layout_style == "minimal_clean" else border,
+        ),
+    }
+
+
+def _two_column_palette(theme: dict) -> dict:
+    """Every colour the two-column layout paints with, theme defaults applied."""
+    text_color = theme.get("text_color", colors.black)
+    panel_secondary = theme.get("panel_secondary", colors.HexColor("#eef2ff"))
+    panel_border = theme.get("panel_border", colors.HexColor("#d6e3f2"))
+    section_title_color = theme.get("section_title_color", colors.HexColor("#1E3A5F"))
+    section_line_color = theme.get("section_line_color", colors.HexColor("#BFD7ED"))
+    return {
+        "background": theme.get("background", colors.HexColor("#030712")),
+        "hero_background": theme.get("hero_background", colors.HexColor("#0f172a")),
+        "hero_accent": theme.get("hero_accent", colors.HexColor("#1e3a8a")),
+        "hero_strip": theme.get("hero_strip", colors.HexColor("#2563eb")),
+        "panel_primary": theme.get("panel_primary", colors.HexColor("#f8fafc")),
+        "panel_secondary": panel_secondary,
+        "panel_border": panel_border,
+        "hero_text": theme.get("hero_text", colors.white),
+        "text_color": text_color,
+        "section_title_color": section_title_color,
+        "section_line_color": section_line_color,
+        "sidebar_text_color": theme.get("sidebar_text_color", text_color),
+        "sidebar_section_title_color": theme.get("sidebar_section_title_color", section_title_color),
+        "sidebar_section_line_color": theme.get("sidebar_section_line_color", section_line_color),
+        "sidebar_background": theme.get("sidebar_background", panel_secondary),
+        "sidebar_border": theme.get("sidebar_border", panel_border),
+        "contact_box_border": colors.HexColor("#7da0c4"),
+    }
+
+
+# Display lists depend on the CV and the theme's geometry but not on its
+# colours, so every theme sharing a layout repaints from one cached entry.
+DISPLAY_LIST_CACHE_SIZE = 32
+_DISPLAY_LISTS: OrderedDict = OrderedDict()
+_DISPLAY_LIST_LOCK = Lock()
+_DISPLAY_LIST_STATS = {"hits": 0, "misses": 0}
+
+
+def _theme_geometry(theme: dict) -> tuple:
+    return tuple(sorted((key, value) for key, value in theme.items() if not isinstance(value, colors.Color)))
+
+
+def display_list_cache_info() -> dict:
+    with _DISPLAY_LIST_LOCK:
+        hits, misses = _DISPLAY_LIST_STATS["hits"], _DISPLAY_LIST_STATS["misses"]
+        size = len(_DISPLAY_LISTS)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "size": size,
+        "max_size": DISPLAY_LIST_CACHE_SIZE,
+        "hit_rate": hits / lookups if lookups else 0.0,
+    }
+
+
+def clear_display_list_cache() -> None:
+    with _DISPLAY_LIST_LOCK:
+        _DISPLAY_LISTS.clear()
+        _DISPLAY_LIST_STATS.update(hits=0, misses=0)
+
+
+def _display_list(cv: dict, theme: dict, layout, palette_fn) -> DisplayListCanvas:
+    """Recorded drawing commands for ``cv`` laid out with ``theme``, colours left symbolic."""
+    key = (layout.__name__, content_hash(cv), theme.get("layout"), _theme_geometry(theme))
+    with _DISPLAY_LIST_LOCK:
+        recorder = _DISPLAY_LISTS.get(key)
+        if recorder is not None:
+            _DISPLAY_LISTS.move_to_end(key)
+            _DISPLAY_LIST_STATS["hits"] += 1
+            return recorder
+        _DISPLAY_LIST_STATS["misses"] += 1
+
+    recorder = DisplayListCanvas()
+    tokens = {name: ColorToken(name) for name in palette_fn(theme)}
+    layout(cv, theme, recorder, palette=tokens)
+    with _DISPLAY_LIST_LOCK:
+        _DISPLAY_LISTS[key] = recorder
+        while len(_DISPLAY_LISTS) > DISPLAY_LIST_CACHE_SIZE:
+            _DISPLAY_LISTS.popitem(last=False)
+    return recorder
+
+
+def _paint_pdf(cv: dict, theme: dict, layout, palette_fn, sink, deterministic: bool, compact: bool) -> None:
+    display_list = _display_list(cv, theme, layout, palette_fn)
+    with pdf_output_profile(compact):
+        pdf = new_pdf_canvas(sink, cv, deterministic=deterministic, compact=compact)
+        paint_display_list(
+            display_list.pages, display_list.forms, pdf, palette_fn(theme), display_list.form_uses, compact=compact
+        )
+        pdf.save()
+
+
+def _render_pdf(cv: dict, theme: dict, layout, palette_fn, deterministic: bool, compact: bool = False) -> bytes:
+    buffer = BytesIO()
+    _paint_pdf(cv, theme, layout, palette_fn, buffer, deterministic, compact)
+    return buffer.getvalue()
+
+
+def _pdf_renderer(template: str) -> tuple[dict, object, object]:
     normalized_template = normalize_template_name(template)
     theme = get_pdf_theme(normalized_template)
     if "Two Column" in normalized_template:
-        return build_pdf_two_column(cv, theme)
-    return build_pdf_one_column(cv, theme)
+        return theme, _layout_two_column, _two_column_palette
+    return theme, _layout_one_column, _one_column_palette
+
 
+def build_pdf(
+    cv: dict, template: str, deterministic: bool = False, compact: bool = False, fit_pages: int | None = None
+) -> bytes:
+    """Render ``cv`` as a PDF; ``compact`` trades ReportLab's defaults for a smaller file.
 
-def build_pdf_one_column(cv: dict, theme: dict | None = None) -> bytes:
+    ``fit_pages`` shrinks the body text, down to ``MIN_TEXT_SCALE``, until the
+    CV fits on that many pages.
+    """
+    if not REPORTLAB_AVAILABLE:
+        return b""
+    theme, layout, palette_fn = _pdf_renderer(template)
+    if fit_pages:
+        theme = _fit_theme(cv, theme, layout, fit_pages)
+    return _render_pdf(cv, theme, layout, palette_fn, deterministic, compact)
+
+
+def write_pdf(
+    cv: dict, template: str, sink, deterministic: bool = False, compact: bool = False, fit_pages: int | None = None
+) -> dict:
+    """Render ``cv`` as a PDF straight into the binary ``sink``.
+
+    Options are as for ``build_pdf``. Returns the ``size`` and SHA-256
+    ``digest`` of what was written.
+    """
+    writer = HashingWriter(sink)
+    if REPORTLAB_AVAILABLE:
+        theme, layout, palette_fn = _pdf_renderer(template)
+        if fit_pages:
+            theme = _fit_theme(cv, theme, layout, fit_pages)
+        _paint_pdf(cv, theme, layout, palette_fn, writer, deterministic, compact)
+    return writer.metadata()
+
+
+def measure_pdf_layout(cv: dict, template: str) -> dict:
+    """Paginate ``cv`` for ``template`` without drawing or serialising a PDF.
+
+    Returns ``page_count``, ``page_fill`` (share of each page's content area
+    used, 0-1) and ``overflow_sections`` (sections continued onto a later
+    page).
+    """
+    if not REPORTLAB_AVAILABLE:
+        return {"page_count": 0, "page_fill": [], "overflow_sections": []}
+    theme, layout, _ = _pdf_renderer(template)
+    return layout(cv, theme)
+
+
+# Body text is never shrunk below this share of its designed size.
+MIN_TEXT_SCALE = 0.75
+
+
+def _fit_theme(cv: dict, theme: dict, layout, max_pages: int) -> dict:
+    """Return ``theme`` with the largest ``text_scale`` that fits ``max_pages``.
+
+    Binary-searches whole percentages with the layout-only pass, so only the
+    winning scale is ever painted. Falls back to ``MIN_TEXT_SCALE`` when even
+    that overflows; text is never enlarged.
+    """
+    def fits(percent: int) -> bool:
+        return layout(cv, {**theme, "text_scale": percent / 100})["page_count"] <= max_pages
+
+    if fits(100):
+        return theme
+    low, high = round(MIN_TEXT_SCALE * 100), 100
+    if fits(low):
+        # Invariant: ``low`` fits and ``high`` does not.
+        while high - low > 1:
+            middle = (low + high) // 2
+            if fits(middle):
+                low = middle
+            else:
+                high = middle
+    return {**theme, "text_scale": low / 100}
+
+
+def fit_text_scale(cv: dict, template: str, max_pages: int) -> float:
+    """Body-text scale ``build_pdf(..., fit_pages=max_pages)`` would use."""
+    if not REPORTLAB_AVAILABLE:
+        return 1.0
+    theme, layout, _ = _pdf_renderer(template)
+    return _fit_theme(cv, theme, layout, max_pages).get("text_scale", 1.0)
+
+
+def build_pdf_one_column(
+    cv: dict, theme: dict | None = None, deterministic: bool = False, compact: bool = False
+) -> bytes:
     if not REPORTLAB_AVAILABLE:
         return b""
     theme = theme or get_pdf_theme("One Column - Minimal")
-    background = theme.get("background", colors.HexColor("#030712"))
-    hero_background = theme.get("hero_background", colors.HexColor("#102a43"))
-    hero_accent = theme.get("hero_accent", colors.HexColor("#1e3a8a"))
-    hero_strip = theme.get("hero_strip", colors.HexColor("#2563eb"))
-    hero_text_color = theme.get("hero_text", colors.white)
-    text_color = theme.get("text_color", colors.HexColor("#e2e8f0"))
-    link_color = theme.get("link_color", hero_strip)
-    panel_primary = theme.get("panel_primary", colors.HexColor("#0f172a"))
-    panel_secondary = theme.get("panel_secondary", colors.HexColor("#0f172a"))
-    border_color = theme.get("border", colors.HexColor("#1d4ed8"))
+    return _render_pdf(cv, theme, _layout_one_column, _one_column_palette, deterministic, compact)
+
+
+def _layout_one_column(cv: dict, theme: dict | None, target=None, palette: dict | None = None) -> dict:
+    """Lay out and paginate the one-column CV, recording onto ``target`` when given.
+
+    ``target`` is a DisplayListCanvas. Colours come from ``palette`` (see
+    ``_one_column_palette``), which may hold ColorTokens when recording a
+    display list. Returns the page metrics; without a target nothing is drawn.
+    """
+    theme = theme or get_pdf_theme("One Column - Minimal")
+    palette = palette or _one_column_palette(theme)
+    background = palette["background"]
+    hero_background = palette["hero_background"]
+    hero_accent = palette["hero_accent"]
+    hero_text_color = palette["hero_text"]
+    text_color = palette["text_color"]
+    link_color = palette["link_color"]
+    panel_primary = palette["panel_primary"]
+    border_color = palette["border"]
+    frame_strip = palette["frame_strip"]
+    section_title_color = palette["section_title_color"]
+    section_line_color = palette["section_line_color"]
     layout_style = theme.get("layout", "classic_hero")
-    section_title_color = theme.get(
-        "section_title_color",
-        colors.HexColor("#1E3A5F") if layout_style == "minimal_clean" else theme.get("hero_strip", colors.HexColor("#2563eb")),
-    )
-    section_line_color = theme.get(
-        "section_line_color",
-        colors.HexColor("#BFD7ED") if layout_style == "minimal_clean" else border_color,
-    )
     header_min_height = theme.get("header_min_height", 126)
     header_name_font_size = theme.get("header_name_font_size", 22)
     header_headline_font_size = theme.get("header_headline_font_size", 12)
@@ -166,22 +652,23 @@ def build_pdf_one_column(cv: dict, theme: dict | None = None) -> bytes:
     header_meta_ratio = min(max(theme.get("header_meta_ratio", 0.34), 0.26), 0.4)
     contact_fields = _build_contact_fields(cv)
 
-    buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=A4)
+    # The page chrome closures below draw onto ``pdf``. It starts as a null
+    # canvas so header and continuation geometry can be taken without
+    # drawing, and is rebound to ``target`` for the paint pass.
+    pdf = NullCanvas()
     width, height = A4
     left = 28
     right = width - 28
     content_width = right - left
     top = height - 34
     bottom = 28
-    y = top
-    on_new_page_callback = None
 
     if layout_style == "minimal_clean":
         def draw_minimal_frame() -> None:
+            # Two plain rects are cheaper inline than as a form.
             pdf.setFillColor(background)
             pdf.rect(0, 0, width, height, fill=1, stroke=0)
-            pdf.setFillColor(theme.get("hero_strip", colors.HexColor("#1e3a5f")))
+            pdf.setFillColor(frame_strip)
             pdf.rect(left - 18, 0, 4, height, fill=1, stroke=0)
 
         def on_minimal_new_page() -> float:
@@ -189,50 +676,55 @@ def build_pdf_one_column(cv: dict, theme: dict | None = None) -> bytes:
             pdf.setFillColor(text_color)
             return top - 6
 
-        draw_minimal_frame()
-        header_width = content_width - 8
-        y = _draw_wrapped_lines(
-            pdf,
-            cv.get("full_name", ""),
-            left,
-            y,
-            header_width,
-            "Helvetica-Bold",
-            header_name_font_size,
-            header_name_font_size + 4,
-            fill_color=hero_text_color,
-        )
-        y -= 4
-        y = _draw_wrapped_lines(
-            pdf,
-            cv.get("headline", ""),
-            left,
-            y,
-            header_width,
-            "Helvetica",
-            header_headline_font_size,
-            header_headline_font_size + 4,
-            fill_color=hero_text_color,
-        )
-        if contact_fields:
-            y -= 10
-            y = _draw_contact_blocks(
+        def draw_header() -> float:
+            draw_minimal_frame()
+            y = top
+            header_width = content_width - 8
+            y = _draw_wrapped_lines(
                 pdf,
-                contact_fields,
+                cv.get("full_name", ""),
                 left,
                 y,
                 header_width,
-                header_contact_label_font_size,
-                header_contact_font_size,
-                header_contact_leading,
-                theme.get("hero_strip", colors.HexColor("#1e3a5f")),
-                text_color,
+                "Helvetica-Bold",
+                header_name_font_size,
+                header_name_font_size + 4,
+                fill_color=hero_text_color,
             )
-            y -= 6
-        pdf.setFillColor(text_color)
-        on_new_page_callback = on_minimal_new_page
+            y -= 4
+            y = _draw_wrapped_lines(
+                pdf,
+                cv.get("headline", ""),
+                left,
+                y,
+                header_width,
+                "Helvetica",
+                header_headline_font_size,
+                header_headline_font_size + 4,
+                fill_color=hero_text_color,
+            )
+            if contact_fields:
+                y -= 10
+                y = _draw_contact_blocks(
+                    pdf,
+                    contact_fields,
+                    left,
+                    y,
+                    header_width,
+                    header_contact_label_font_size,
+                    header_contact_font_size,
+                    header_contact_leading,
+                    frame_strip,
+                    text_color,
+                )
+                y -= 6
+            pdf.setFillColor(text_color)
+            return y
+
+        on_new_page = on_minimal_new_page
     else:
         def on_classic_new_page() -> float:
+            pdf.begin_form(("page_chrome",))
             pdf.setFillColor(background)
             pdf.rect(0, 0, width, height, fill=1, stroke=0)
 
@@ -249,191 +741,123 @@ def build_pdf_one_column(cv: dict, theme: dict | None = None) -> bytes:
             pdf.setStrokeColor(border_color)
             pdf.setLineWidth(1)
             pdf.rect(left - 12, bottom - 6, content_width + 24, y_start - bottom + 24, fill=0, stroke=1)
+            pdf.end_form()
             pdf.setFillColor(text_color)
             return y_start - 8
 
-        pdf.setFillColor(background)
-        pdf.rect(0, 0, width, height, fill=1, stroke=0)
-        meta_width = min(max(content_width * header_meta_ratio, 150), content_width * 0.42)
-        left_header_width = content_width - meta_width - 24
-        name_leading = header_name_font_size + 4
-        headline_leading = header_headline_font_size + 4
-        left_header_height = _measure_wrapped_text_height(
-            cv.get("full_name", ""),
-            "Helvetica-Bold",
-            header_name_font_size,
-            left_header_width,
-            name_leading,
-        )
-        if str(cv.get("headline", "")).strip():
-            left_header_height += 6 + _measure_wrapped_text_height(
+        def draw_header() -> float:
+            pdf.setFillColor(background)
+            pdf.rect(0, 0, width, height, fill=1, stroke=0)
+            meta_width = min(max(content_width * header_meta_ratio, 150), content_width * 0.42)
+            left_header_width = content_width - meta_width - 24
+            name_leading = header_name_font_size + 4
+            headline_leading = header_headline_font_size + 4
+            left_header_height = _measure_wrapped_text_height(
+                cv.get("full_name", ""),
+                "Helvetica-Bold",
+                header_name_font_size,
+                left_header_width,
+                name_leading,
+            )
+            if str(cv.get("headline", "")).strip():
+                left_header_height += 6 + _measure_wrapped_text_height(
+                    cv.get("headline", ""),
+                    "Helvetica",
+                    header_headline_font_size,
+                    left_header_width,
+                    headline_leading,
+                )
+            meta_header_height = _measure_contact_blocks_height(
+                contact_fields,
+                meta_width,
+                header_contact_label_font_size,
+                header_contact_font_size,
+                header_contact_leading,
+            )
+            hero_height = max(header_min_height, max(left_header_height, meta_header_height) + 36)
+            hero_bottom = top - hero_height
+            pdf.setFillColor(hero_background)
+            safe_round_rect(pdf, left - 16, hero_bottom - 8, content_width + 32, hero_height + 16, 20, fill=1, stroke=0)
+            pdf.setFillColor(hero_accent)
+            accent_height = min(max(left_header_height + 18, 42), hero_height * 0.6)
+            accent_y = hero_bottom + ((hero_height - accent_height) / 2)
+            pdf.rect(left, accent_y, min(content_width * 0.68, left_header_width + 22), accent_height, fill=1, stroke=0)
+            text_y = hero_bottom + hero_height - 24
+            text_y = _draw_wrapped_lines(
+                pdf,
+                cv.get("full_name", ""),
+                left + 8,
+                text_y,
+                left_header_width,
+                "Helvetica-Bold",
+                header_name_font_size,
+                name_leading,
+                fill_color=hero_text_color,
+            )
+            text_y -= 6
+            _draw_wrapped_lines(
+                pdf,
                 cv.get("headline", ""),
+                left + 8,
+                text_y,
+                left_header_width,
                 "Helvetica",
                 header_headline_font_size,
-                left_header_width,
                 headline_leading,
+                fill_color=hero_text_color,
             )
-        meta_header_height = _measure_contact_blocks_height(
-            contact_fields,
-            meta_width,
-            header_contact_label_font_size,
-            header_contact_font_size,
-            header_contact_leading,
-        )
-        hero_height = max(header_min_height, max(left_header_height, meta_header_height) + 36)
-        hero_bottom = y - hero_height
-        pdf.setFillColor(hero_background)
-        safe_round_rect(pdf, left - 16, hero_bottom - 8, content_width + 32, hero_height + 16, 20, fill=1, stroke=0)
-        pdf.setFillColor(hero_accent)
-        accent_height = min(max(left_header_height + 18, 42), hero_height * 0.6)
-        accent_y = hero_bottom + ((hero_height - accent_height) / 2)
-        pdf.rect(left, accent_y, min(content_width * 0.68, left_header_width + 22), accent_height, fill=1, stroke=0)
-        text_y = hero_bottom + hero_height - 24
-        text_y = _draw_wrapped_lines(
-            pdf,
-            cv.get("full_name", ""),
-            left + 8,
-            text_y,
-            left_header_width,
-            "Helvetica-Bold",
-            header_name_font_size,
-            name_leading,
-            fill_color=hero_text_color,
-        )
-        text_y -= 6
-        _draw_wrapped_lines(
-            pdf,
-            cv.get("headline", ""),
-            left + 8,
-            text_y,
-            left_header_width,
-            "Helvetica",
-            header_headline_font_size,
-            headline_leading,
-            fill_color=hero_text_color,
-        )
-        _draw_contact_blocks(
-            pdf,
-            contact_fields,
-            right - meta_width,
-            hero_bottom + hero_height - 18,
-            meta_width,
-            header_contact_label_font_size,
-            header_contact_font_size,
-            header_contact_leading,
-            link_color,
-            hero_text_color,
-        )
-        y = hero_bottom - 18
-        pdf.setFillColor(panel_primary)
-        pdf.rect(left - 12, bottom - 6, content_width + 24, y - bottom + 24, fill=1, stroke=0)
-        pdf.setStrokeColor(border_color)
-        pdf.setLineWidth(1)
-        pdf.rect(left - 12, bottom - 6, content_width + 24, y - bottom + 24, fill=0, stroke=1)
-        y -= 12
-        pdf.setFillColor(text_color)
-        on_new_page_callback = on_classic_new_page
-
-    def _draw_section(title, items_fn):
-        nonlocal y
-        y = ensure_pdf_space(pdf, y, 40, bottom, top, on_new_page=on_new_page_callback)
-        y = draw_pdf_section_title(pdf, title, left, y, title_color=section_title_color, line_color=section_line_color)
-        pdf.setFillColor(text_color)
-        items_fn()
-
-    def _profile():
-        nonlocal y
-        y = draw_pdf_wrapped_text(pdf, cv.get("profile_summary", ""), left, y, content_width, bottom, top, on_new_page=on_new_page_callback)
-        y -= 6
-
-    def _competencies():
-        nonlocal y
-        for item in cv.get("core_competencies") or []:
-            y = draw_pdf_wrapped_text(pdf, f"- {item}", left, y, content_width, bottom, top, on_new_page=on_new_page_callback)
-        y -= 6
-
-    def _experience():
-        nonlocal y
-        for exp in cv.get("experience") or []:
-            y = ensure_pdf_space(pdf, y, 28, bottom, top, on_new_page=on_new_page_callback)
-            y = draw_pdf_wrapped_text(
+            _draw_contact_blocks(
                 pdf,
-                f"{exp.get('role', '')} - {exp.get('organization', '')} | {exp.get('period', '')}",
-                left, y, content_width, bottom, top,
-                font_name="Helvetica-Bold", font_size=10, leading=13,
-                on_new_page=on_new_page_callback,
+                contact_fields,
+                right - meta_width,
+                hero_bottom + hero_height - 18,
+                meta_width,
+                header_contact_label_font_size,
+                header_contact_font_size,
+                header_contact_leading,
+                link_color,
+                hero_text_color,
             )
-            for bullet in exp.get("bullets") or []:
-                y = draw_pdf_wrapped_text(pdf, f"  - {bullet}", left, y, content_width, bottom, top, on_new_page=on_new_page_callback)
-            y -= 3
-
-    def _projects():
-        nonlocal y
-        for item in cv.get("projects") or []:
-            record = normalize_project_record(item)
-            name = record.get("name", "")
-            description = record.get("description", "")
-            technologies = record.get("technologies", "")
-            link = record.get("link", "")
-            if name:
-                y = draw_pdf_wrapped_text(pdf, name, left, y, content_width, bottom, top, font_name="Helvetica-Bold", font_size=10, leading=13, on_new_page=on_new_page_callback)
-            if description:
-                y = draw_pdf_wrapped_text(pdf, f"  {description}", left, y, content_width, bottom, top, on_new_page=on_new_page_callback)
-            if technologies:
-                y = draw_pdf_wrapped_text(pdf, f"  Technologies: {technologies}", left, y, content_width, bottom, top, font_name="Helvetica-Oblique", font_size=9, leading=12, on_new_page=on_new_page_callback)
-            if link:
-                y = draw_pdf_wrapped_text(pdf, f"  {link}", left, y, content_width, bottom, top, font_name="Helvetica-Oblique", font_size=9, leading=12, on_new_page=on_new_page_callback)
-            y -= 3
-
-    def _education():
-        nonlocal y
-        for idx, item in enumerate(cv.get("education") or [], start=1):
-            record = normalize_education_record(item)
-            course = record.get("course", "")
-            institution = record.get("institution", "")
-            timeline = record.get("timeline", "")
-            line_parts = [part for part in [course, institution] if part]
-            if timeline:
-                line_parts.append(f"({timeline})")
-            entry_line = " - ".join(line_parts) if line_parts else ""
-            if entry_line:
-                entry_line = f"{idx}. {entry_line}"
-            y = draw_pdf_wrapped_text(pdf, entry_line, left, y, content_width, bottom, top, on_new_page=on_new_page_callback)
-
-    def _certifications():
-        nonlocal y
-        for item in cv.get("certifications") or []:
-            y = draw_pdf_wrapped_text(pdf, f"- {item}", left, y, content_width, bottom, top, on_new_page=on_new_page_callback)
-
-    def _languages():
-        nonlocal y
-        for item in cv.get("languages") or []:
-            y = draw_pdf_wrapped_text(pdf, f"- {item}", left, y, content_width, bottom, top, on_new_page=on_new_page_callback)
-
-    def _referees():
-        nonlocal y
-        for idx, ref in enumerate(cv.get("referees") or [], start=1):
-            full_line = _format_referee_line(ref, idx)
-            y = draw_pdf_wrapped_text(pdf, full_line, left, y, content_width, bottom, top, on_new_page=on_new_page_callback)
-
-    _draw_section("Profile", _profile)
-    _draw_section("Core Competencies", _competencies)
-    _draw_section("Professional Experience", _experience)
-    y = ensure_pdf_space(pdf, y, 36, bottom, top, on_new_page=on_new_page_callback)
-    y = draw_pdf_section_title(pdf, "Projects", left, y, title_color=section_title_color, line_color=section_line_color)
-    pdf.setFillColor(text_color)
-    _projects()
-    _draw_section("Education", _education)
-    _draw_section("Certifications", _certifications)
-    _draw_section("Languages", _languages)
-    y = ensure_pdf_space(pdf, y, 42, bottom, top, on_new_page=on_new_page_callback)
-    y = draw_pdf_section_title(pdf, "Referees", left, y, title_color=section_title_color, line_color=section_line_color)
-    pdf.setFillColor(text_color)
-    _referees()
-
-    pdf.save()
-    buffer.seek(0)
-    return buffer.getvalue()
+            y = hero_bottom - 18
+            pdf.setFillColor(panel_primary)
+            pdf.rect(left - 12, bottom - 6, content_width + 24, y - bottom + 24, fill=1, stroke=0)
+            pdf.setStrokeColor(border_color)
+            pdf.setLineWidth(1)
+            pdf.rect(left - 12, bottom - 6, content_width + 24, y - bottom + 24, fill=0, stroke=1)
+            y -= 12
+            pdf.setFillColor(text_color)
+            return y
+
+        on_new_page = on_classic_new_page
+
+    ops = _one_column_body_ops(cv, content_width, theme.get("text_scale", 1.0))
+    first_y = draw_header()
+    next_y = on_new_page()
+    positions, pages = _paginate_flow(ops, first_y, next_y, bottom)
+    metrics = _layout_metrics([ops], [positions], pages, bottom)
+    if target is None:
+        return metrics
+
+    pdf = target
+    draw_header()
+    page_index = 0
+    font = ("Helvetica", 10)
+    for op, (op_page, op_y) in zip(ops, positions):
+        if op_page != page_index:
+            pdf.showPage()
+            on_new_page()
+            page_index = op_page
+            if op.kind == OP_LINE:
+                pdf.setFont(*font)
+        if op.kind == OP_LINE:
+            pdf.drawString(left, op_y, op.text)
+        elif op.kind == OP_FONT:
+            font = (op.font_name, op.font_size)
+            pdf.setFont(*font)
+        elif op.kind == OP_TITLE:
+            draw_pdf_section_title(pdf, op.text, left, op_y, title_color=section_title_color, line_color=section_line_color)
+            pdf.setFillColor(text_color)
+    return metrics
 
 
 def _format_referee_line(ref: dict, idx: int) -> str:
@@ -456,7 +880,7 @@ def _format_referee_line(ref: dict, idx: int) -> str:
     return full_line
 
 
-def _build_referee_ops(cv: dict, target_ops: list[dict], column_width: float) -> None:
+def _build_referee_ops(cv: dict, target_ops: list[PdfOp], column_width: float, scale: float = 1.0) -> None:
     """Shared referee ops builder to eliminate duplication between layouts."""
     for ref in cv.get("referees") or []:
         name = ref.get("name", "")
@@ -476,30 +900,44 @@ def _build_referee_ops(cv: dict, target_ops: list[dict], column_width: float) ->
         if contact_line:
             text = f"{text} | {contact_line}" if text else contact_line
         if text:
-            _add_text_ops(target_ops, f"- {text}", column_width, font_name="Helvetica", font_size=9, leading=12)
+            _add_text_ops(target_ops, f"- {text}", column_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
 
 
-def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
+def build_pdf_two_column(
+    cv: dict, theme: dict | None = None, deterministic: bool = False, compact: bool = False
+) -> bytes:
     if not REPORTLAB_AVAILABLE:
         return b""
     theme = theme or get_pdf_theme("Two Column - Professional")
-    background = theme.get("background", colors.HexColor("#030712"))
-    hero_background = theme.get("hero_background", colors.HexColor("#0f172a"))
-    hero_accent = theme.get("hero_accent", colors.HexColor("#1e3a8a"))
-    hero_strip = theme.get("hero_strip", colors.HexColor("#2563eb"))
-    panel_primary = theme.get("panel_primary", colors.HexColor("#f8fafc"))
-    panel_secondary = theme.get("panel_secondary", colors.HexColor("#eef2ff"))
-    panel_border = theme.get("panel_border", colors.HexColor("#d6e3f2"))
-    hero_text_color = theme.get("hero_text", colors.white)
-    text_color = theme.get("text_color", colors.black)
+    return _render_pdf(cv, theme, _layout_two_column, _two_column_palette, deterministic, compact)
+
+
+def _layout_two_column(cv: dict, theme: dict | None, target=None, palette: dict | None = None) -> dict:
+    """Lay out and paginate the two-column CV, recording onto ``target`` when given.
+
+    Colours come from ``palette`` as in ``_layout_one_column``. Returns the
+    page metrics; without a target nothing is drawn.
+    """
+    theme = theme or get_pdf_theme("Two Column - Professional")
+    palette = palette or _two_column_palette(theme)
+    background = palette["background"]
+    hero_background = palette["hero_background"]
+    hero_accent = palette["hero_accent"]
+    hero_strip = palette["hero_strip"]
+    panel_primary = palette["panel_primary"]
+    panel_secondary = palette["panel_secondary"]
+    panel_border = palette["panel_border"]
+    hero_text_color = palette["hero_text"]
+    text_color = palette["text_color"]
+    section_title_color = palette["section_title_color"]
+    section_line_color = palette["section_line_color"]
+    sidebar_text_color = palette["sidebar_text_color"]
+    sidebar_section_title_color = palette["sidebar_section_title_color"]
+    sidebar_section_line_color = palette["sidebar_section_line_color"]
+    sidebar_background = palette["sidebar_background"]
+    sidebar_border = palette["sidebar_border"]
+    contact_box_border = palette["contact_box_border"]
     layout_style = theme.get("layout", "modern_header")
-    section_title_color = theme.get("section_title_color", colors.HexColor("#1E3A5F"))
-    section_line_color = theme.get("section_line_color", colors.HexColor("#BFD7ED"))
-    sidebar_text_color = theme.get("sidebar_text_color", text_color)
-    sidebar_section_title_color = theme.get("sidebar_section_title_color", section_title_color)
-    sidebar_section_line_color = theme.get("sidebar_section_line_color", section_line_color)
-    sidebar_background = theme.get("sidebar_background", panel_secondary)
-    sidebar_border = theme.get("sidebar_border", panel_border)
     header_min_height = theme.get("header_min_height", 132)
     header_name_font_size = theme.get("header_name_font_size", 24)
     header_headline_font_size = theme.get("header_headline_font_size", 12)
@@ -509,13 +947,11 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
     main_ratio = min(max(theme.get("main_ratio", 0.62), 0.55), 0.72)
     contact_fields = _build_contact_fields(cv)
 
-    buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=A4)
+    # As in the one-column layout, page chrome is first run against a null
+    # canvas for its geometry and painted once ``pdf`` is rebound to ``target``.
+    pdf = NullCanvas()
     width, height = A4
 
-    pdf.setFillColor(background)
-    pdf.rect(0, 0, width, height, fill=1, stroke=0)
-
     margin = 22
     gap = 14
     top = height - 22
@@ -571,256 +1007,188 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
         safe_round_rect(pdf, right_x - 4, bottom - 4, right_width + 8, column_height, 8, fill=1, stroke=1)
 
     def draw_page_layout(first_page: bool) -> tuple[float, float]:
+        if not first_page:
+            # Continuation chrome is identical on every page, so it is drawn
+            # once as a form and referenced from each page.
+            pdf.begin_form(("page_chrome",))
+            starts = draw_continuation_chrome()
+            pdf.end_form()
+            return starts
+
         pdf.setFillColor(background)
         pdf.rect(0, 0, width, height, fill=1, stroke=0)
 
-        if first_page:
-            if layout_style == "slate_profile":
-                banner_width = total_width - 72
-                compact_name_leading = header_name_font_size + 4
-                compact_headline_leading = header_headline_font_size + 4
-                name_banner_height = max(
-                    78,
-                    _measure_wrapped_text_height(
-                        cv.get("full_name", ""),
-                        "Helvetica-Bold",
-                        header_name_font_size,
-                        banner_width,
-                        compact_name_leading,
-                    )
-                    + _measure_wrapped_text_height(
-                        cv.get("headline", ""),
-                        "Helvetica",
-                        header_headline_font_size,
-                        banner_width,
-                        compact_headline_leading,
-                    )
-                    + 32,
-                )
-                banner_bottom = top - name_banner_height
-                pdf.setFillColor(panel_primary)
-                safe_round_rect(pdf, margin - 6, banner_bottom - 10, total_width + 12, name_banner_height + 18, 8, fill=1, stroke=0)
-                pdf.setStrokeColor(panel_border)
-                pdf.setLineWidth(1)
-                safe_round_rect(pdf, margin - 6, banner_bottom - 10, total_width + 12, name_banner_height + 18, 8, fill=0, stroke=1)
-                text_y = banner_bottom + name_banner_height - 24
-                text_y = _draw_wrapped_lines(
-                    pdf,
+        if layout_style == "slate_profile":
+            banner_width = total_width - 72
+            compact_name_leading = header_name_font_size + 4
+            compact_headline_leading = header_headline_font_size + 4
+            name_banner_height = max(
+                78,
+                _measure_wrapped_text_height(
                     cv.get("full_name", ""),
-                    width / 2,
-                    text_y,
-                    banner_width,
                     "Helvetica-Bold",
                     header_name_font_size,
+                    banner_width,
                     compact_name_leading,
-                    fill_color=text_color,
-                    align="center",
                 )
-                _draw_wrapped_lines(
-                    pdf,
+                + _measure_wrapped_text_height(
                     cv.get("headline", ""),
-                    width / 2,
-                    text_y - 4,
-                    banner_width,
                     "Helvetica",
                     header_headline_font_size,
+                    banner_width,
                     compact_headline_leading,
-                    fill_color=text_color,
-                    align="center",
-                )
-                draw_columns(banner_bottom - 14)
-                start_y = banner_bottom - 30
-                return start_y, start_y
-
-            if layout_style == "sidebar_skillset":
-                draw_columns(top)
-                compact_name_font_size = max(16, header_name_font_size - 7)
-                compact_headline_font_size = max(10, header_headline_font_size - 1)
-                compact_name_leading = compact_name_font_size + 3
-                compact_headline_leading = compact_headline_font_size + 3
-                box_inner_width = right_width - 40
-                box_content_height = _measure_wrapped_text_height(
-                    cv.get("full_name", ""),
-                    "Helvetica-Bold",
-                    compact_name_font_size,
-                    box_inner_width,
-                    compact_name_leading,
                 )
-                if str(cv.get("headline", "")).strip():
-                    box_content_height += 4 + _measure_wrapped_text_height(
-                        cv.get("headline", ""),
-                        "Helvetica",
-                        compact_headline_font_size,
-                        box_inner_width,
-                        compact_headline_leading,
-                    )
-                name_box_height = max(44, box_content_height + 18)
-                box_top = top - 12
-                box_bottom = box_top - name_box_height
-                pdf.setFillColor(hero_accent)
-                safe_round_rect(pdf, right_x + 8, box_bottom, right_width - 16, name_box_height, 8, fill=1, stroke=0)
-                text_y = box_top - 10
-                text_y = _draw_wrapped_lines(
-                    pdf,
-                    cv.get("full_name", ""),
-                    right_x + 12,
-                    text_y,
-                    box_inner_width,
-                    "Helvetica-Bold",
-                    compact_name_font_size,
-                    compact_name_leading,
-                    fill_color=hero_text_color,
-                )
-                _draw_wrapped_lines(
-                    pdf,
+                + 32,
+            )
+            banner_bottom = top - name_banner_height
+            pdf.setFillColor(panel_primary)
+            safe_round_rect(pdf, margin - 6, banner_bottom - 10, total_width + 12, name_banner_height + 18, 8, fill=1, stroke=0)
+            pdf.setStrokeColor(panel_border)
+            pdf.setLineWidth(1)
+            safe_round_rect(pdf, margin - 6, banner_bottom - 10, total_width + 12, name_banner_height + 18, 8, fill=0, stroke=1)
+            text_y = banner_bottom + name_banner_height - 24
+            text_y = _draw_wrapped_lines(
+                pdf,
+                cv.get("full_name", ""),
+                width / 2,
+                text_y,
+                banner_width,
+                "Helvetica-Bold",
+                header_name_font_size,
+                compact_name_leading,
+                fill_color=text_color,
+                align="center",
+            )
+            _draw_wrapped_lines(
+                pdf,
+                cv.get("headline", ""),
+                width / 2,
+                text_y - 4,
+                banner_width,
+                "Helvetica",
+                header_headline_font_size,
+                compact_headline_leading,
+                fill_color=text_color,
+                align="center",
+            )
+            draw_columns(banner_bottom - 14)
+            start_y = banner_bottom - 30
+            return start_y, start_y
+
+        if layout_style == "sidebar_skillset":
+            draw_columns(top)
+            compact_name_font_size = max(16, header_name_font_size - 7)
+            compact_headline_font_size = max(10, header_headline_font_size - 1)
+            compact_name_leading = compact_name_font_size + 3
+            compact_headline_leading = compact_headline_font_size + 3
+            box_inner_width = right_width - 40
+            box_content_height = _measure_wrapped_text_height(
+                cv.get("full_name", ""),
+                "Helvetica-Bold",
+                compact_name_font_size,
+                box_inner_width,
+                compact_name_leading,
+            )
+            if str(cv.get("headline", "")).strip():
+                box_content_height += 4 + _measure_wrapped_text_height(
                     cv.get("headline", ""),
-                    right_x + 12,
-                    text_y - 4,
-                    box_inner_width,
                     "Helvetica",
                     compact_headline_font_size,
+                    box_inner_width,
                     compact_headline_leading,
-                    fill_color=hero_text_color,
-                )
-                sidebar_y = box_bottom - 14
-                sidebar_y = _draw_contact_blocks(
-                    pdf,
-                    contact_fields,
-                    right_x + 12,
-                    sidebar_y,
-                    right_width - 24,
-                    header_contact_label_font_size,
-                    header_contact_font_size,
-                    header_contact_leading,
-                    sidebar_section_title_color,
-                    hero_text_color,
-                )
-                return top - 22, sidebar_y - 6
-
-            if layout_style == "professional_header":
-                contact_box_width = right_width + 10
-                contact_box_x = right_x - 2
-                contact_inner_width = contact_box_width - 16
-                left_header_width = right_x - left_x - 22
-                name_leading = header_name_font_size + 4
-                headline_leading = header_headline_font_size + 4
-                left_content_height = _measure_wrapped_text_height(
-                    cv.get("full_name", ""),
-                    "Helvetica-Bold",
-                    header_name_font_size,
-                    left_header_width,
-                    name_leading,
-                )
-                if str(cv.get("headline", "")).strip():
-                    left_content_height += 6 + _measure_wrapped_text_height(
-                        cv.get("headline", ""),
-                        "Helvetica",
-                        header_headline_font_size,
-                        left_header_width,
-                        headline_leading,
-                    )
-                contact_box_height = max(
-                    96,
-                    _measure_contact_blocks_height(
-                        contact_fields,
-                        contact_inner_width,
-                        header_contact_label_font_size,
-                        header_contact_font_size,
-                        header_contact_leading,
-                    ) + 16,
-                )
-                header_height = max(header_min_height, max(left_content_height + 34, contact_box_height + 28))
-                header_bottom = top - header_height
-                contact_box_y = header_bottom + 14
-                pdf.setFillColor(hero_background)
-                safe_round_rect(pdf, left_x - 2, header_bottom, total_width + 4, header_height, 6, fill=1, stroke=0)
-                pdf.setFillColor(hero_accent)
-                safe_round_rect(pdf, contact_box_x, contact_box_y, contact_box_width, contact_box_height, 6, fill=1, stroke=0)
-                pdf.setStrokeColor(colors.HexColor("#7da0c4"))
-                pdf.setLineWidth(0.8)
-                safe_round_rect(pdf, contact_box_x, contact_box_y, contact_box_width, contact_box_height, 6, fill=0, stroke=1)
-                text_y = header_bottom + header_height - 22
-                text_y = _draw_wrapped_lines(
-                    pdf,
-                    cv.get("full_name", ""),
-                    left_x + 10,
-                    text_y,
-                    left_header_width,
-                    "Helvetica-Bold",
-                    header_name_font_size,
-                    name_leading,
-                    fill_color=hero_text_color,
                 )
-                _draw_wrapped_lines(
-                    pdf,
-                    cv.get("headline", ""),
-                    left_x + 10,
-                    text_y - 4,
-                    left_header_width,
-                    "Helvetica-Bold",
-                    header_headline_font_size,
-                    headline_leading,
-                    fill_color=hero_text_color,
-                )
-                _draw_contact_blocks(
-                    pdf,
-                    contact_fields,
-                    contact_box_x + 8,
-                    contact_box_y + contact_box_height - 12,
-                    contact_inner_width,
-                    header_contact_label_font_size,
-                    header_contact_font_size,
-                    header_contact_leading,
-                    hero_strip,
-                    hero_text_color,
-                )
-                draw_columns(header_bottom - 10)
-                pdf.setFillColor(text_color)
-                start_y = header_bottom - 26
-                return start_y, start_y
+            name_box_height = max(44, box_content_height + 18)
+            box_top = top - 12
+            box_bottom = box_top - name_box_height
+            pdf.setFillColor(hero_accent)
+            safe_round_rect(pdf, right_x + 8, box_bottom, right_width - 16, name_box_height, 8, fill=1, stroke=0)
+            text_y = box_top - 10
+            text_y = _draw_wrapped_lines(
+                pdf,
+                cv.get("full_name", ""),
+                right_x + 12,
+                text_y,
+                box_inner_width,
+                "Helvetica-Bold",
+                compact_name_font_size,
+                compact_name_leading,
+                fill_color=hero_text_color,
+            )
+            _draw_wrapped_lines(
+                pdf,
+                cv.get("headline", ""),
+                right_x + 12,
+                text_y - 4,
+                box_inner_width,
+                "Helvetica",
+                compact_headline_font_size,
+                compact_headline_leading,
+                fill_color=hero_text_color,
+            )
+            sidebar_y = box_bottom - 14
+            sidebar_y = _draw_contact_blocks(
+                pdf,
+                contact_fields,
+                right_x + 12,
+                sidebar_y,
+                right_width - 24,
+                header_contact_label_font_size,
+                header_contact_font_size,
+                header_contact_leading,
+                sidebar_section_title_color,
+                hero_text_color,
+            )
+            return top - 22, sidebar_y - 6
 
-            # modern_header (default)
-            title_width = right_x - left_x - 22
+        if layout_style == "professional_header":
+            contact_box_width = right_width + 10
+            contact_box_x = right_x - 2
+            contact_inner_width = contact_box_width - 16
+            left_header_width = right_x - left_x - 22
             name_leading = header_name_font_size + 4
             headline_leading = header_headline_font_size + 4
-            title_content_height = _measure_wrapped_text_height(
+            left_content_height = _measure_wrapped_text_height(
                 cv.get("full_name", ""),
                 "Helvetica-Bold",
                 header_name_font_size,
-                title_width,
+                left_header_width,
                 name_leading,
             )
             if str(cv.get("headline", "")).strip():
-                title_content_height += 6 + _measure_wrapped_text_height(
+                left_content_height += 6 + _measure_wrapped_text_height(
                     cv.get("headline", ""),
                     "Helvetica",
                     header_headline_font_size,
-                    title_width,
+                    left_header_width,
                     headline_leading,
                 )
-            contact_content_height = _measure_contact_blocks_height(
-                contact_fields,
-                right_width - 10,
-                header_contact_label_font_size,
-                header_contact_font_size,
-                header_contact_leading,
+            contact_box_height = max(
+                96,
+                _measure_contact_blocks_height(
+                    contact_fields,
+                    contact_inner_width,
+                    header_contact_label_font_size,
+                    header_contact_font_size,
+                    header_contact_leading,
+                ) + 16,
             )
-            hero_height = max(header_min_height, max(title_content_height + 34, contact_content_height + 28))
-            hero_top = top
-            hero_bottom = hero_top - hero_height
+            header_height = max(header_min_height, max(left_content_height + 34, contact_box_height + 28))
+            header_bottom = top - header_height
+            contact_box_y = header_bottom + 14
             pdf.setFillColor(hero_background)
-            safe_round_rect(pdf, left_x - 12, hero_bottom - 10, total_width + 24, hero_height + 20, 20, fill=1, stroke=0)
+            safe_round_rect(pdf, left_x - 2, header_bottom, total_width + 4, header_height, 6, fill=1, stroke=0)
             pdf.setFillColor(hero_accent)
-            accent_height = min(max(title_content_height + 18, 42), hero_height * 0.52)
-            accent_y = hero_bottom + ((hero_height - accent_height) / 2)
-            safe_round_rect(pdf, left_x + 6, accent_y, min(total_width * 0.58, title_width + 20), accent_height, 18, fill=1, stroke=0)
-            text_y = hero_bottom + hero_height - 22
+            safe_round_rect(pdf, contact_box_x, contact_box_y, contact_box_width, contact_box_height, 6, fill=1, stroke=0)
+            pdf.setStrokeColor(contact_box_border)
+            pdf.setLineWidth(0.8)
+            safe_round_rect(pdf, contact_box_x, contact_box_y, contact_box_width, contact_box_height, 6, fill=0, stroke=1)
+            text_y = header_bottom + header_height - 22
             text_y = _draw_wrapped_lines(
                 pdf,
                 cv.get("full_name", ""),
-                left_x + 12,
+                left_x + 10,
                 text_y,
-                title_width,
+                left_header_width,
                 "Helvetica-Bold",
                 header_name_font_size,
                 name_leading,
@@ -829,10 +1197,10 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
             _draw_wrapped_lines(
                 pdf,
                 cv.get("headline", ""),
-                left_x + 12,
+                left_x + 10,
                 text_y - 4,
-                title_width,
-                "Helvetica",
+                left_header_width,
+                "Helvetica-Bold",
                 header_headline_font_size,
                 headline_leading,
                 fill_color=hero_text_color,
@@ -840,20 +1208,98 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
             _draw_contact_blocks(
                 pdf,
                 contact_fields,
-                right_x + 6,
-                hero_bottom + hero_height - 18,
-                right_width - 10,
+                contact_box_x + 8,
+                contact_box_y + contact_box_height - 12,
+                contact_inner_width,
                 header_contact_label_font_size,
                 header_contact_font_size,
                 header_contact_leading,
                 hero_strip,
                 hero_text_color,
             )
-            draw_columns(hero_bottom)
+            draw_columns(header_bottom - 10)
             pdf.setFillColor(text_color)
-            return hero_bottom - 16, hero_bottom - 24
+            start_y = header_bottom - 26
+            return start_y, start_y
 
-        # Continuation pages
+        # modern_header (default)
+        title_width = right_x - left_x - 22
+        name_leading = header_name_font_size + 4
+        headline_leading = header_headline_font_size + 4
+        title_content_height = _measure_wrapped_text_height(
+            cv.get("full_name", ""),
+            "Helvetica-Bold",
+            header_name_font_size,
+            title_width,
+            name_leading,
+        )
+        if str(cv.get("headline", "")).strip():
+            title_content_height += 6 + _measure_wrapped_text_height(
+                cv.get("headline", ""),
+                "Helvetica",
+                header_headline_font_size,
+                title_width,
+                headline_leading,
+            )
+        contact_content_height = _measure_contact_blocks_height(
+            contact_fields,
+            right_width - 10,
+            header_contact_label_font_size,
+            header_contact_font_size,
+            header_contact_leading,
+        )
+        hero_height = max(header_min_height, max(title_content_height + 34, contact_content_height + 28))
+        hero_top = top
+        hero_bottom = hero_top - hero_height
+        pdf.setFillColor(hero_background)
+        safe_round_rect(pdf, left_x - 12, hero_bottom - 10, total_width + 24, hero_height + 20, 20, fill=1, stroke=0)
+        pdf.setFillColor(hero_accent)
+        accent_height = min(max(title_content_height + 18, 42), hero_height * 0.52)
+        accent_y = hero_bottom + ((hero_height - accent_height) / 2)
+        safe_round_rect(pdf, left_x + 6, accent_y, min(total_width * 0.58, title_width + 20), accent_height, 18, fill=1, stroke=0)
+        text_y = hero_bottom + hero_height - 22
+        text_y = _draw_wrapped_lines(
+            pdf,
+            cv.get("full_name", ""),
+            left_x + 12,
+            text_y,
+            title_width,
+            "Helvetica-Bold",
+            header_name_font_size,
+            name_leading,
+            fill_color=hero_text_color,
+        )
+        _draw_wrapped_lines(
+            pdf,
+            cv.get("headline", ""),
+            left_x + 12,
+            text_y - 4,
+            title_width,
+            "Helvetica",
+            header_headline_font_size,
+            headline_leading,
+            fill_color=hero_text_color,
+        )
+        _draw_contact_blocks(
+            pdf,
+            contact_fields,
+            right_x + 6,
+            hero_bottom + hero_height - 18,
+            right_width - 10,
+            header_contact_label_font_size,
+            header_contact_font_size,
+            header_contact_leading,
+            hero_strip,
+            hero_text_color,
+        )
+        draw_columns(hero_bottom)
+        pdf.setFillColor(text_color)
+        return hero_bottom - 16, hero_bottom - 24
+
+
+    def draw_continuation_chrome() -> tuple[float, float]:
+        pdf.setFillColor(background)
+        pdf.rect(0, 0, width, height, fill=1, stroke=0)
         ribbon_height = 24
         ribbon_bottom = top - ribbon_height
         if layout_style == "sidebar_skillset":
@@ -903,9 +1349,10 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
         return start_y, start_y
 
     # Build operations for left/right columns
-    left_ops: list[dict] = []
+    scale = theme.get("text_scale", 1.0)
+    left_ops: list[PdfOp] = []
     _add_title_op(left_ops, "Profile")
-    _add_text_ops(left_ops, cv.get("profile_summary", ""), left_width, font_name="Helvetica", font_size=10, leading=13)
+    _add_text_ops(left_ops, cv.get("profile_summary", ""), left_width, font_name="Helvetica", font_size=10, leading=13, scale=scale)
     _add_gap_op(left_ops, 6)
 
     _add_title_op(left_ops, "Professional Experience")
@@ -914,9 +1361,10 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
             left_ops,
             f"{exp.get('role', '')} - {exp.get('organization', '')} | {exp.get('period', '')}",
             left_width, font_name="Helvetica-Bold", font_size=9, leading=12,
+            scale=scale,
         )
         for bullet in exp.get("bullets") or []:
-            _add_text_ops(left_ops, f"- {bullet}", left_width, font_name="Helvetica", font_size=9, leading=12)
+            _add_text_ops(left_ops, f"- {bullet}", left_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
         _add_gap_op(left_ops, 3)
 
     projects = [item for item in (cv.get("projects") or []) if (isinstance(item, dict) and item.get("name", "").strip()) or (isinstance(item, str) and item.strip())]
@@ -929,13 +1377,13 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
             technologies = record.get("technologies", "")
             link = record.get("link", "")
             if name:
-                _add_text_ops(left_ops, name, left_width, font_name="Helvetica-Bold", font_size=9, leading=12)
+                _add_text_ops(left_ops, name, left_width, font_name="Helvetica-Bold", font_size=9, leading=12, scale=scale)
             if description:
-                _add_text_ops(left_ops, f"  {description}", left_width, font_name="Helvetica", font_size=9, leading=12)
+                _add_text_ops(left_ops, f"  {description}", left_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
             if technologies:
-                _add_text_ops(left_ops, f"  Technologies: {technologies}", left_width, font_name="Helvetica-Oblique", font_size=8, leading=11)
+                _add_text_ops(left_ops, f"  Technologies: {technologies}", left_width, font_name="Helvetica-Oblique", font_size=8, leading=11, scale=scale)
             if link:
-                _add_text_ops(left_ops, f"  {link}", left_width, font_name="Helvetica-Oblique", font_size=8, leading=11)
+                _add_text_ops(left_ops, f"  {link}", left_width, font_name="Helvetica-Oblique", font_size=8, leading=11, scale=scale)
         _add_gap_op(left_ops, 4)
 
     education_records: list[dict] = []
@@ -944,7 +1392,7 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
         if any(str(record.get(field, "")).strip() for field in ("course", "institution", "timeline")):
             education_records.append(record)
 
-    def append_education_ops(target_ops: list[dict], column_width: float) -> None:
+    def append_education_ops(target_ops: list[PdfOp], column_width: float) -> None:
         if not education_records:
             return
         _add_title_op(target_ops, "Education")
@@ -957,16 +1405,16 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
                 parts.append(f"({timeline})")
             entry_line = " - ".join(parts) if parts else ""
             if entry_line:
-                _add_text_ops(target_ops, f"{idx}. {entry_line}", column_width, font_name="Helvetica", font_size=10, leading=13)
+                _add_text_ops(target_ops, f"{idx}. {entry_line}", column_width, font_name="Helvetica", font_size=10, leading=13, scale=scale)
 
     if layout_style != "slate_profile":
         append_education_ops(left_ops, left_width)
 
-    right_ops: list[dict] = []
+    right_ops: list[PdfOp] = []
 
     def add_contact_line(label: str, value: str) -> None:
         if str(value).strip():
-            _add_text_ops(right_ops, f"{label}: {value}", right_width, font_name="Helvetica", font_size=9, leading=12)
+            _add_text_ops(right_ops, f"{label}: {value}", right_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
 
     if layout_style == "slate_profile":
         # Banner only shows name — need full Personal Details in sidebar
@@ -1001,128 +1449,72 @@ def build_pdf_two_column(cv: dict, theme: dict | None = None) -> bytes:
         if skills:
             _add_title_op(right_ops, "Skills")
             for item in skills:
-                _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12)
+                _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
             _add_gap_op(right_ops, 4 if technical else 6)
         if technical:
             _add_title_op(right_ops, "Technical Proficiencies")
             for item in technical:
-                _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12)
+                _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
             _add_gap_op(right_ops, 4)
     else:
         _add_title_op(right_ops, "Core Competencies")
         for item in competencies:
-            _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12)
+            _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
         _add_gap_op(right_ops, 4)
 
     _add_title_op(right_ops, "Languages")
     for item in cv.get("languages") or []:
-        _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12)
+        _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
     _add_gap_op(right_ops, 4)
 
     if layout_style in ("sidebar_skillset", "slate_profile"):
         _add_title_op(left_ops, "Certifications")
         for item in cv.get("certifications") or []:
-            _add_text_ops(left_ops, f"- {item}", left_width, font_name="Helvetica", font_size=9, leading=12)
+            _add_text_ops(left_ops, f"- {item}", left_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
         _add_gap_op(left_ops, 4)
         _add_title_op(left_ops, "Referees")
-        _build_referee_ops(cv, left_ops, left_width)
+        _build_referee_ops(cv, left_ops, left_width, scale=scale)
     else:
         _add_title_op(right_ops, "Certifications")
         for item in cv.get("certifications") or []:
-            _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12)
+            _add_text_ops(right_ops, f"- {item}", right_width, font_name="Helvetica", font_size=9, leading=12, scale=scale)
         _add_gap_op(right_ops, 4)
         _add_title_op(right_ops, "Referees")
-        _build_referee_ops(cv, right_ops, right_width)
+        _build_referee_ops(cv, right_ops, right_width, scale=scale)
 
-    def render_op(op: dict, x: float, y: float, column: str) -> float:
+    def render_op(op: PdfOp, x: float, y: float, column: str) -> float:
         is_sidebar_column = layout_style in {"sidebar_skillset", "slate_profile"} and column == "sidebar"
-        if op["kind"] == "title":
+        if op.kind == OP_LINE:
+            pdf.setFillColor(sidebar_text_color if is_sidebar_column else text_color)
+            pdf.setFont(op.font_name, op.font_size)
+            pdf.drawString(x, y, op.text)
+        elif op.kind == OP_TITLE:
             return draw_pdf_section_title(
-                pdf, op["title"], x, y,
+                pdf, op.text, x, y,
                 title_color=sidebar_section_title_color if is_sidebar_column else section_title_color,
                 line_color=sidebar_section_line_color if is_sidebar_column else section_line_color,
             )
-        if op["kind"] == "line":
-            pdf.setFillColor(sidebar_text_color if is_sidebar_column else text_color)
-            pdf.setFont(op["font_name"], op["font_size"])
-            pdf.drawString(x, y, op["text"])
-            return y - op["leading"]
-        return y - op["height"]
-
-    left_index = 0
-    right_index = 0
-    y_left, y_right = draw_page_layout(first_page=True)
-
-    prev_left = -1
-    prev_right = -1
-    while left_index < len(left_ops) or right_index < len(right_ops):
-        while left_index < len(left_ops):
-            op = left_ops[left_index]
-            if y_left - op["height"] < bottom:
-                break
-            y_left = render_op(op, left_x, y_left, "main")
-            left_index += 1
-
-        while right_index < len(right_ops):
-            op = right_ops[right_index]
-            if y_right - op["height"] < bottom:
-                break
-            y_right = render_op(op, right_x, y_right, "sidebar")
-            right_index += 1
-
-        if left_index >= len(left_ops) and right_index >= len(right_ops):
-            break
-
-        # Safety guard: if no progress was made, force-render the blocking op
-        # to prevent an infinite loop when a single op exceeds page height.
-        if left_index == prev_left and right_index == prev_right:
-            if left_index < len(left_ops):
-                y_left = render_op(left_ops[left_index], left_x, y_left, "main")
-                left_index += 1
-            if right_index < len(right_ops):
-                y_right = render_op(right_ops[right_index], right_x, y_right, "sidebar")
-                right_index += 1
-            continue
-
-        prev_left = left_index
-        prev_right = right_index
-        pdf.showPage()
-        y_left, y_right = draw_page_layout(first_page=False)
-
-    pdf.save()
-    buffer.seek(0)
-    return buffer.getvalue()
-
-
-# ---------------------------------------------------------------------------
-# Op helpers (used by two-column builder)
-# ---------------------------------------------------------------------------
-
-def _add_title_op(ops: list[dict], title: str) -> None:
-    ops.append({"kind": "title", "title": title, "height": 32})
-
-
-def _add_gap_op(ops: list[dict], gap_size: int) -> None:
-    if gap_size > 0:
-        ops.append({"kind": "gap", "height": gap_size})
+        return y - op.height
 
+    columns = (left_ops, right_ops)
+    first_starts = draw_page_layout(first_page=True)
+    next_starts = draw_page_layout(first_page=False)
+    positions, pages = _paginate_columns(columns, first_starts, next_starts, bottom)
+    metrics = _layout_metrics(list(columns), positions, pages, bottom)
+    if target is None:
+        return metrics
 
-def _add_text_ops(
-    ops: list[dict],
-    text: str,
-    max_width: float,
-    font_name: str = "Helvetica",
-    font_size: int = 10,
-    leading: int = 13,
-) -> None:
-    for line in wrap_pdf_text(text, font_name, font_size, max_width):
-        ops.append(
-            {
-                "kind": "line",
-                "text": line,
-                "font_name": font_name,
-                "font_size": font_size,
-                "leading": leading,
-                "height": leading,
-            }
-        )
+    pdf = target
+    pdf.setFillColor(background)
+    pdf.rect(0, 0, width, height, fill=1, stroke=0)
+    cursors = [0, 0]
+    for page_index in range(len(pages)):
+        if page_index:
+            pdf.showPage()
+        draw_page_layout(first_page=page_index == 0)
+        for column, (ops, x, name) in enumerate(zip(columns, (left_x, right_x), ("main", "sidebar"))):
+            column_positions = positions[column]
+            while cursors[column] < len(ops) and column_positions[cursors[column]][0] == page_index:
+                render_op(ops[cursors[column]], x, column_positions[cursors[column]][1], name)
+                cursors[column] += 1
+    return metrics
@@ -0,0 +1,43 @@
+"""CV previews served from the static folder.
+
+A preview is the compact HTML artifact from the artifact store, published
+under its digest. Previewing a template that was already shown, or showing
+the gallery again, only hands the browser a URL it has cached.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from templates.artifacts import get_cv_artifact
+from templates.themes import AVAILABLE_TEMPLATES
+from utils.image_assets import STATIC_DIR, STATIC_URL, publish_static_file
+
+
+# Enough for the whole gallery of a few CV versions.
+PREVIEW_KEEP = 64
+GALLERY_WORKERS = 4
+
+
+def publish_cv_preview(cv: dict, template: str, target_dir: Path = STATIC_DIR, url_prefix: str = STATIC_URL) -> str:
+    """URL of the preview of ``cv`` in ``template``; raises ``OSError`` when ``target_dir`` cannot be written."""
+    entry = get_cv_artifact(cv, template, "html", compact=True)
+    name = f"cv-preview.{entry['digest'][:12]}.html"
+    try:
+        os.utime(target_dir / name)  # pruning goes by mtime; keep previews in use
+    except FileNotFoundError:
+        with open(entry["path"], "rb") as handle:
+            publish_static_file(target_dir, name, handle.read(), keep=PREVIEW_KEEP)
+    return f"{url_prefix}/{name}"
+
+
+def publish_template_gallery(
+    cv: dict,
+    templates: list[str] | None = None,
+    target_dir: Path = STATIC_DIR,
+    url_prefix: str = STATIC_URL,
+) -> dict[str, str]:
+    """Preview URLs of ``cv`` in every template, rendered concurrently on a cold store."""
+    templates = list(templates or AVAILABLE_TEMPLATES)
+    with ThreadPoolExecutor(max_workers=min(GALLERY_WORKERS, len(templates))) as pool:
+        urls = pool.map(lambda template: publish_cv_preview(cv, template, target_dir, url_prefix), templates)
+        return dict(zip(templates, urls))
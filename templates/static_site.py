@@ -0,0 +1,121 @@
+import html
+import json
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from pathlib import Path
+
+from templates.artifacts import ARTIFACT_FORMATS, available_formats, render_cv_artifact
+from templates.landing_builder import ASSETS_DIR, HERO_IMAGE, iter_portfolio_landing_html, publish_hero_image
+from templates.themes import AVAILABLE_TEMPLATES, template_slug
+from utils.html_minify import minify_html
+from utils.image_assets import hashed_name
+
+
+def _write_file(output_dir: Path, relative_path: str, data: bytes) -> str:
+    target = output_dir / relative_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
+    return relative_path
+
+
+def _write_chunks(output_dir: Path, relative_path: str, chunks: Iterable[str]) -> str:
+    target = output_dir / relative_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", encoding="utf-8", newline="") as handle:
+        handle.writelines(chunks)
+    return relative_path
+
+
+def _downloads_footer(entries: list[dict]) -> str:
+    links = []
+    for entry in entries:
+        for fmt, path in entry["files"].items():
+            label = f"{entry['template']} ({fmt.upper()})"
+            links.append(f"<a href='{html.escape(path)}'>{html.escape(label)}</a>")
+    if not links:
+        return ""
+    return (
+        "<footer class='pf-downloads'>"
+        "<h2>Download CV</h2>"
+        f"<div>{''.join(links)}</div>"
+        "</footer>"
+    )
+
+
+def _iter_static_page(title: str, body: Iterable[str]) -> Iterator[str]:
+    yield f"""<!doctype html>
+<html lang='en'>
+<head>
+<meta charset='UTF-8'>
+<meta name='viewport' content='width=device-width, initial-scale=1'>
+<title>{html.escape(title)}</title>
+<style>
+    body {{ margin: 0; }}
+    .pf-downloads {{ padding: 28px 36px 40px; background: #081116; color: #e9fbf8; font: 14px Inter, 'Segoe UI', Arial, sans-serif; }}
+    .pf-downloads h2 {{ margin: 0 0 12px; font-size: 20px; }}
+    .pf-downloads div {{ display: flex; flex-wrap: wrap; gap: 10px 18px; }}
+    .pf-downloads a {{ color: #55e6d0; text-decoration: none; font-weight: 700; }}
+</style>
+</head>
+<body>
+"""
+    yield from body
+    yield """
+</body>
+</html>
+"""
+
+
+def export_static_site(
+    cv: dict,
+    output_dir: str | Path,
+    templates: list[str] | None = None,
+    compact: bool = False,
+) -> dict:
+    """Write the landing page and every template's artifacts as plain files.
+
+    Asset and artifact file names carry a content hash so they can be served
+    with long-lived cache headers. ``compact`` minifies the pages and uses the
+    compact PDF profile. Returns the manifest written to ``manifest.json``.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    formats = available_formats()
+
+    hero_src, hero_variants = publish_hero_image(output_dir / "assets", "assets")
+    if hero_src is None:
+        hero_src = ""
+        hero_path = ASSETS_DIR / HERO_IMAGE
+        if hero_path.exists():
+            hero_bytes = hero_path.read_bytes()
+            stem, _, extension = HERO_IMAGE.rpartition(".")
+            hero_src = _write_file(output_dir, f"assets/{hashed_name(stem, hero_bytes, extension)}", hero_bytes)
+
+    entries = []
+    for template in templates or AVAILABLE_TEMPLATES:
+        slug = template_slug(template)
+        files = {}
+        for fmt in formats:
+            data = render_cv_artifact(cv, template, fmt, compact=compact)
+            if not data:
+                continue
+            folder = "cv" if fmt == "html" else "downloads"
+            extension = ARTIFACT_FORMATS[fmt]["extension"]
+            files[fmt] = _write_file(output_dir, f"{folder}/{hashed_name(slug, data, extension)}", data)
+        entries.append({"template": template, "slug": slug, "files": files})
+
+    page_title = " | ".join(part for part in [cv.get("full_name", ""), cv.get("headline", "")] if part)
+    body = chain(iter_portfolio_landing_html(cv, hero_src, hero_variants), [_downloads_footer(entries)])
+    index_chunks = _iter_static_page(page_title or "Portfolio", body)
+    if compact:
+        index_chunks = [minify_html("".join(index_chunks))]
+    _write_chunks(output_dir, "index.html", index_chunks)
+
+    manifest = {
+        "index": "index.html",
+        "hero": hero_src,
+        "hero_variants": [variant["url"] for variant in hero_variants],
+        "templates": entries,
+    }
+    _write_file(output_dir, "manifest.json", json.dumps(manifest, indent=2).encode("utf-8"))
+    return manifest
@@ -278,6 +278,10 @@ def normalize_template_name(template: str) -> str:
     return value
 
 
+def template_slug(template: str) -> str:
+    return normalize_template_name(template).lower().replace(" ", "_").replace("-", "")
+
+
 def get_pdf_theme(template: str) -> dict:
     normalized_template = normalize_template_name(template)
     mapped_template = DISPLAY_TO_PDF_TEMPLATE_MAP.get(normalized_template, normalized_template)
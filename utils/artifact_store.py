@@ -0,0 +1,195 @@
+"""Content-addressed on-disk store for rendered artifacts.
+
+Rendered files are kept under ``blobs/<digest[:2]>/<digest>.<ext>`` and found
+through small index files keyed by what was rendered (CV content hash,
+template, format). Identical renders therefore share one blob, and the blob
+digest doubles as a strong HTTP ETag. Hits refresh a file's mtime, and each
+new render evicts the least recently used files beyond ``ARTIFACT_MAX_BYTES``.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+
+# Bump when builder output changes so previously stored renders are not reused.
+RENDER_REVISION = "2"
+
+
+def resolve_artifact_dir() -> str:
+    explicit_path = os.getenv("CV_ARTIFACT_DIR", "").strip()
+    if explicit_path:
+        os.makedirs(explicit_path, exist_ok=True)
+        return explicit_path
+
+    default_path = os.path.join(os.getcwd(), "artifacts")
+    try:
+        os.makedirs(default_path, exist_ok=True)
+        return default_path
+    except OSError:
+        return os.path.join(tempfile.gettempdir(), "cv_artifacts")
+
+
+ARTIFACT_DIR = resolve_artifact_dir()
+ARTIFACT_MAX_BYTES = int(os.getenv("CV_ARTIFACT_MAX_MB", "256")) * 1024 * 1024
+
+
+def content_hash(data: dict) -> str:
+    """Stable hash of a JSON-serialisable document such as a CV or cover letter."""
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+class HashingWriter:
+    """Binary sink wrapper that tracks the size and SHA-256 of everything written.
+
+    ``sink`` may be any object with ``write`` (a file, spooled temp file,
+    socket file, BytesIO); with no sink the data is only measured.
+    """
+
+    def __init__(self, sink=None) -> None:
+        self.sink = sink
+        self.size = 0
+        self._hash = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self._hash.update(data)
+        written = memoryview(data).nbytes
+        self.size += written
+        if self.sink is not None:
+            self.sink.write(data)
+        return written
+
+    def tell(self) -> int:
+        return self.size
+
+    def flush(self) -> None:
+        if self.sink is not None and hasattr(self.sink, "flush"):
+            self.sink.flush()
+
+    def metadata(self) -> dict:
+        return {"digest": self._hash.hexdigest(), "size": self.size}
+
+
+def _blob_path(root: Path, digest: str, extension: str) -> Path:
+    return root / "blobs" / digest[:2] / f"{digest}.{extension}"
+
+
+def _index_path(root: Path, render_key: str) -> Path:
+    return root / "index" / render_key[:2] / f"{render_key}.json"
+
+
+def store_blob(data: bytes, extension: str, root: str | None = None) -> dict:
+    root_path = Path(root or ARTIFACT_DIR)
+    digest = hashlib.sha256(data).hexdigest()
+    path = _blob_path(root_path, digest, extension)
+    try:
+        os.utime(path)  # already stored
+    except FileNotFoundError:
+        _atomic_write(path, data)
+    return {"digest": digest, "path": str(path), "size": len(data), "extension": extension}
+
+
+def store_stream(write, extension: str, root: str | None = None) -> dict:
+    """Store whatever ``write(sink)`` writes, streaming it to disk as it is produced.
+
+    The data lands in a temporary file next to the blobs and is renamed to
+    its digest once complete, so it is never held in memory as a whole.
+    """
+    root_path = Path(root or ARTIFACT_DIR)
+    blob_root = root_path / "blobs"
+    blob_root.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=blob_root, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            writer = HashingWriter(handle)
+            write(writer)
+        meta = writer.metadata()
+        path = _blob_path(root_path, meta["digest"], extension)
+        try:
+            os.utime(path)  # already stored
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return {**meta, "path": str(path), "extension": extension}
+
+
+def render_key(*parts: str) -> str:
+    joined = "\x1f".join([RENDER_REVISION, *parts])
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+def lookup_artifact(key: str, root: str | None = None) -> dict | None:
+    root_path = Path(root or ARTIFACT_DIR)
+    try:
+        entry = json.loads(_index_path(root_path, key).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    path = _blob_path(root_path, entry["digest"], entry["extension"])
+    try:
+        os.utime(path)
+        os.utime(_index_path(root_path, key))
+    except FileNotFoundError:
+        return None  # evicted
+    entry["path"] = str(path)
+    return entry
+
+
+def prune_artifacts(root: str | None = None, max_bytes: int | None = None) -> int:
+    """Delete the least recently used blobs and index files until the store fits ``max_bytes``.
+
+    A dropped index file only costs a re-render that finds its blob again; an
+    index whose blob is gone is treated as a miss. Returns the bytes freed.
+    """
+    root_path = Path(root or ARTIFACT_DIR)
+    max_bytes = ARTIFACT_MAX_BYTES if max_bytes is None else max_bytes
+    files = []
+    for folder in ("blobs", "index"):
+        for path in (root_path / folder).glob("*/*"):
+            if path.name.startswith(".tmp-"):
+                continue  # still being written
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # pruned by another thread
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+    total = sum(size for _, size, _ in files)
+    freed = 0
+    for _, size, path in sorted(files):
+        if total - freed <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        freed += size
+    return freed
+
+
+def get_or_render(key: str, extension: str, write, root: str | None = None) -> dict:
+    """Return the stored artifact for ``key``, calling ``write(sink)`` only on a miss."""
+    entry = lookup_artifact(key, root)
+    if entry is not None:
+        return entry
+    entry = store_stream(write, extension, root)
+    index_entry = {"digest": entry["digest"], "size": entry["size"], "extension": extension}
+    _atomic_write(_index_path(Path(root or ARTIFACT_DIR), key), json.dumps(index_entry).encode("utf-8"))
+    prune_artifacts(root)
+    return entry
+
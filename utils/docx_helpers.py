@@ -0,0 +1,64 @@
+import zipfile
+from datetime import datetime, timezone
+from io import BytesIO
+
+
+# Fixed timestamps used by deterministic output; 1980-01-01 is the earliest
+# date a zip entry can carry.
+DETERMINISTIC_TIMESTAMP = datetime(2000, 1, 1, tzinfo=timezone.utc)
+ZIP_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+CONTENT_TYPES_ENTRY = "[Content_Types].xml"
+
+
+def set_fixed_core_properties(doc, title: str = "", author: str = "") -> None:
+    core = doc.core_properties
+    core.title = title
+    core.author = author
+    core.last_modified_by = author
+    core.revision = 1
+    core.created = DETERMINISTIC_TIMESTAMP
+    core.modified = DETERMINISTIC_TIMESTAMP
+    core.last_printed = DETERMINISTIC_TIMESTAMP
+
+
+def normalize_docx_zip(data: bytes) -> bytes:
+    """Rewrite a .docx package with fixed entry timestamps and a stable entry order."""
+    with zipfile.ZipFile(BytesIO(data)) as source:
+        entries = {info.filename: source.read(info) for info in source.infolist()}
+
+    names = sorted(entries)
+    if CONTENT_TYPES_ENTRY in entries:
+        # Office expects the content types part first in the package.
+        names.remove(CONTENT_TYPES_ENTRY)
+        names.insert(0, CONTENT_TYPES_ENTRY)
+
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as target:
+        for name in names:
+            info = zipfile.ZipInfo(name, date_time=ZIP_ENTRY_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o600 << 16
+            target.writestr(info, entries[name])
+    return buffer.getvalue()
+
+
+def write_docx_package(doc, sink, deterministic: bool = False, title: str = "", author: str = "") -> None:
+    """Write ``doc`` into the binary ``sink``.
+
+    python-docx needs a seekable target, so the package is assembled in
+    memory and handed to the sink as a view of that buffer rather than a copy.
+    """
+    if deterministic:
+        set_fixed_core_properties(doc, title=title, author=author)
+    buffer = BytesIO()
+    doc.save(buffer)
+    if deterministic:
+        sink.write(normalize_docx_zip(buffer.getbuffer()))
+    else:
+        sink.write(buffer.getbuffer())
+
+
+def save_docx(doc, deterministic: bool = False, title: str = "", author: str = "") -> bytes:
+    buffer = BytesIO()
+    write_docx_package(doc, buffer, deterministic=deterministic, title=title, author=author)
+    return buffer.getvalue()
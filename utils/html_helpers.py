@@ -1,21 +1,81 @@
 import html
+import pickle
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
 
 from utils.converters import normalize_education_record, normalize_project_record
 from utils.pdf_helpers import SECTION_ICONS_HTML
 
 
-def html_list(items: list[str]) -> str:
+# Section fragments are memoised by builder and section content, so a small
+# edit rebuilds only the changed section and every template shares the rest.
+# The pickled section is the key: it is exact and costs a fraction of
+# rebuilding, where repr or a JSON hash costs about as much as the fragment.
+FRAGMENT_CACHE_SIZE = 256
+_FRAGMENTS: OrderedDict = OrderedDict()
+_FRAGMENT_LOCK = Lock()
+_FRAGMENT_STATS = {"hits": 0, "misses": 0}
+
+
+def fragment_cache_info() -> dict:
+    with _FRAGMENT_LOCK:
+        hits, misses = _FRAGMENT_STATS["hits"], _FRAGMENT_STATS["misses"]
+        size = len(_FRAGMENTS)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "size": size,
+        "max_size": FRAGMENT_CACHE_SIZE,
+        "hit_rate": hits / lookups if lookups else 0.0,
+    }
+
+
+def clear_fragment_cache() -> None:
+    with _FRAGMENT_LOCK:
+        _FRAGMENTS.clear()
+        _FRAGMENT_STATS.update(hits=0, misses=0)
+
+
+def _cached_fragment(builder):
+    @wraps(builder)
+    def cached(section: list) -> str:
+        key = (builder.__name__, pickle.dumps(section, pickle.HIGHEST_PROTOCOL))
+        with _FRAGMENT_LOCK:
+            fragment = _FRAGMENTS.get(key)
+            if fragment is not None:
+                _FRAGMENTS.move_to_end(key)
+                _FRAGMENT_STATS["hits"] += 1
+                return fragment
+            _FRAGMENT_STATS["misses"] += 1
+
+        fragment = builder(section)
+        with _FRAGMENT_LOCK:
+            _FRAGMENTS[key] = fragment
+            while len(_FRAGMENTS) > FRAGMENT_CACHE_SIZE:
+                _FRAGMENTS.popitem(last=False)
+        return fragment
+
+    return cached
+
+
+def _list_markup(items: list[str]) -> str:
     escaped = [f"<li>{html.escape(item)}</li>" for item in items if str(item).strip()]
     return f"<ul>{''.join(escaped)}</ul>" if escaped else ""
 
 
+html_list = _cached_fragment(_list_markup)
+
+
+@_cached_fragment
 def html_experience(experience: list[dict]) -> str:
     chunks = []
     for item in experience:
         role = html.escape(item.get("role", ""))
         org = html.escape(item.get("organization", ""))
         period = html.escape(item.get("period", ""))
-        bullets = html_list(item.get("bullets", []))
+        bullets = _list_markup(item.get("bullets", []))
         chunks.append(
             f"""
             <div class="job">
@@ -31,6 +91,7 @@ def html_experience(experience: list[dict]) -> str:
     return "".join(chunks)
 
 
+@_cached_fragment
 def html_education(education: list[dict]) -> str:
     entries = []
     for idx, item in enumerate(education, start=1):
@@ -56,6 +117,7 @@ def html_education(education: list[dict]) -> str:
     return "".join(entries)
 
 
+@_cached_fragment
 def html_referees(referees: list[dict]) -> str:
     entries = []
     for ref in referees:
@@ -90,6 +152,7 @@ def html_referees(referees: list[dict]) -> str:
     return f"<ul class='referees-list'>{''.join(entries)}</ul>"
 
 
+@_cached_fragment
 def html_projects(projects: list) -> str:
     entries = []
     for item in projects:
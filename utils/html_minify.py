@@ -0,0 +1,59 @@
+"""Whitespace minification for the generated HTML and CSS.
+
+The builders write markup as indented triple-quoted strings, which is easy
+to edit but ships the indentation to every preview and download. Minified
+output renders the same: only whitespace the browser would collapse or
+ignore is removed, and quoted CSS strings and ``<pre>``/``<textarea>``/
+``<script>`` contents are left as written.
+"""
+import re
+from functools import lru_cache
+
+
+_CSS_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_AROUND = re.compile(r" ?([{};,>]) ?")
+_CSS_SPACE_AFTER_COLON = re.compile(r": ")
+
+# Whitespace next to these tags never renders, so it can go entirely;
+# elsewhere a newline run still separates inline content and becomes a space.
+_BLOCK_TAGS = (
+    "html|head|body|meta|link|title|style|div|section|article|aside|nav|header|footer|main"
+    "|ul|ol|li|p|h[1-6]|table|thead|tbody|tr|td|th"
+)
+_VERBATIM_BLOCK = re.compile(r"(<(style|pre|textarea|script)\b[^>]*>)(.*?)(</\2>)", re.S | re.I)
+_NEWLINE_RUN = re.compile(r"\n\s*")
+_PLACEHOLDER = re.compile(r"\0(\d+)\0")
+_BLOCK_TAG = re.compile(rf"</?(?:{_BLOCK_TAGS})\b", re.I)
+
+
+@lru_cache(maxsize=64)
+def minify_css(css: str) -> str:
+    """Drop comments and insignificant whitespace; cached, as stylesheets repeat."""
+    parts = _CSS_STRING.split(css)
+    for index in range(0, len(parts), 2):
+        code = " ".join(_CSS_COMMENT.sub("", parts[index]).split())
+        code = _CSS_SPACE_AFTER_COLON.sub(":", _CSS_SPACE_AROUND.sub(r"\1", code))
+        parts[index] = code.replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def minify_html(markup: str) -> str:
+    """Collapse indentation in ``markup`` and minify its ``<style>`` blocks."""
+    bodies = []
+
+    def set_aside(match: re.Match) -> str:
+        opening, tag, body, closing = match.groups()
+        bodies.append(minify_css(body) if tag.lower() == "style" else body)
+        return f"{opening}\0{len(bodies) - 1}\0{closing}"
+
+    # NUL never renders, and stripping it keeps the placeholders unambiguous.
+    markup = markup.replace("\0", "")
+    pieces = [piece.rstrip(" \t") for piece in _NEWLINE_RUN.split(_VERBATIM_BLOCK.sub(set_aside, markup))]
+    chunks = [pieces[0]]
+    for before, after in zip(pieces, pieces[1:]):
+        after_block = before.endswith(">") and _BLOCK_TAG.match(before, before.rfind("<"))
+        if not (after_block or _BLOCK_TAG.match(after)):
+            chunks.append(" ")
+        chunks.append(after)
+    return _PLACEHOLDER.sub(lambda match: bodies[int(match.group(1))], "".join(chunks).strip())
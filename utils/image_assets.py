@@ -0,0 +1,163 @@
+"""Resized, recompressed variants of static images such as the landing hero.
+
+Variants are encoded once per process and kept in memory, then published as
+files whose names carry a content hash, so they can be served by Streamlit's
+static file serving or a static host with long-lived cache headers. A small
+manifest next to the files lets a restarted process reuse them without
+encoding again. ``publish_static_file`` publishes other generated pages,
+such as the landing page, the same way.
+"""
+import hashlib
+import json
+import mimetypes
+import os
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from threading import get_ident
+
+try:
+    from PIL import Image, features
+    PIL_AVAILABLE = True
+except ModuleNotFoundError:
+    Image = None
+    features = None
+    PIL_AVAILABLE = False
+
+
+STATIC_DIR = Path(__file__).resolve().parents[1] / "static"
+# Streamlit serves ./static at app/static when server.enableStaticServing is on.
+STATIC_URL = os.getenv("CV_STATIC_URL", "app/static").rstrip("/")
+# Streamlit picks the Content-Type of static files from mimetypes (and sends
+# nosniff), whose built-in table lacks these on some Pythons and hosts.
+mimetypes.add_type("image/avif", ".avif")
+mimetypes.add_type("image/webp", ".webp")
+
+IMAGE_WIDTHS = (768, 1440)
+# Bump when widths or encoder settings change so published manifests are rebuilt.
+VARIANT_REVISION = "1"
+_FORMATS = (
+    ("avif", "image/avif", {"quality": 50}),
+    ("webp", "image/webp", {"quality": 78, "method": 4}),
+    ("png", "image/png", {}),
+)
+
+
+def hashed_name(stem: str, data: bytes, extension: str) -> str:
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    return f"{stem}.{digest}.{extension}"
+
+
+def publish_static_file(target_dir: Path, name: str, data: bytes, keep: int | None = None) -> None:
+    """Atomically write ``data`` to ``target_dir / name``, usually a name from ``hashed_name``.
+
+    With ``keep``, only the newest ``keep`` files sharing the name's stem and
+    extension are kept. Raises ``OSError`` when ``target_dir`` cannot be written.
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target = target_dir / name
+    partial = target.with_suffix(f".{os.getpid()}-{get_ident()}.tmp")
+    partial.write_bytes(data)
+    partial.replace(target)
+    if keep is None:
+        return
+    stem, _, extension = name.split(".")
+    published = []
+    for path in target_dir.glob(f"{stem}.*.{extension}"):
+        try:
+            published.append((path.stat().st_mtime_ns, path))
+        except FileNotFoundError:
+            continue  # pruned by another session
+    for _, stale in sorted(published)[:-keep]:
+        stale.unlink(missing_ok=True)
+
+
+def _available_formats() -> list[tuple]:
+    # AVIF is built into Pillow 11.2+; older installs only get WebP and PNG.
+    return [item for item in _FORMATS if item[0] != "avif" or features.check("avif")]
+
+
+@lru_cache(maxsize=8)
+def _encode_variants(path: str, mtime_ns: int) -> tuple[dict, ...]:
+    with Image.open(path) as source:
+        image = source.convert("RGBA" if "A" in source.getbands() else "RGB")
+    stem = Path(path).stem
+    widths = sorted({min(width, image.width) for width in IMAGE_WIDTHS})
+    variants = []
+    for width in widths:
+        resized = image if width == image.width else image.resize(
+            (width, round(image.height * width / image.width)), Image.LANCZOS
+        )
+        for extension, mime, options in _available_formats():
+            # A single PNG at the largest width is enough as the fallback.
+            if extension == "png" and width != widths[-1]:
+                continue
+            buffer = BytesIO()
+            resized.save(buffer, extension.upper(), **options)
+            data = buffer.getvalue()
+            variants.append({
+                "name": hashed_name(stem, data, extension),
+                "mime": mime,
+                "width": width,
+                "data": data,
+            })
+    return tuple(variants)
+
+
+def image_variants(path: Path) -> tuple[dict, ...]:
+    """Encoded variants of ``path`` (``name``, ``mime``, ``width``, ``data``); empty without Pillow."""
+    if not PIL_AVAILABLE or not path.exists():
+        return ()
+    return _encode_variants(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _source_key(path: str, mtime_ns: int) -> str:
+    digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    formats = ",".join(item[0] for item in _available_formats())
+    return f"{digest}:{VARIANT_REVISION}:{IMAGE_WIDTHS}:{formats}"
+
+
+def _read_manifest(path: Path) -> dict | None:
+    # A missing, truncated or hand-edited manifest is a cache miss, not an error.
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        entries = manifest["variants"]
+        if isinstance(manifest["source"], str) and all(
+            isinstance(entry["name"], str) and entry["mime"] and entry["width"] for entry in entries
+        ):
+            return manifest
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def publish_image_variants(path: Path, target_dir: Path, url_prefix: str) -> list[dict]:
+    """Write the variants of ``path`` into ``target_dir`` and return their ``url``, ``mime`` and ``width``.
+
+    Files are only written when missing. The result is ordered smallest width
+    first and, within a width, preferred format first; the PNG fallback is
+    last. Returns an empty list without Pillow.
+    """
+    if not PIL_AVAILABLE or not path.exists():
+        return []
+    manifest_path = target_dir / f"{path.stem}.variants.json"
+    source_key = _source_key(str(path), path.stat().st_mtime_ns)
+    manifest = _read_manifest(manifest_path)
+    entries = None
+    if manifest and manifest["source"] == source_key and all(
+        (target_dir / entry["name"]).exists() for entry in manifest["variants"]
+    ):
+        entries = manifest["variants"]
+    if entries is None:
+        entries = []
+        for variant in image_variants(path):
+            if not (target_dir / variant["name"]).exists():
+                publish_static_file(target_dir, variant["name"], variant["data"])
+            entries.append({key: variant[key] for key in ("name", "mime", "width")})
+        manifest_data = json.dumps({"source": source_key, "variants": entries}, indent=2).encode("utf-8")
+        publish_static_file(target_dir, manifest_path.name, manifest_data)
+    return [
+        {"url": f"{url_prefix}/{entry['name']}", "mime": entry["mime"], "width": entry["width"]}
+        for entry in entries
+    ]
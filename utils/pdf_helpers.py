@@ -1,15 +1,34 @@
+from array import array
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import accumulate
+from threading import Condition
+
+from utils.text_normalize import PDF_TEXT_TABLE
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ModuleNotFoundError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 try:
+    from reportlab import rl_config
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import A4
     from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfgen import canvas
+    from reportlab.pdfgen import canvas, pathobject
 
     REPORTLAB_AVAILABLE = True
 except ModuleNotFoundError:
+    rl_config = None
     colors = None
     A4 = None
     pdfmetrics = None
     canvas = None
+    pathobject = None
     REPORTLAB_AVAILABLE = False
 
 
@@ -94,69 +113,335 @@ SECTION_ICONS_HTML: dict[str, str] = {
 
 
 def pdf_safe_text(value: str) -> str:
-    text = str(value).replace("\n", " ")
-    # Normalize Unicode dashes/hyphens to ASCII hyphen-minus so they
-    # survive the latin-1 encoding instead of becoming '?'
-    text = (
-        text
-        .replace("\u2010", "-")   # hyphen
-        .replace("\u2011", "-")   # non-breaking hyphen
-        .replace("\u2012", "-")   # figure dash
-        .replace("\u2013", "-")   # en-dash
-        .replace("\u2014", "-")   # em-dash
-        .replace("\u2015", "-")   # horizontal bar
-        .replace("\u2212", "-")   # minus sign
-        .replace("\u00ad", "-")   # soft hyphen
-        .replace("\u2018", "'")   # left single quote
-        .replace("\u2019", "'")   # right single quote
-        .replace("\u201c", '"')   # left double quote
-        .replace("\u201d", '"')   # right double quote
-        .replace("\u2026", "...") # ellipsis
-        .replace("\u2022", "-")   # bullet
-    )
-    return text.encode("latin-1", "replace").decode("latin-1")
+    text = str(value)
+    if text.isascii():
+        # Most stored text is plain ASCII; only newlines need flattening.
+        return text.replace("\n", " ") if "\n" in text else text
+    return text.translate(PDF_TEXT_TABLE).encode("latin-1", "replace").decode("latin-1")
+
+
+def new_pdf_canvas(buffer, cv: dict, deterministic: bool = False, compact: bool = False):
+    """Create an A4 canvas; deterministic mode yields byte-identical output for identical input.
+
+    ``compact`` forces page compression on whatever the installed rl_config says.
+    """
+    options = {"pageCompression": 1} if compact else {}
+    if not deterministic:
+        return canvas.Canvas(buffer, pagesize=A4, **options)
+    # Invariant mode pins the creation date and document ID that ReportLab
+    # would otherwise derive from the clock.
+    pdf = canvas.Canvas(buffer, pagesize=A4, invariant=1, **options)
+    name = pdf_safe_text(cv.get("full_name", ""))
+    pdf.setTitle(name)
+    pdf.setAuthor(name)
+    pdf.setCreator("CV Portfolio Manager")
+    pdf.setSubject("Curriculum Vitae")
+    return pdf
+
+
+class NullCanvas:
+    """Accepts any canvas call and draws nothing; used to run layout code for its geometry only."""
+
+    def __getattr__(self, name: str):
+        return self._ignore
+
+    def _ignore(self, *args, **kwargs):
+        # Returning self lets path builders (beginPath().moveTo(...)) chain.
+        return self
+
+
+class ColorToken:
+    """Named stand-in for a palette colour, resolved when a display list is painted."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"ColorToken({self.name!r})"
+
+
+# A Form XObject costs a few hundred bytes of dictionary and stream framing,
+# so only content repeated this often is worth defining once.
+FORM_MIN_USES = 3
+
+
+class DisplayListCanvas:
+    """Records canvas calls page by page so they can be replayed onto a real canvas.
+
+    Drawing between ``begin_form(key)`` and ``end_form()`` is recorded once per
+    distinct key as a reusable form; every use records only a reference.
+    """
+
+    def __init__(self) -> None:
+        self.pages: list[list[tuple]] = [[]]
+        self.forms: dict[str, tuple[tuple, list[tuple]]] = {}
+        self.form_uses: dict[str, int] = {}
+        self._form_names: dict = {}
+        self._commands = self.pages[-1]
+        self._open_form = None
+
+    def showPage(self) -> None:
+        self.pages.append([])
+        self._commands = self.pages[-1]
+
+    def beginPath(self):
+        # Paths are canvas-independent; the recorded drawPath keeps a reference.
+        return pathobject.PDFPathObject()
+
+    def begin_form(self, key, bbox: tuple = ()) -> None:
+        name = self._form_names.get(key)
+        if name is None:
+            name = self._form_names[key] = f"Form{len(self._form_names)}"
+        self._open_form = (name, bbox)
+        self._commands = []
+
+    def end_form(self) -> None:
+        name, bbox = self._open_form
+        if name not in self.forms:
+            self.forms[name] = (bbox, self._commands)
+        self.form_uses[name] = self.form_uses.get(name, 0) + 1
+        self._open_form = None
+        self._commands = self.pages[-1]
+        self._commands.append(("doForm", (name,), {}))
+
+    def __getattr__(self, name: str):
+        def record(*args, **kwargs) -> None:
+            self._commands.append((name, args, kwargs))
+        return record
+
+
+# Setters whose effect lasts until the next call, page or restoreState.
+_STATE_SETTERS = frozenset(("setFont", "setFillColor", "setStrokeColor", "setLineWidth"))
+
+
+class _CanvasState:
+    """Tracks the last value of each state setter so repeats can be dropped."""
+
+    def __init__(self) -> None:
+        self.current: dict[str, tuple] = {}
+        self.stack: list[dict[str, tuple]] = []
+
+    def keep(self, name: str, args: tuple, kwargs: dict) -> bool:
+        if name in _STATE_SETTERS:
+            value = (args, kwargs)
+            if self.current.get(name) == value:
+                return False
+            self.current[name] = value
+        elif name == "saveState":
+            self.stack.append(dict(self.current))
+        elif name == "restoreState":
+            self.current = self.stack.pop()
+        return True
+
+
+def _replay(commands: list[tuple], pdf, palette: dict, state: _CanvasState | None = None) -> None:
+    for name, args, kwargs in commands:
+        if args and isinstance(args[0], ColorToken):
+            args = (palette[args[0].name], *args[1:])
+        if state is None or state.keep(name, args, kwargs):
+            getattr(pdf, name)(*args, **kwargs)
+
+
+def paint_display_list(
+    pages: list[list[tuple]],
+    forms: dict,
+    pdf,
+    palette: dict,
+    form_uses: dict | None = None,
+    compact: bool = False,
+) -> None:
+    """Replay recorded pages onto ``pdf``, resolving ColorTokens through ``palette``.
+
+    Forms used at least ``FORM_MIN_USES`` times are emitted as Form XObjects
+    just before their first use; rarer ones are drawn inline, since each
+    XObject carries its own dictionary and stream. ``compact`` drops
+    ``setFont``/colour/line-width calls that repeat the current state.
+    """
+    form_uses = form_uses or {}
+    defined: set[str] = set()
+    for index, commands in enumerate(pages):
+        if index:
+            pdf.showPage()
+        # Every page, and every form body, starts from the default state.
+        state = _CanvasState() if compact else None
+        for command in commands:
+            if command[0] != "doForm":
+                _replay((command,), pdf, palette, state)
+                continue
+            name = command[1][0]
+            bbox, form_commands = forms[name]
+            if form_uses.get(name, FORM_MIN_USES) < FORM_MIN_USES:
+                _replay([("saveState", (), {}), *form_commands, ("restoreState", (), {})], pdf, palette, state)
+                continue
+            if name not in defined:
+                pdf.beginForm(name, *bbox)
+                _replay(form_commands, pdf, palette, _CanvasState() if compact else None)
+                pdf.endForm()
+                defined.add(name)
+            pdf.doForm(name)
+
+
+# Renders that need the same rl_config.useA85 run concurrently; a render
+# needing the other value waits until those finish. The installed value is
+# restored whenever no render is active.
+_PDF_PROFILE = Condition()
+_PDF_PROFILE_STATE = {"active": 0, "use_a85": None}
+
+
+@contextmanager
+def pdf_output_profile(compact: bool = False):
+    """Apply the PDF output profile, with plain binary streams in ``compact`` mode.
+
+    ReportLab reads ``rl_config.useA85`` (ASCII85-armour compressed streams)
+    from process-global config while a canvas is saved, so only renders that
+    agree on it overlap. Normal renders never wait for each other.
+    """
+    with _PDF_PROFILE:
+        if not _PDF_PROFILE_STATE["active"]:
+            _PDF_PROFILE_STATE["use_a85"] = rl_config.useA85
+        use_a85 = 0 if compact else _PDF_PROFILE_STATE["use_a85"]
+        while _PDF_PROFILE_STATE["active"] and rl_config.useA85 != use_a85:
+            _PDF_PROFILE.wait()
+        rl_config.useA85 = use_a85
+        _PDF_PROFILE_STATE["active"] += 1
+    try:
+        yield
+    finally:
+        with _PDF_PROFILE:
+            _PDF_PROFILE_STATE["active"] -= 1
+            if not _PDF_PROFILE_STATE["active"]:
+                rl_config.useA85 = _PDF_PROFILE_STATE["use_a85"]
+                _PDF_PROFILE.notify_all()
+
+
+# Glyph advance widths in 1/1000 em, one table per font indexed by latin-1
+# code point (pdf_safe_text guarantees latin-1). Standard Type 1 fonts have
+# integer advances and no kerning, so a string's width is the sum of its
+# glyph units scaled exactly as pdfmetrics.stringWidth scales it; one table
+# per font therefore serves every font size.
+_GLYPH_TABLES: dict[str, array] = {}
+_GLYPH_TABLES_NP: dict = {}
+
+# Below this many characters the per-call overhead of NumPy outweighs the
+# vectorised lookup, so short paragraphs use the array table directly.
+NUMPY_BATCH_MIN_CHARS = 512
+
+
+def glyph_width_table(font_name: str) -> array:
+    table = _GLYPH_TABLES.get(font_name)
+    if table is None:
+        table = array("i", (round(pdfmetrics.stringWidth(chr(code), font_name, 1000)) for code in range(256)))
+        _GLYPH_TABLES[font_name] = table
+    return table
+
+
+def measure_text_units(words: list[str], font_name: str) -> list[int]:
+    """Widths of ``words`` in 1/1000 em, measured in one batched pass."""
+    if not words:
+        return []
+    table = glyph_width_table(font_name)
+    encoded = [word.encode("latin-1", "replace") for word in words]
+    total_chars = sum(map(len, encoded))
+    if not NUMPY_AVAILABLE or total_chars < NUMPY_BATCH_MIN_CHARS:
+        lookup = table.__getitem__
+        return [sum(map(lookup, data)) for data in encoded]
+
+    np_table = _GLYPH_TABLES_NP.get(font_name)
+    if np_table is None:
+        np_table = _GLYPH_TABLES_NP[font_name] = np.frombuffer(memoryview(table), dtype=np.int32).astype(np.int64)
+    codes = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    cumulative = np.concatenate(([0], np.cumsum(np_table[codes])))
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    ends = np.cumsum(lengths)
+    return (cumulative[ends] - cumulative[ends - lengths]).tolist()
+
+
+def measure_text_widths(words: list[str], font_name: str, font_size: float) -> list[float]:
+    """Batched equivalent of ``pdfmetrics.stringWidth`` for a list of strings."""
+    return [units * 0.001 * font_size for units in measure_text_units(words, font_name)]
+
+
+def _split_long_word(word: str, font_name: str, fits) -> list[tuple[str, int]]:
+    """Cut ``word`` into the longest prefixes that fit, found by binary search on prefix widths."""
+    prefix = [0, *accumulate(map(glyph_width_table(font_name).__getitem__, word.encode("latin-1", "replace")))]
+
+    chunks: list[tuple[str, int]] = []
+    start = 0
+    while start < len(word):
+        low, high = start + 1, len(word)
+        end = start + 1
+        while low <= high:
+            middle = (low + high) // 2
+            if fits(prefix[middle] - prefix[start]):
+                end = middle
+                low = middle + 1
+            else:
+                high = middle - 1
+        chunks.append((word[start:end], prefix[end] - prefix[start]))
+        start = end
+    return chunks
+
+
+# Wrapped paragraphs are memoised across renders: the same bullets are
+# wrapped again for every template and every rebuild after a small edit.
+WRAP_CACHE_SIZE = 4096
 
 
 def wrap_pdf_text(text: str, font_name: str, font_size: int, max_width: float) -> list[str]:
     if not REPORTLAB_AVAILABLE:
         return [pdf_safe_text(text)]
+    return list(_wrap_pdf_text_cached(str(text), font_name, font_size, max_width))
+
+
+def wrap_cache_info() -> dict:
+    info = _wrap_pdf_text_cached.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
+
+
+def clear_wrap_cache() -> None:
+    _wrap_pdf_text_cached.cache_clear()
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def _wrap_pdf_text_cached(text: str, font_name: str, font_size: int, max_width: float) -> tuple[str, ...]:
     safe_text = pdf_safe_text(text)
     words = safe_text.split()
     if not words:
-        return []
+        return ()
 
-    def split_long_word(word: str) -> list[str]:
-        if pdfmetrics.stringWidth(word, font_name, font_size) <= max_width:
-            return [word]
-
-        chunks: list[str] = []
-        current = ""
-        for char in word:
-            candidate = f"{current}{char}"
-            if current and pdfmetrics.stringWidth(candidate, font_name, font_size) > max_width:
-                chunks.append(current)
-                current = char
-            else:
-                current = candidate
-        if current:
-            chunks.append(current)
-        return chunks or [word]
+    def fits(total_units: int) -> bool:
+        # Same expression and evaluation order as pdfmetrics.stringWidth, so
+        # line breaks match measuring every candidate line from scratch.
+        return total_units * 0.001 * font_size <= max_width
 
+    space_units = glyph_width_table(font_name)[ord(" ")]
     lines: list[str] = []
-    expanded_words: list[str] = []
-    for word in words:
-        expanded_words.extend(split_long_word(word))
-
-    current = expanded_words[0]
-    for word in expanded_words[1:]:
-        candidate = f"{current} {word}"
-        if pdfmetrics.stringWidth(candidate, font_name, font_size) <= max_width:
-            current = candidate
-        else:
-            lines.append(current)
-            current = word
-    lines.append(current)
-    return lines
+    current: list[str] = []
+    current_units = 0
+    for word, word_units in zip(words, measure_text_units(words, font_name)):
+        pieces = [(word, word_units)] if fits(word_units) else _split_long_word(word, font_name, fits)
+        for piece, piece_units in pieces:
+            if not current:
+                current, current_units = [piece], piece_units
+                continue
+            candidate_units = current_units + space_units + piece_units
+            if fits(candidate_units):
+                current.append(piece)
+                current_units = candidate_units
+            else:
+                lines.append(" ".join(current))
+                current, current_units = [piece], piece_units
+    lines.append(" ".join(current))
+    return tuple(lines)
 
 
 def draw_pdf_wrapped_text(
@@ -183,6 +468,21 @@ def draw_pdf_wrapped_text(
     return y
 
 
+def _draw_section_icon(pdf, icon_fn, x: float, cy: float, size: float, color) -> None:
+    if not hasattr(pdf, "begin_form"):
+        icon_fn(pdf, x, cy, size, color)
+        return
+    # Recorded once per shape, size and colour at the origin, then placed by
+    # translation wherever the section title appears.
+    half = size / 2
+    pdf.saveState()
+    pdf.translate(x, cy)
+    pdf.begin_form(("icon", icon_fn.__name__, size, getattr(color, "name", repr(color))), (-1, -half - 1, size + 1, half + 1))
+    icon_fn(pdf, 0, 0, size, color)
+    pdf.end_form()
+    pdf.restoreState()
+
+
 def draw_pdf_section_title(
     pdf,
     title: str,
@@ -199,7 +499,7 @@ def draw_pdf_section_title(
     icon_advance = 0
     if icon_fn:
         icon_size = font_size * 0.7
-        icon_fn(pdf, x, y + font_size * 0.2, icon_size, resolved_title_color)
+        _draw_section_icon(pdf, icon_fn, x, y + font_size * 0.2, icon_size, resolved_title_color)
         icon_advance = icon_size + 5
     title_x = x + icon_advance
     title_text = pdf_safe_text(title)
@@ -0,0 +1,76 @@
+"""Text normalisation for stored CVs and cover letters.
+
+Documents are normalised once, when they are saved or imported
+(``normalize_document``), so the HTML, DOCX and landing renderers can use
+stored text as-is. PDF output additionally needs latin-1 text, which
+``PDF_TEXT_TABLE`` provides in a single ``str.translate`` pass.
+"""
+import re
+
+
+# UTF-8 punctuation mis-decoded as cp1252, as pasted from some editors
+# ("â€™" for a right single quote).
+_MOJIBAKE_REPLACEMENTS = {
+    "â€“": "-",
+    "â€”": "-",
+    "â€˜": "'",
+    "â€™": "'",
+    "â€œ": '"',
+    "â€": '"',
+}
+_MOJIBAKE_PATTERN = re.compile(
+    "|".join(re.escape(bad) for bad in sorted(_MOJIBAKE_REPLACEMENTS, key=len, reverse=True))
+)
+
+# Typographic punctuation mapped to ASCII so it survives the latin-1
+# encoding of the standard PDF fonts instead of becoming '?'.
+_PDF_REPLACEMENTS = {
+    "\n": " ",
+    "\u2010": "-",    # hyphen
+    "\u2011": "-",    # non-breaking hyphen
+    "\u2012": "-",    # figure dash
+    "\u2013": "-",    # en-dash
+    "\u2014": "-",    # em-dash
+    "\u2015": "-",    # horizontal bar
+    "\u2212": "-",    # minus sign
+    "\u00ad": "-",    # soft hyphen
+    "\u2018": "'",    # left single quote
+    "\u2019": "'",    # right single quote
+    "\u201c": '"',    # left double quote
+    "\u201d": '"',    # right double quote
+    "\u2026": "...",  # ellipsis
+    "\u2022": "-",    # bullet
+}
+
+
+def _dense_table(replacements: dict[str, str]) -> tuple:
+    # str.translate indexes the table by code point; a tuple is about three
+    # times faster to index than the dict str.maketrans builds. Code points
+    # past its end raise IndexError and are left unchanged.
+    table = list(range(max(map(ord, replacements)) + 1))
+    for char, replacement in replacements.items():
+        table[ord(char)] = replacement
+    return tuple(table)
+
+
+PDF_TEXT_TABLE = _dense_table(_PDF_REPLACEMENTS)
+
+
+def normalize_text(text: str) -> str:
+    """Unify line endings and repair mojibake punctuation."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "â€" in text:
+        text = _MOJIBAKE_PATTERN.sub(lambda match: _MOJIBAKE_REPLACEMENTS[match.group()], text)
+    return text
+
+
+def normalize_document(value):
+    """Return ``value`` (a CV or cover letter) with every string normalised."""
+    if isinstance(value, str):
+        return normalize_text(value)
+    if isinstance(value, dict):
+        return {key: normalize_document(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [normalize_document(item) for item in value]
+    return value
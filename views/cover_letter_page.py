@@ -22,7 +22,8 @@ def cover_letter_download_section(letter_data: dict, suggested_name: str) -> Non
     safe_name = re.sub(r"[^A-Za-z0-9_-]+", "_", suggested_name.strip()) or "cover_letter"
     html_output = build_cover_letter_html(letter_data)
     text_output = build_cover_letter_text(letter_data)
-    docx_output = build_cover_letter_docx(letter_data) if DOCX_AVAILABLE else b""
+    # Deterministic, so Streamlit's media storage keeps identical letters once.
+    docx_output = build_cover_letter_docx(letter_data, deterministic=True) if DOCX_AVAILABLE else b""
 
     col_html, col_txt, col_docx = st.columns(3)
     with col_html:
@@ -218,4 +219,4 @@ def render_cover_letter_formatter() -> None:
     )
 
     st.subheader("Preview")
-    components.html(build_cover_letter_html(current_letter_data), height=760, scrolling=True)
+    components.html(build_cover_letter_html(current_letter_data, compact=True), height=760, scrolling=True)
@@ -14,8 +14,11 @@ from utils.converters import (
     projects_to_text, text_to_projects,
 )
 from utils.widgets import rich_text_area
+from templates.landing_builder import clear_landing_cache
+from templates.pdf_builder import measure_pdf_layout
 from templates.themes import DISPLAY_TEMPLATE_OPTIONS
-from views.public_view import render_cv_streamlit, download_section
+from utils.pdf_helpers import REPORTLAB_AVAILABLE
+from views.public_view import render_cv_streamlit, render_template_gallery, download_section
 
 MAX_LOGIN_ATTEMPTS = 5
 LOCKOUT_SECONDS = 300
@@ -163,6 +166,7 @@ def cv_editor(profile_id: int, selected_version: dict) -> None:
     with c1:
         if st.button("Save Changes", type="primary", use_container_width=True):
             save_version(selected_version["id"], version_name, new_cv)
+            clear_landing_cache()
             st.success("Version updated successfully.")
             st.rerun()
     with c2:
@@ -172,6 +176,7 @@ def cv_editor(profile_id: int, selected_version: dict) -> None:
                 st.error("Enter a name for the new version.")
             else:
                 create_new_version(profile_id, new_version_name, new_cv)
+                clear_landing_cache()
                 st.success("New version created.")
                 st.rerun()
 
@@ -198,6 +203,7 @@ def cv_editor(profile_id: int, selected_version: dict) -> None:
                     )
                     if st.button("Import as New Version", use_container_width=True):
                         create_new_version(profile_id, import_name, imported)
+                        clear_landing_cache()
                         st.success("Imported as new version.")
                         st.rerun()
             except (json.JSONDecodeError, UnicodeDecodeError):
@@ -213,10 +219,24 @@ def cv_editor(profile_id: int, selected_version: dict) -> None:
                     st.error("Cannot delete the last remaining version.")
                 else:
                     delete_version(selected_version["id"])
+                    clear_landing_cache()
                     st.success("Version deleted.")
                     st.rerun()
 
 
+def render_page_counts(cv: dict, selected_template: str) -> None:
+    """PDF page count for every template, from the layout pass alone."""
+    if not REPORTLAB_AVAILABLE:
+        return
+    layouts = {label: measure_pdf_layout(cv, template) for label, template in DISPLAY_TEMPLATE_OPTIONS.items()}
+    st.caption("PDF pages: " + " | ".join(f"{label}: {layout['page_count']}" for label, layout in layouts.items()))
+    selected_layout = next(
+        layout for label, layout in layouts.items() if DISPLAY_TEMPLATE_OPTIONS[label] == selected_template
+    )
+    if selected_layout["overflow_sections"]:
+        st.caption(f"Sections split across pages: {', '.join(selected_layout['overflow_sections'])}")
+
+
 def render_editor_page() -> None:
     """Full editor page: profile management, version selection, preview, download, editor."""
     profiles = fetch_profiles()
@@ -243,6 +263,7 @@ def render_editor_page() -> None:
         with col_b:
             if st.button("Set As Default", use_container_width=True):
                 set_default_profile(selected_profile["id"])
+                clear_landing_cache()
                 st.success("Default profile updated.")
                 st.rerun()
 
@@ -259,6 +280,7 @@ def render_editor_page() -> None:
             if st.checkbox(f"I want to delete profile '{selected_profile['name']}'", key="confirm_delete_profile"):
                 if st.button("Delete Profile", use_container_width=True):
                     delete_profile(selected_profile["id"])
+                    clear_landing_cache()
                     st.success("Profile deleted.")
                     st.rerun()
 
@@ -272,11 +294,18 @@ def render_editor_page() -> None:
     selected_version_meta = version_options[selected_version_label]
     selected_version = fetch_version(selected_version_meta["id"])
 
-    preview_template_label = st.selectbox("Preview Template", list(DISPLAY_TEMPLATE_OPTIONS.keys()), index=0)
+    preview_template_label = st.selectbox(
+        "Preview Template", list(DISPLAY_TEMPLATE_OPTIONS.keys()), key="editor_preview_template"
+    )
     preview_template = DISPLAY_TEMPLATE_OPTIONS[preview_template_label]
+    if st.checkbox("Template gallery", key="editor_template_gallery"):
+        render_template_gallery(selected_version["cv"], "editor_preview_template")
     st.subheader("Preview")
+    render_page_counts(selected_version["cv"], preview_template)
     render_cv_streamlit(selected_version["cv"], preview_template)
     st.divider()
-    download_section(selected_version["cv"], selected_profile["name"].replace(" ", "_"), preview_template)
+    download_section(
+        selected_version["cv"], selected_profile["name"].replace(" ", "_"), preview_template, key_prefix="editor_download"
+    )
     st.divider()
     cv_editor(selected_profile["id"], selected_version)